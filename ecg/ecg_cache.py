@@ -0,0 +1,146 @@
+# ecg/ecg_cache.py
+
+from __future__ import annotations
+import json
+import struct
+from pathlib import Path
+from typing import Optional, Union
+import numpy as np
+
+from filesystem.file_io import FileIO
+from ecg.ecg_record import EcgRecord
+
+PathLike = Union[str, Path]
+
+
+class EcgCache:
+    """
+    Binary sidecar for a parsed ECG CSV, memory-mapped on later opens.
+
+    File layout:
+        8 bytes   magic b"ECGCACHE"
+        4 bytes   little-endian uint32 header length
+        header    UTF-8 JSON: version, leads, sample_rate, shape, dtype,
+                  data_offset, and the source CSV's (size, mtime_ns)
+        padding   up to data_offset (64-byte aligned)
+        data      (samples, leads) little-endian float32, C order
+
+    read() only touches the header and maps the data, so opening a record
+    costs the same regardless of its length. A sidecar whose stored
+    source signature no longer matches FileIO.signature(source) is stale
+    and ignored.
+    """
+
+    magic: bytes = b"ECGCACHE"
+    version: int = 1
+    extension: str = ".ecgcache"
+    alignment: int = 64
+
+    # Upper bound on the JSON header we are willing to read
+    max_header_bytes: int = 1 << 20
+
+    @classmethod
+    def sidecar_path(cls, source_path: PathLike) -> Path:
+        return Path(source_path).resolve().with_suffix(cls.extension)
+
+    # ------------------------------
+    # Read
+    # ------------------------------
+    @classmethod
+    def read(
+        cls,
+        source_path: PathLike,
+        cache_path: Optional[PathLike] = None,
+    ) -> Optional[EcgRecord]:
+        """
+        Memory-mapped EcgRecord from the sidecar, or None if it is missing,
+        stale or malformed.
+        """
+        cache_path = Path(cache_path) if cache_path is not None else cls.sidecar_path(source_path)
+        source_signature = FileIO.signature(source_path)
+        cache_signature = FileIO.signature(cache_path)
+        if source_signature is None or cache_signature is None:
+            return None
+
+        try:
+            prefix = FileIO.load_prefix(cache_path, len(cls.magic) + 4)
+            if len(prefix) < len(cls.magic) + 4 or not prefix.startswith(cls.magic):
+                return None
+            (header_length,) = struct.unpack("<I", prefix[len(cls.magic):])
+            if header_length > cls.max_header_bytes:
+                return None
+            raw = FileIO.load_prefix(cache_path, len(prefix) + header_length)[len(prefix):]
+            header = json.loads(raw.decode("utf-8"))
+        except (OSError, ValueError, struct.error):
+            return None
+
+        try:
+            if header.get("version") != cls.version:
+                return None
+            if list(header.get("source", ())) != list(source_signature):
+                return None
+            samples, leads = (int(v) for v in header["shape"])
+            offset = int(header["data_offset"])
+            dtype = np.dtype(header["dtype"])
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None
+        if cache_signature[0] != offset + samples * leads * dtype.itemsize:
+            return None
+
+        if samples == 0:
+            values = np.empty((0, leads), dtype=dtype)
+        else:
+            values = np.memmap(cache_path, dtype=dtype, mode="r", offset=offset, shape=(samples, leads))
+        return EcgRecord(
+            values=values,
+            leads=list(header["leads"]),
+            sample_rate=header.get("sample_rate"),
+        )
+
+    # ------------------------------
+    # Write
+    # ------------------------------
+    @classmethod
+    def write(
+        cls,
+        record: EcgRecord,
+        source_path: PathLike,
+        cache_path: Optional[PathLike] = None,
+    ) -> Optional[Path]:
+        """
+        Write the sidecar for `record`, parsed from `source_path`.
+        Returns the path written, or None if the source is gone.
+        """
+        cache_path = Path(cache_path) if cache_path is not None else cls.sidecar_path(source_path)
+        source_signature = FileIO.signature(source_path)
+        if source_signature is None:
+            return None
+
+        values = np.ascontiguousarray(record.values, dtype="<f4")
+        header = {
+            "version": cls.version,
+            "leads": list(record.leads),
+            "sample_rate": record.sample_rate,
+            "shape": [int(values.shape[0]), int(values.shape[1])],
+            "dtype": values.dtype.str,
+            "source": list(source_signature),
+            "data_offset": 0,
+        }
+
+        # data_offset depends on the header length, which depends on
+        # data_offset's digits; iterate until it settles.
+        while True:
+            raw = json.dumps(header).encode("utf-8")
+            start = len(cls.magic) + 4 + len(raw)
+            offset = -(-start // cls.alignment) * cls.alignment
+            if offset == header["data_offset"]:
+                break
+            header["data_offset"] = offset
+        padding = b"\0" * (offset - start)
+
+        data = cls.magic + struct.pack("<I", len(raw)) + raw + padding + values.tobytes()
+
+        # Write beside it, then swap in: a record still mapping the old
+        # sidecar keeps its (old) inode instead of seeing a truncated file.
+        temporary = FileIO.save(data, cache_path.with_name(cache_path.name + ".tmp"))
+        return temporary.replace(cache_path)
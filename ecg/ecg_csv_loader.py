@@ -0,0 +1,202 @@
+# ecg/ecg_csv_loader.py
+
+from __future__ import annotations
+import warnings
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
+import numpy as np
+
+from filesystem.file_io import FileIO
+from ecg.ecg_record import EcgRecord
+from ecg.ecg_cache import EcgCache
+
+PathLike = Union[str, Path]
+
+
+class EcgCsvLoader:
+    """
+    12-lead ECG CSV (header row of lead names, one sample per row, blank
+    cells for missing leads) -> EcgRecord.
+
+    The whole body is parsed in one C pass: blank cells are rewritten to
+    "nan" with a few bytes.replace calls, then np.fromstring reads every
+    value at once and the result is reshaped to (samples, leads). Files
+    with ragged rows fall back to a per-line parser.
+
+    stream() reads the file in fixed-size byte blocks and yields fixed-size
+    row chunks, so memory stays bounded by one block plus one chunk however
+    long the recording is.
+    """
+
+    default_chunk_rows: int = 4096
+    default_block_bytes: int = 1 << 20
+
+    # ------------------------------
+    # Whole file
+    # ------------------------------
+    @classmethod
+    def load(cls, file_path: PathLike, sample_rate: Optional[float] = None) -> EcgRecord:
+        return cls.parse(FileIO.load(file_path), sample_rate=sample_rate)
+
+    @classmethod
+    def load_local(
+        cls,
+        subdirectory: Optional[str],
+        name: str,
+        sample_rate: Optional[float] = None,
+    ) -> EcgRecord:
+        return cls.load(FileIO.local_file(subdirectory, name, "csv"), sample_rate=sample_rate)
+
+    @classmethod
+    def load_cached(
+        cls,
+        file_path: PathLike,
+        sample_rate: Optional[float] = None,
+        cache_path: Optional[PathLike] = None,
+    ) -> EcgRecord:
+        """
+        load(), through an EcgCache sidecar: maps the sidecar if it is
+        current, otherwise parses the CSV and writes one for next time.
+        A sample_rate given here overrides the cached one.
+        """
+        record = EcgCache.read(file_path, cache_path)
+        if record is None:
+            record = cls.load(file_path, sample_rate=sample_rate)
+            try:
+                EcgCache.write(record, file_path, cache_path)
+            except OSError as e:
+                print(f"⚠️ EcgCsvLoader.load_cached: could not write cache for {file_path} | {e}")
+        elif sample_rate is not None:
+            record.sample_rate = sample_rate
+        return record
+
+    @classmethod
+    def load_local_cached(
+        cls,
+        subdirectory: Optional[str],
+        name: str,
+        sample_rate: Optional[float] = None,
+    ) -> EcgRecord:
+        return cls.load_cached(FileIO.local_file(subdirectory, name, "csv"), sample_rate=sample_rate)
+
+    @classmethod
+    def parse(cls, data: bytes, sample_rate: Optional[float] = None) -> EcgRecord:
+        leads, body = cls._split_header(data)
+        values = cls._parse_rows(body, len(leads))
+        return EcgRecord(values=values, leads=leads, sample_rate=sample_rate)
+
+    # ------------------------------
+    # Streaming
+    # ------------------------------
+    @classmethod
+    def stream(
+        cls,
+        file_path: PathLike,
+        chunk_rows: Optional[int] = None,
+        block_bytes: Optional[int] = None,
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Yield (start_row, values) with values (rows, leads) float32,
+        at most chunk_rows rows each, in file order. The file is read
+        block_bytes at a time; a line split across blocks is carried over.
+        """
+        chunk_rows = max(1, int(chunk_rows or cls.default_chunk_rows))
+        block_bytes = max(1, int(block_bytes or cls.default_block_bytes))
+        leads: Optional[List[str]] = None
+        pending = b""
+        start_row = 0
+
+        for block in FileIO.load_blocks(file_path, block_bytes):
+            text = pending + block
+            # A trailing "\r" may be half of a "\r\n" split across blocks
+            held = b""
+            if text.endswith(b"\r"):
+                text, held = text[:-1], b"\r"
+            text = cls._normalize_newlines(text)
+
+            if leads is None:
+                if b"\n" not in text:
+                    pending = text + held
+                    continue
+                leads, text = cls._split_header(text)
+
+            # Every complete chunk_rows lines in hand, located in one pass
+            newlines = np.flatnonzero(np.frombuffer(text, dtype=np.uint8) == ord("\n"))
+            taken = 0
+            for k in range(chunk_rows - 1, len(newlines), chunk_rows):
+                end = int(newlines[k])
+                values = cls._parse_rows(text[taken:end], len(leads))
+                taken = end + 1
+                if values.shape[0]:
+                    yield (start_row, values)
+                    start_row += values.shape[0]
+            pending = text[taken:] + held
+
+        # Fewer than chunk_rows lines left (or a header-only file)
+        pending = cls._normalize_newlines(pending)
+        if leads is None:
+            leads, pending = cls._split_header(pending)
+        values = cls._parse_rows(pending, len(leads))
+        if values.shape[0]:
+            yield (start_row, values)
+
+    # ------------------------------
+    # Internals
+    # ------------------------------
+    @classmethod
+    def _normalize_newlines(cls, data: bytes) -> bytes:
+        if b"\r" in data:
+            data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        return data
+
+    @classmethod
+    def _split_header(cls, data: bytes) -> Tuple[List[str], bytes]:
+        data = cls._normalize_newlines(data)
+        header, _, body = data.partition(b"\n")
+        leads = [name.strip() for name in header.decode("utf-8-sig").split(",")]
+        if not leads or not any(leads):
+            raise ValueError("ECG CSV has no header row")
+        return (leads, body)
+
+    @classmethod
+    def _parse_rows(cls, body: bytes, columns: int) -> np.ndarray:
+        body = body.strip(b"\n")
+        if not body:
+            return np.empty((0, columns), dtype=np.float32)
+
+        # Blank cells -> "nan". ",,," needs two passes of ",," since
+        # replacements don't overlap.
+        text = b"\n" + body + b"\n"
+        text = text.replace(b",,", b",nan,").replace(b",,", b",nan,")
+        text = text.replace(b"\n,", b"\nnan,").replace(b",\n", b",nan\n")
+        rows = text.count(b"\n") - 1
+        try:
+            # Unparsable input stops early (a warning now, an error in
+            # later NumPy); either way the count check below catches it.
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", DeprecationWarning)
+                flat = np.fromstring(text[1:-1].replace(b"\n", b","), dtype=np.float32, sep=",")
+        except ValueError:
+            flat = None
+
+        if flat is None or flat.size != rows * columns:
+            return cls._parse_rows_slow(body, columns)
+        return flat.reshape(rows, columns)
+
+    @classmethod
+    def _parse_rows_slow(cls, body: bytes, columns: int) -> np.ndarray:
+        """
+        Per-line fallback for ragged rows: short rows are NaN-padded,
+        extra cells dropped, unparsable cells read as NaN.
+        """
+        lines = body.split(b"\n")
+        values = np.full((len(lines), columns), np.nan, dtype=np.float32)
+        for row, line in enumerate(lines):
+            for column, cell in enumerate(line.split(b",")[:columns]):
+                cell = cell.strip()
+                if cell:
+                    try:
+                        values[row, column] = float(cell)
+                    except ValueError:
+                        pass
+        return values
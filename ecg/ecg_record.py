@@ -0,0 +1,66 @@
+# ecg/ecg_record.py
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+import numpy as np
+
+# Standard 12-lead order, as in data/cardio_csv headers
+ECG_LEAD_NAMES: Tuple[str, ...] = (
+    "I", "II", "III", "aVR", "aVL", "aVF",
+    "V1", "V2", "V3", "V4", "V5", "V6",
+)
+
+
+@dataclass
+class EcgRecord:
+    """
+    One ECG recording in columnar form.
+
+    values:  (samples, leads) float32, NaN where a lead has no sample
+    leads:   lead names, one per column of values
+    sample_rate: samples per second, if known
+    """
+    values: np.ndarray
+    leads: List[str] = field(default_factory=lambda: list(ECG_LEAD_NAMES))
+    sample_rate: Optional[float] = None
+
+    @property
+    def sample_count(self) -> int:
+        return int(self.values.shape[0])
+
+    @property
+    def lead_count(self) -> int:
+        return int(self.values.shape[1])
+
+    @property
+    def mask(self) -> np.ndarray:
+        """
+        (samples, leads) bool, True where a sample is present.
+        """
+        return ~np.isnan(self.values)
+
+    @property
+    def lead_valid(self) -> np.ndarray:
+        """
+        (leads,) bool, True for leads with at least one sample.
+        """
+        return self.mask.any(axis=0)
+
+    @property
+    def duration(self) -> Optional[float]:
+        if not self.sample_rate:
+            return None
+        return self.sample_count / float(self.sample_rate)
+
+    def lead_index(self, name: str) -> int:
+        try:
+            return self.leads.index(name)
+        except ValueError:
+            raise KeyError(f"EcgRecord has no lead {name!r} (leads={self.leads})") from None
+
+    def lead(self, name: str) -> np.ndarray:
+        """
+        One lead's samples (a view into values).
+        """
+        return self.values[:, self.lead_index(name)]
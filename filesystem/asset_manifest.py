@@ -0,0 +1,144 @@
+# asset_manifest.py
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from filesystem.file_io import FileIO
+from filesystem.file_utils import FileUtils
+
+
+class AssetImageHandle:
+    """
+    Lazy Pillow image. Nothing is read until get() (or a manifest
+    prefetch) decodes it; after that the same decoded image is returned.
+    Safe to call from any thread; concurrent callers share one decode.
+    """
+
+    def __init__(self, path: Path, manifest: "AssetManifest") -> None:
+        self.path = path
+        self._manifest = manifest
+        self._lock = threading.Lock()
+        self._image: Any = None
+        self._future: Optional[Future] = None
+        self._size: Optional[Tuple[int, int]] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._image is not None
+
+    def get(self) -> Any:
+        """
+        Decoded Pillow image (decodes on first access).
+        """
+        image = self._image
+        if image is not None:
+            return image
+        with self._lock:
+            future = self._future
+        if future is not None and not future.cancelled():
+            # A prefetch is already decoding it; share that result
+            return future.result()
+        return self._decode()
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """
+        (width, height) from the file header, without decoding pixels.
+        """
+        if self._image is not None:
+            return self._image.size
+        if self._size is None:
+            from PIL import Image  # lazy
+            with Image.open(FileUtils.resolve_image_path(self.path)) as im:
+                self._size = im.size
+        return self._size
+
+    def prefetch(self) -> None:
+        """
+        Decode on the manifest's loader pool, if not already loaded or queued.
+        """
+        with self._lock:
+            if self._image is not None or self._future is not None:
+                return
+            self._future = self._manifest._submit(self._decode)
+
+    def _decode(self) -> Any:
+        with self._lock:
+            if self._image is not None:
+                return self._image
+            image = FileUtils.load_pillow_image(self.path)
+            self._image = image
+            self._size = image.size
+            return image
+
+    def unload(self) -> None:
+        with self._lock:
+            self._image = None
+            self._future = None
+
+
+class AssetManifest:
+    """
+    Registry of lazily loaded assets, keyed by resolved path: registering
+    the same file twice (under any spelling FileIO.local_file resolves
+    to the same place) returns the same handle, so it is decoded once.
+
+    prefetch_all() queues every registered image on a small loader pool,
+    e.g. right before creating the GL context.
+    """
+
+    def __init__(self, loader_workers: int = 2) -> None:
+        self.loader_workers = max(1, int(loader_workers))
+        self._images: Dict[Path, AssetImageHandle] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+    def register_image(self, subdirectory: Optional[str], name: str, extension: Optional[str] = None) -> AssetImageHandle:
+        return self.register_image_path(FileIO.local_file(subdirectory, name, extension))
+
+    def register_image_path(self, file_path) -> AssetImageHandle:
+        path = Path(file_path).resolve()
+        handle = self._images.get(path)
+        if handle is None:
+            handle = AssetImageHandle(path, self)
+            self._images[path] = handle
+        return handle
+
+    @property
+    def image_count(self) -> int:
+        return len(self._images)
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+    def prefetch_all(self) -> None:
+        for handle in self._images.values():
+            handle.prefetch()
+
+    def unload_all(self) -> None:
+        for handle in self._images.values():
+            handle.unload()
+
+    def dispose(self) -> None:
+        with self._pool_lock:
+            pool = self._pool
+            self._pool = None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        self.unload_all()
+
+    def _submit(self, fn) -> Future:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.loader_workers,
+                    thread_name_prefix="AssetManifest",
+                )
+            return self._pool.submit(fn)
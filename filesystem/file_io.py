@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Union, List, Tuple
+from typing import Iterator, Union, List, Tuple
 
 PathLike = Union[str, Path]
 FileSpec = Tuple[List[str], str]
@@ -177,6 +177,53 @@ class FileIO:
         path = cls.local_file(subdirectory=subdirectory, name=name, extension=extension)
         return cls.load(path)
 
+    @classmethod
+    def load_prefix(cls, file_path: PathLike, count: int) -> bytes:
+        """
+        Load at most the first `count` bytes of a file (e.g. a header).
+        """
+        path = cls._to_path(file_path)
+
+        if not path.is_file():
+            raise FileNotFoundError(f"File not found: {path}")
+
+        with path.open("rb") as f:
+            return f.read(max(0, int(count)))
+
+    @classmethod
+    def load_blocks(cls, file_path: PathLike, block_size: int) -> Iterator[bytes]:
+        """
+        Yield a file's bytes in order, at most `block_size` at a time, so a
+        large file never has to be held in memory whole.
+        """
+        path = cls._to_path(file_path)
+
+        if not path.is_file():
+            raise FileNotFoundError(f"File not found: {path}")
+
+        block_size = max(1, int(block_size))
+        with path.open("rb") as f:
+            while True:
+                block = f.read(block_size)
+                if not block:
+                    return
+                yield block
+
+    @classmethod
+    def signature(cls, file_path: PathLike) -> Tuple[int, int] | None:
+        """
+        (size in bytes, modification time in ns) of a file, or None if it
+        doesn't exist. Derived caches store this to detect a stale source.
+        """
+        path = cls._to_path(file_path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        if not path.is_file():
+            return None
+        return (int(stat.st_size), int(stat.st_mtime_ns))
+
     @classmethod
     def save(cls, data: bytes, file_path: PathLike) -> Path:
         """
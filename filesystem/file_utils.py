@@ -103,25 +103,31 @@ class FileUtils:
     # ================================================================
 
     @classmethod
-    def load_pillow_image(cls, file_path: PathLike) -> Any:
-        from PIL import Image  # lazy
-        
+    def resolve_image_path(cls, file_path: PathLike) -> Path:
+        """
+        The file load_pillow_image would open: the path itself if it exists,
+        otherwise the same stem with the first common image extension found.
+        """
         path = Path(file_path).resolve()
         if path.is_file():
-            im = Image.open(path)
-            im.load()
-            return im
+            return path
 
         base = path.with_suffix("")
         for ext in [".png", ".PNG", ".jpg", ".JPG", ".jpeg", ".JPEG", ".tif", ".tiff"]:
             attempt = base.with_suffix(ext)
             if attempt.is_file():
-                im = Image.open(attempt)
-                im.load()
-                return im
+                return attempt
 
         raise FileNotFoundError(f"Pillow image not found: {path}")
 
+    @classmethod
+    def load_pillow_image(cls, file_path: PathLike) -> Any:
+        from PIL import Image  # lazy
+
+        im = Image.open(cls.resolve_image_path(file_path))
+        im.load()
+        return im
+
     @classmethod
     def save_pillow_image_png(cls, image: Any, file_path: PathLike) -> Path:
         bio = BytesIO()
@@ -183,7 +189,8 @@ class FileUtils:
 
     @classmethod
     def save_bitmap_png(cls, bitmap: Any, file_path: PathLike) -> Path:
-        im = bitmap.export_pillow()
+        # Encoded immediately, so the zero-copy view is safe here.
+        im = bitmap.export_pillow(share=True)
         return cls.save_pillow_image_png(im, file_path)
 
     @classmethod
@@ -191,7 +198,7 @@ class FileUtils:
         """
         quality: int in [1..95] (Pillow JPEG quality range we enforce)
         """
-        im = bitmap.export_pillow()
+        im = bitmap.export_pillow(share=True)
         return cls.save_pillow_image_jpg(im, file_path, quality=quality)
 
     @classmethod
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 from typing import Generic, TypeVar, Optional, Sequence, TYPE_CHECKING
+import numpy as np
 from graphics.graphics_float_bufferable import GraphicsFloatBufferable
 if TYPE_CHECKING:
     from graphics.graphics_library import GraphicsLibrary
@@ -12,14 +13,36 @@ class GraphicsArrayBuffer(Generic[T]):
     """
     Statically allocated graphics buffer.
     The content can be replaced, but it cannot change size.
+
+    usage picks how updates reach the GPU:
+      "static"  - every write re-uploads the whole buffer (GL_STATIC_DRAW).
+      "dynamic" - a preallocated float32 array (self.data) is updated in
+                  place and only the changed float range is sent with
+                  glBufferSubData (GL_DYNAMIC_DRAW).
+      "stream"  - as dynamic, but each upload orphans the storage first
+                  and re-sends all of self.data (GL_STREAM_DRAW), for
+                  data rewritten every frame. upload_range(0, n,
+                  discard_rest=True) sends only the first n floats when
+                  nothing past them will be drawn.
+    Dynamic / stream never reallocate GPU storage or build float lists.
     """
-    
-    def __init__(self) -> None:
+
+    usages = ("static", "dynamic", "stream")
+
+    def __init__(self, usage: str = "static") -> None:
+        if usage not in self.usages:
+            raise ValueError(f"GraphicsArrayBuffer: unknown usage '{usage}'")
+        self.usage = usage
         self.graphics: Optional["GraphicsLibrary"] = None
         self.vertex_buffer: list[float] = []
+        self.data: Optional[np.ndarray] = None  # dynamic / stream only
         self.buffer_index: int = -1
         self.size: int = 0  # in bytes
 
+    @property
+    def is_dynamic(self) -> bool:
+        return self.usage != "static"
+
     def load(self, graphics: "GraphicsLibrary", items: Sequence[T]) -> None:
         """
         Initialize the buffer from a sequence of GraphicsFloatBufferable items.
@@ -27,6 +50,7 @@ class GraphicsArrayBuffer(Generic[T]):
         self.graphics = graphics
         if not items:
             self.vertex_buffer = []
+            self.data = None
             self.buffer_index = -1
             self.size = 0
             return
@@ -35,6 +59,13 @@ class GraphicsArrayBuffer(Generic[T]):
         float_count = graphics.buffer_float_size(items)
         self.size = float_count * 4  # 4 bytes per float
 
+        if self.is_dynamic:
+            self.data = np.zeros(float_count, dtype=np.float32)
+            _FloatArrayWriter(self.data).write_items(items)
+            self.buffer_index = graphics.buffer_array_generate()
+            graphics.buffer_array_write(self.buffer_index, self.data, usage=self.usage)
+            return
+
         # Build vertex data as Python list[float]
         self.vertex_buffer = graphics.buffer_float_generate_from_array(items)
 
@@ -42,6 +73,30 @@ class GraphicsArrayBuffer(Generic[T]):
         self.buffer_index = graphics.buffer_array_generate()
         graphics.buffer_array_write(self.buffer_index, self.vertex_buffer)
 
+    def load_numpy(self, graphics: "GraphicsLibrary", data: np.ndarray) -> None:
+        """
+        Initialize the buffer straight from a float32 array (any shape,
+        uploaded in C order), skipping the per-item float list.
+
+        Dynamic / stream buffers keep the array as self.data (the same
+        object when it is already C-contiguous float32), so the caller can
+        write into it and then upload_range().
+        """
+        self.graphics = graphics
+        self.vertex_buffer = []
+        data = np.ascontiguousarray(data, dtype=np.float32)
+        if data.size == 0:
+            self.data = None
+            self.buffer_index = -1
+            self.size = 0
+            return
+
+        self.size = int(data.nbytes)
+        self.buffer_index = graphics.buffer_array_generate()
+        graphics.buffer_array_write(self.buffer_index, data, usage=self.usage)
+        if self.is_dynamic:
+            self.data = data
+
     def write(self, items: Sequence[T]) -> None:
         """
         Overwrite the existing buffer contents with new items.
@@ -51,6 +106,24 @@ class GraphicsArrayBuffer(Generic[T]):
             return
         graphics = self.graphics
 
+        if self.is_dynamic and self.data is not None:
+            float_count = graphics.buffer_float_size(items)
+            if float_count == self.data.size:
+                writer = _FloatArrayWriter(self.data.reshape(-1))
+                writer.write_items(items)
+                if writer.first_changed < writer.end_changed:
+                    self.upload_range(writer.first_changed, writer.end_changed - writer.first_changed)
+                return
+            print(
+                f"[GraphicsArrayBuffer] WARNING: write() changed float count "
+                f"from {self.data.size} to {float_count}. Reallocating."
+            )
+            self.data = np.zeros(float_count, dtype=np.float32)
+            _FloatArrayWriter(self.data).write_items(items)
+            self.size = int(self.data.nbytes)
+            graphics.buffer_array_write(self.buffer_index, self.data, usage=self.usage)
+            return
+
         # Rebuild vertex data
         new_data: list[float] = []
         graphics.buffer_float_write_from_list(items, new_data)
@@ -67,6 +140,45 @@ class GraphicsArrayBuffer(Generic[T]):
         self.vertex_buffer = new_data
         graphics.buffer_array_write(self.buffer_index, self.vertex_buffer)
 
+    def write_range(self, first: int, values: np.ndarray) -> None:
+        """
+        Dynamic / stream: copy `values` into self.data starting at float
+        `first` and upload that range.
+        """
+        if self.data is None:
+            raise ValueError("GraphicsArrayBuffer.write_range: buffer is not dynamic or not loaded")
+        flat = self.data.reshape(-1)
+        values = np.asarray(values, dtype=np.float32).reshape(-1)
+        if first < 0 or first + values.size > flat.size:
+            raise ValueError(
+                f"GraphicsArrayBuffer.write_range: floats {first}..{first + values.size} "
+                f"outside buffer of {flat.size}"
+            )
+        flat[first:first + values.size] = values
+        self.upload_range(first, values.size)
+
+    def upload_range(self, first: int, count: int, discard_rest: bool = False) -> None:
+        """
+        Send floats [first, first + count) of self.data to the GPU.
+
+        Stream buffers orphan the storage, which leaves it undefined, so
+        they re-send all of self.data. With discard_rest (only valid with
+        first == 0) they send just [0, count): the caller promises nothing
+        past it is drawn before the next upload.
+        """
+        if self.graphics is None or self.buffer_index == -1 or self.data is None or count <= 0:
+            return
+        flat = self.data.reshape(-1)
+        first = int(first)
+        end = min(first + int(count), flat.size)
+        if self.usage == "stream":
+            if discard_rest and first != 0:
+                raise ValueError("GraphicsArrayBuffer.upload_range: discard_rest needs first == 0")
+            self.graphics.buffer_array_allocate(self.buffer_index, self.size, usage=self.usage)
+            if not discard_rest:
+                first, end = 0, flat.size
+        self.graphics.buffer_array_write_range(self.buffer_index, first * 4, flat[first:end])
+
     def dispose(self) -> None:
         """
         Delete the GPU buffer and reset local state.
@@ -79,5 +191,37 @@ class GraphicsArrayBuffer(Generic[T]):
         # Reset state
         self.buffer_index = -1
         self.vertex_buffer.clear()
+        self.data = None
         self.size = 0
-        self.graphics = None
\ No newline at end of file
+        self.graphics = None
+
+
+class _FloatArrayWriter:
+    """
+    append() target for GraphicsFloatBufferable.write_to_buffer that
+    writes into a float32 array in place and records the span of floats
+    whose value actually changed (first_changed .. end_changed).
+    """
+
+    __slots__ = ("view", "cursor", "first_changed", "end_changed")
+
+    def __init__(self, array: np.ndarray) -> None:
+        self.view = memoryview(array).cast("B").cast("f")
+        self.cursor = 0
+        self.first_changed = len(self.view)
+        self.end_changed = 0
+
+    def append(self, value: float) -> None:
+        i = self.cursor
+        view = self.view
+        old = view[i]
+        view[i] = value
+        if view[i] != old:
+            if i < self.first_changed:
+                self.first_changed = i
+            self.end_changed = i + 1
+        self.cursor = i + 1
+
+    def write_items(self, items: Sequence[GraphicsFloatBufferable]) -> None:
+        for item in items:
+            item.write_to_buffer(self)
@@ -1,7 +1,8 @@
 # graphics_library.py
 
 from __future__ import annotations
-from typing import Optional, Sequence, TypeVar
+from typing import Dict, Hashable, Optional, Sequence, TypeVar
+import ctypes
 import numpy as np
 from PIL import Image
 from image.bitmap import Bitmap
@@ -13,6 +14,7 @@ from graphics.graphics_sprite import GraphicsSprite
 from graphics.graphics_color import GraphicsColor
 from graphics.graphics_matrix import GraphicsMatrix
 from graphics.shader_program import ShaderProgram
+from graphics.graphics_state_cache import GraphicsStateCache
 
 T = TypeVar("T", bound=GraphicsFloatBufferable)
 
@@ -36,6 +38,23 @@ class GraphicsLibrary:
         self.texture_set_filter_linear()
         self.texture_set_clamp()
 
+        # Instanced drawing entry points, resolved on first use
+        self._instancing_checked = False
+        self._gl_vertex_attrib_divisor = None
+        self._gl_draw_arrays_instanced = None
+
+        # Redundant state calls are skipped against this shadow copy;
+        # state.counters() reports issued vs skipped per call kind.
+        self.state = GraphicsStateCache()
+        self.state_invalidate()
+
+        # Shared index buffers: GL name -> reference count, plus lookups
+        # by content and the one growable quad-list buffer
+        self._index_buffer_references: Dict[int, int] = {}
+        self._index_buffer_shared: Dict[Hashable, int] = {}
+        self._index_buffer_quads: Optional[int] = None
+        self._index_buffer_quads_count: int = 0
+
     def resize(self,
         screen_width: int,
         screen_height: int,
@@ -51,6 +70,24 @@ class GraphicsLibrary:
         self.frame_buffer_height = frame_buffer_height
         gl.glViewport(0, 0, frame_buffer_width, frame_buffer_height)
 
+    # ----------------------------------------------------------------------
+    # State cache
+    # ----------------------------------------------------------------------
+    def state_invalidate(self) -> None:
+        """
+        Forget all cached GL state (call after GL work done outside this
+        class), then re-establish a known texture unit and attribute set.
+        """
+        self.state.invalidate()
+        self.texture_set_active_unit(0)
+        try:
+            attribute_count = int(gl.glGetIntegerv(gl.GL_MAX_VERTEX_ATTRIBS))
+        except Exception:
+            attribute_count = 16
+        for location in range(attribute_count):
+            gl.glDisableVertexAttribArray(location)
+        self.state.enabled_attributes = set()
+
     def clear(self) -> None:
         gl.glClearColor(0.0, 0.0, 0.0, 1.0)
         gl.glClear(gl.GL_COLOR_BUFFER_BIT)
@@ -98,19 +135,52 @@ class GraphicsLibrary:
 
         print("Deleting Array Buffer @", idx)
         gl.glDeleteBuffers(1, [idx])
+        self.state.forget_buffer(idx)
+
+    # GraphicsArrayBuffer usage name -> GL usage hint
+    buffer_usages = {
+        "static": gl.GL_STATIC_DRAW,
+        "dynamic": gl.GL_DYNAMIC_DRAW,
+        "stream": gl.GL_STREAM_DRAW,
+    }
+
+    def buffer_array_write(self, index: int | None, data: Sequence[float], usage: str = "static") -> None:
+        if index is None or index == -1:
+            return
+        arr = np.ascontiguousarray(data, dtype=np.float32)
+        self.buffer_array_bind(index)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, arr, self.buffer_usages[usage])
 
-    def buffer_array_write(self, index: int | None, data: Sequence[float]) -> None:
+    def buffer_array_allocate(self, index: int | None, size: int, usage: str = "dynamic") -> None:
+        """
+        Give the buffer `size` bytes of undefined storage. Called again with
+        the same size this orphans the old storage: the driver hands out a
+        fresh block instead of waiting for draws still reading the old one.
+        """
         if index is None or index == -1:
             return
-        arr = np.asarray(data, dtype=np.float32)
-        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, index)
-        gl.glBufferData(gl.GL_ARRAY_BUFFER, arr, gl.GL_STATIC_DRAW)
+        self.buffer_array_bind(index)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, int(size), None, self.buffer_usages[usage])
 
+    def buffer_array_write_range(self, index: int | None, offset: int, data: np.ndarray) -> None:
+        """
+        Overwrite bytes [offset, offset + data.nbytes) of existing storage
+        (glBufferSubData; no reallocation).
+        """
+        if index is None or index == -1:
+            return
+        arr = np.ascontiguousarray(data, dtype=np.float32)
+        if arr.size == 0:
+            return
+        self.buffer_array_bind(index)
+        gl.glBufferSubData(gl.GL_ARRAY_BUFFER, int(offset), int(arr.nbytes), arr)
 
     def buffer_array_bind(self, index: int | None) -> None:
         if index is None or index == -1:
             return
-        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, index)
+        index = int(index)
+        if self.state.set_array_buffer(index):
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, index)
 
     def buffer_array_bind_array_buffer(
         self,
@@ -121,28 +191,113 @@ class GraphicsLibrary:
         self.buffer_array_bind(index=array_buffer.buffer_index)
 
     # ----------------------------------------------------------------------
-    # Index buffers (client-side numpy arrays for glDrawElements)
+    # Index buffers (GL_ELEMENT_ARRAY_BUFFER objects for glDrawElements)
     # ----------------------------------------------------------------------
-    def buffer_index_generate_from_list(self, values: Sequence[int]) -> np.ndarray:
-        return np.asarray(values, dtype=np.uint32)
+    def buffer_index_generate(self) -> int:
+        buf_id = gl.glGenBuffers(1)
+        if isinstance(buf_id, (list, tuple)):
+            buf_id = buf_id[0]
+        print("Generating Index Buffer @", int(buf_id))
+        return int(buf_id)
+
+    def buffer_index_generate_from_list(self, values: Sequence[int]) -> int:
+        """
+        Create an index buffer owned by the caller (free with
+        buffer_index_delete). Indices live on the GPU, so draws don't
+        pass them through PyOpenGL again.
+        """
+        index = self.buffer_index_generate()
+        self.buffer_index_write_from_list(values, index)
+        return index
 
     def buffer_index_write_from_list(
         self,
         values: Sequence[int],
-        index_buffer: np.ndarray,
+        index_buffer: int | None,
         count: Optional[int] = None,
     ) -> None:
-        if count is None:
-            count = len(values)
-        count = min(count, len(values), index_buffer.size)
-        index_buffer[:count] = np.asarray(values[:count], dtype=np.uint32)
+        if index_buffer is None or index_buffer == -1:
+            return
+        arr = np.ascontiguousarray(values, dtype=np.uint32).reshape(-1)
+        if count is not None:
+            arr = arr[:max(0, int(count))]
+        self.buffer_index_bind(index_buffer)
+        gl.glBufferData(gl.GL_ELEMENT_ARRAY_BUFFER, arr, gl.GL_STATIC_DRAW)
+
+    def buffer_index_bind(self, index: int | None) -> None:
+        if index is None or index == -1:
+            return
+        index = int(index)
+        if self.state.set_element_array_buffer(index):
+            gl.glBindBuffer(gl.GL_ELEMENT_ARRAY_BUFFER, index)
+
+    def buffer_index_generate_shared(self, values: Sequence[int]) -> int:
+        """
+        Index buffer shared by every caller asking for the same indices
+        (e.g. the [0, 1, 2, 3] strip of each sprite / shape instance).
+        Reference counted: each call needs one buffer_index_delete.
+        """
+        key = tuple(int(v) for v in values)
+        index = self._index_buffer_shared.get(key)
+        if index is None:
+            index = self.buffer_index_generate_from_list(key)
+            self._index_buffer_shared[key] = index
+            self._index_buffer_references[index] = 0
+        self._index_buffer_references[index] += 1
+        return index
+
+    def buffer_index_quads_acquire(self, quad_count: int) -> int:
+        """
+        The shared quad-list index buffer, (0, 1, 2, 2, 1, 3) + 4i per
+        quad, covering at least `quad_count` quads. It only grows, in
+        place, and every prefix is the same, so all holders keep drawing
+        from one GL name. Reference counted like buffer_index_generate_shared.
+        """
+        quad_count = max(1, int(quad_count))
+        index = self._index_buffer_quads
+        if index is None:
+            index = self.buffer_index_generate()
+            self._index_buffer_quads = index
+            self._index_buffer_quads_count = 0
+            self._index_buffer_references[index] = 0
+        if quad_count > self._index_buffer_quads_count:
+            # Two triangles over GraphicsSpriteInstance's strip layout
+            quad = np.array([0, 1, 2, 2, 1, 3], dtype=np.uint32)
+            base = np.arange(quad_count, dtype=np.uint32)[:, None] * 4
+            self.buffer_index_write_from_list((base + quad).ravel(), index)
+            self._index_buffer_quads_count = quad_count
+        self._index_buffer_references[index] += 1
+        return index
 
     def buffer_index_delete(self, index: int | None) -> None:
         """
-        Index buffers are client-side NumPy arrays, not GL buffers.
-        Deletion is a no-op.
+        Delete an index buffer, or drop one reference to a shared one
+        (the GL buffer goes when the last holder lets go).
         """
-        return
+        if index is None:
+            return
+        try:
+            idx = int(index)
+        except Exception:
+            return
+        if idx == -1:
+            return
+
+        references = self._index_buffer_references.get(idx)
+        if references is not None:
+            if references > 1:
+                self._index_buffer_references[idx] = references - 1
+                return
+            del self._index_buffer_references[idx]
+            for key in [k for k, v in self._index_buffer_shared.items() if v == idx]:
+                del self._index_buffer_shared[key]
+            if idx == self._index_buffer_quads:
+                self._index_buffer_quads = None
+                self._index_buffer_quads_count = 0
+
+        print("Deleting Index Buffer @", idx)
+        gl.glDeleteBuffers(1, [idx])
+        self.state.forget_buffer(idx)
     
     # ----------------------------------------------------------------------
     # Float buffers (for GraphicsFloatBufferable -> list[float])
@@ -207,7 +362,13 @@ class GraphicsLibrary:
         """
         if texture_index is None or texture_index == -1:
             return
-        gl.glBindTexture(gl.GL_TEXTURE_2D, int(texture_index))
+        texture_index = int(texture_index)
+        if self.state.set_texture(texture_index):
+            gl.glBindTexture(gl.GL_TEXTURE_2D, texture_index)
+
+    def texture_set_active_unit(self, unit: int) -> None:
+        if self.state.set_active_texture_unit(int(unit)):
+            gl.glActiveTexture(gl.GL_TEXTURE0 + int(unit))
 
     def texture_bind(self, texture: Optional[GraphicsTexture]) -> None:
         """
@@ -236,6 +397,7 @@ class GraphicsLibrary:
 
         print("Deleting Texture @", idx)
         gl.glDeleteTextures(1, [idx])
+        self.state.forget_texture(idx)
     
     # --------------------------------------------------------------
     # ONE place that calls glTexImage2D: allocate only
@@ -252,9 +414,7 @@ class GraphicsLibrary:
         except Exception:
             return -1
 
-        gl.glBindTexture(gl.GL_TEXTURE_2D, texture_index)
-
-        gl.glBindTexture(gl.GL_TEXTURE_2D, texture_index)
+        self.texture_bind_index(texture_index)
         gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR)
         gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR)
         gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_S, gl.GL_CLAMP_TO_EDGE)
@@ -453,7 +613,7 @@ class GraphicsLibrary:
             )
             return
 
-        gl.glBindTexture(gl.GL_TEXTURE_2D, texture_index)
+        self.texture_bind_index(texture_index)
 
         # Safe unpack for any row width
         gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 1)
@@ -498,13 +658,14 @@ class GraphicsLibrary:
             return
 
         # Pillow RGBA -> flat uint8 buffer (4 * width * height)
-        arr = np.array(img, dtype=np.uint8)
+        arr = np.asarray(img, dtype=np.uint8)
         arr = np.ascontiguousarray(arr).reshape(-1)
 
         self.texture_write_numpy(texture_index, arr, width, height)
 
     # --------------------------------------------------------------
-    # Write from Bitmap: just calls texture_write_pillow
+    # Write from Bitmap: pixels are already RGBA uint8, so upload
+    # the backing array directly (no Pillow round trip).
     # --------------------------------------------------------------
     def texture_write_bitmap(
         self,
@@ -523,9 +684,9 @@ class GraphicsLibrary:
             )
             return
 
-        # Bitmap -> Pillow RGBA -> texture_write_pillow
-        image = bitmap.export_pillow()
-        self.texture_write_pillow(texture_index, image)
+        # Bitmap (H, W, 4) RGBA -> flat uint8 buffer, no copy when contiguous
+        arr = np.ascontiguousarray(bitmap.pixels).reshape(-1)
+        self.texture_write_numpy(texture_index, arr, bitmap.width, bitmap.height)
 
 
     # ----------------------------------------------------------------------
@@ -533,46 +694,169 @@ class GraphicsLibrary:
     # ----------------------------------------------------------------------
 
     def blend_set_alpha(self) -> None:
-        gl.glEnable(gl.GL_BLEND)
-        gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
+        self._blend_set(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
 
     def blend_set_additive(self) -> None:
-        gl.glEnable(gl.GL_BLEND)
-        gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE)
+        self._blend_set(gl.GL_SRC_ALPHA, gl.GL_ONE)
 
     def blend_set_disabled(self) -> None:
-        gl.glDisable(gl.GL_BLEND)
+        if self.state.set_blend_enabled(False):
+            gl.glDisable(gl.GL_BLEND)
+
+    def _blend_set(self, source: int, destination: int) -> None:
+        if self.state.set_blend_enabled(True):
+            gl.glEnable(gl.GL_BLEND)
+        if self.state.set_blend_function(int(source), int(destination)):
+            gl.glBlendFunc(source, destination)
 
     # ----------------------------------------------------------------------
     # Draw helpers
     # ----------------------------------------------------------------------
 
-    def draw_triangles(self, index_buffer: np.ndarray, count: int) -> None:
-        gl.glDrawElements(
-            gl.GL_TRIANGLES,
-            int(count),
-            gl.GL_UNSIGNED_INT,
-            index_buffer,
-        )
+    def draw_triangles(self, index_buffer: int | None, count: int) -> None:
+        self.draw_primitives(index_buffer, gl.GL_TRIANGLES, count)
 
-    def draw_triangle_strips(self, index_buffer: Optional[np.ndarray], count: int) -> None:
-        if index_buffer is None:
-            return
-        gl.glDrawElements(
-            gl.GL_TRIANGLE_STRIP,
-            int(count),
-            gl.GL_UNSIGNED_INT,
-            index_buffer,
-        )
+    def draw_triangle_strips(self, index_buffer: int | None, count: int) -> None:
+        self.draw_primitives(index_buffer, gl.GL_TRIANGLE_STRIP, count)
 
-    def draw_primitives(self, index_buffer: np.ndarray, primitive_type: int, count: int) -> None:
+    def draw_primitives(self, index_buffer: int | None, primitive_type: int, count: int) -> None:
+        """
+        Indexed draw from the index buffer object `index_buffer`
+        (indices read on the GPU, offset 0).
+        """
+        if index_buffer is None or index_buffer == -1 or count <= 0:
+            return
+        self.buffer_index_bind(index_buffer)
         gl.glDrawElements(
             int(primitive_type),
             int(count),
             gl.GL_UNSIGNED_INT,
-            index_buffer,
+            ctypes.c_void_p(0),
         )
 
+    def draw_arrays(self, primitive_type: int, first: int, count: int) -> None:
+        """
+        Non-indexed draw of `count` vertices from the bound VBO.
+        """
+        if count <= 0:
+            return
+        gl.glDrawArrays(int(primitive_type), int(first), int(count))
+
+    def draw_multi_arrays(self, primitive_type: int, firsts: np.ndarray, counts: np.ndarray) -> None:
+        """
+        Several non-indexed runs from the bound VBO in one call
+        (glMultiDrawArrays), e.g. one line strip per ECG segment.
+        """
+        firsts = np.ascontiguousarray(firsts, dtype=np.int32)
+        counts = np.ascontiguousarray(counts, dtype=np.int32)
+        if firsts.size == 0:
+            return
+        gl.glMultiDrawArrays(int(primitive_type), firsts, counts, int(firsts.size))
+
+    # ----------------------------------------------------------------------
+    # Instancing (GL 3.3 core, or ARB_instanced_arrays + ARB_draw_instanced
+    # on a 2.1 context)
+    # ----------------------------------------------------------------------
+    @property
+    def instancing_supported(self) -> bool:
+        if not self._instancing_checked:
+            self._instancing_checked = True
+            self._resolve_instancing()
+        return self._gl_draw_arrays_instanced is not None
+
+    def _resolve_instancing(self) -> None:
+        # PyOpenGL entry points are falsy when the driver doesn't export them
+        try:
+            if bool(gl.glVertexAttribDivisor) and bool(gl.glDrawArraysInstanced):
+                self._gl_vertex_attrib_divisor = gl.glVertexAttribDivisor
+                self._gl_draw_arrays_instanced = gl.glDrawArraysInstanced
+                return
+        except AttributeError:
+            pass
+        try:
+            from OpenGL.GL.ARB.instanced_arrays import glVertexAttribDivisorARB
+            from OpenGL.GL.ARB.draw_instanced import glDrawArraysInstancedARB
+            if bool(glVertexAttribDivisorARB) and bool(glDrawArraysInstancedARB):
+                self._gl_vertex_attrib_divisor = glVertexAttribDivisorARB
+                self._gl_draw_arrays_instanced = glDrawArraysInstancedARB
+        except ImportError:
+            pass
+
+    def vertex_attribute_divisor(self, location: int, divisor: int) -> None:
+        if location == -1 or not self.instancing_supported:
+            return
+        if self.state.set_attribute_divisor(int(location), int(divisor)):
+            self._gl_vertex_attrib_divisor(int(location), int(divisor))
+
+    def draw_arrays_instanced(self, primitive_type: int, first: int, count: int, instance_count: int) -> None:
+        if count <= 0 or instance_count <= 0:
+            return
+        if not self.instancing_supported:
+            print("⚠️ GraphicsLibrary.draw_arrays_instanced: instancing not supported")
+            return
+        self._gl_draw_arrays_instanced(int(primitive_type), int(first), int(count), int(instance_count))
+
+    # ----------------------------------------------------------------------
+    # Generic vertex attributes (for programs beyond position / uv)
+    # ----------------------------------------------------------------------
+    def shader_program_use(self, program: Optional[ShaderProgram]) -> None:
+        if program is None or program.program == 0:
+            return
+        if self.state.set_program(program.program):
+            gl.glUseProgram(program.program)
+
+    def vertex_attributes_use(self, locations) -> None:
+        """
+        Declare the attribute locations the next draw reads. Any other
+        array left enabled by an earlier draw is disabled here; arrays are
+        otherwise left enabled between draws, so back-to-back draws with
+        the same layout don't toggle them.
+        """
+        keep = {int(location) for location in locations if location != -1}
+        for location in sorted(self.state.attributes_to_disable(keep)):
+            if self.state.set_attribute_enabled(location, False):
+                gl.glDisableVertexAttribArray(location)
+
+    def vertex_attribute_link(
+        self,
+        location: int,
+        size: int,
+        stride: int,
+        offset,
+        divisor: int = 0,
+    ) -> None:
+        """
+        Point float attribute `location` at the bound ARRAY_BUFFER
+        (stride / offset in bytes); divisor > 0 makes it per-instance.
+        """
+        if location == -1:
+            return
+        location = int(location)
+        if isinstance(offset, ctypes.c_void_p):
+            offset = offset.value or 0
+        offset = int(offset)
+
+        if self.state.set_attribute_enabled(location, True):
+            gl.glEnableVertexAttribArray(location)
+        pointer = (self.state.array_buffer, int(size), int(stride), offset)
+        if self.state.array_buffer is None or self.state.set_attribute_pointer(location, pointer):
+            gl.glVertexAttribPointer(location, int(size), gl.GL_FLOAT, False, int(stride), ctypes.c_void_p(offset))
+        # Divisors belong to the slot, not the program: always state it,
+        # so a slot last used per-instance reads per vertex again.
+        self.vertex_attribute_divisor(location, divisor)
+
+    def vertex_attribute_unlink(self, location: int, divisor: int = 0) -> None:
+        """
+        Disable one attribute array now. Usually unnecessary: the next
+        vertex_attributes_use() / link disables whatever it doesn't read.
+        """
+        if location == -1:
+            return
+        if divisor:
+            self.vertex_attribute_divisor(location, 0)
+        if self.state.set_attribute_enabled(int(location), False):
+            gl.glDisableVertexAttribArray(location)
+
     # ----------------------------------------------------------------------
     # Linking buffers to shader program (vertex attribs)
     # ----------------------------------------------------------------------
@@ -596,7 +880,8 @@ class GraphicsLibrary:
     ) -> None:
         """
         Low-level helper: bind and configure a VBO by index.
-        Treat None and -1 as invalid.
+        Treat None and -1 as invalid. There is no unlink: arrays stay
+        enabled, and the next link disables the ones it doesn't read.
         """
         if program is None:
             return
@@ -605,43 +890,28 @@ class GraphicsLibrary:
         if buffer_index is None or buffer_index == -1:
             return
 
-        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, int(buffer_index))
-        gl.glUseProgram(program.program)
+        self.buffer_array_bind(buffer_index)
+        self.shader_program_use(program)
+        self.vertex_attributes_use((
+            program.attribute_location_position,
+            program.attribute_location_texture_coordinates,
+        ))
 
         # Position attribute
-        if program.attribute_location_position != -1:
-            gl.glEnableVertexAttribArray(program.attribute_location_position)
-            gl.glVertexAttribPointer(
-                program.attribute_location_position,
-                program.attribute_size_position,
-                gl.GL_FLOAT,
-                False,
-                program.attribute_stride_position,
-                program.attribute_offset_position,
-            )
+        self.vertex_attribute_link(
+            program.attribute_location_position,
+            program.attribute_size_position,
+            program.attribute_stride_position,
+            program.attribute_offset_position,
+        )
 
         # Texture coordinates attribute
-        if program.attribute_location_texture_coordinates != -1:
-            gl.glEnableVertexAttribArray(program.attribute_location_texture_coordinates)
-            gl.glVertexAttribPointer(
-                program.attribute_location_texture_coordinates,
-                program.attribute_size_texture_coordinates,
-                gl.GL_FLOAT,
-                False,
-                program.attribute_stride_texture_coordinates,
-                program.attribute_offset_texture_coordinates,
-            )
-
-
-    def unlink_buffer_from_shader_program(self, program: Optional[ShaderProgram]) -> None:
-        if program is None or program.program == 0:
-            return
-
-        if program.attribute_location_texture_coordinates != -1:
-            gl.glDisableVertexAttribArray(program.attribute_location_texture_coordinates)
-
-        if program.attribute_location_position != -1:
-            gl.glDisableVertexAttribArray(program.attribute_location_position)
+        self.vertex_attribute_link(
+            program.attribute_location_texture_coordinates,
+            program.attribute_size_texture_coordinates,
+            program.attribute_stride_texture_coordinates,
+            program.attribute_offset_texture_coordinates,
+        )
 
     # ----------------------------------------------------------------------
     # Uniform helpers
@@ -758,6 +1028,6 @@ class GraphicsLibrary:
         if loc == -1 or texture_index == -1:
             return
         
-        gl.glActiveTexture(gl.GL_TEXTURE0)
-        gl.glBindTexture(gl.GL_TEXTURE_2D, texture_index)
+        self.texture_set_active_unit(0)
+        self.texture_bind_index(texture_index)
         gl.glUniform1i(loc, 0)
@@ -15,6 +15,7 @@ from OpenGL.GL import (
 
 from graphics.shader_program_sprite_2d import ShaderProgramSprite2D
 from graphics.shader_program_shape_2d import ShaderProgramShape2D
+from graphics.shader_program_shape_2d_instanced import ShaderProgramShape2DInstanced
 from filesystem.file_io import FileIO
 from filesystem.file_utils import FileUtils
 from typing import Optional
@@ -40,6 +41,15 @@ class GraphicsPipeline:
             self.function_shape2d_fragment,
         )
 
+        # Instanced shape 2D (rect + colour per instance) shader functions and program
+        self.function_shape2d_instanced_vertex = self._load_shader_vertex("graphics/shaders/", "shape_2d_instanced_vertex", "glsl")
+        self.function_shape2d_instanced_fragment = self._load_shader_fragment("graphics/shaders/", "shape_2d_instanced_fragment", "glsl")
+        self.program_shape_2d_instanced = ShaderProgramShape2DInstanced(
+            "shape_2d_instanced",
+            self.function_shape2d_instanced_vertex,
+            self.function_shape2d_instanced_fragment,
+        )
+
     # ---------------------------------------------------------
     # Shader loading helpers
     # ---------------------------------------------------------
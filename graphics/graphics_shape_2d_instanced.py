@@ -0,0 +1,196 @@
+# graphics_shape_2d_instanced.py
+
+from __future__ import annotations
+from typing import Optional, Sequence, Union
+
+import numpy as np
+from OpenGL import GL as gl
+
+from graphics.graphics_array_buffer import GraphicsArrayBuffer
+from graphics.graphics_color import GraphicsColor
+from graphics.graphics_library import GraphicsLibrary
+from graphics.graphics_matrix import GraphicsMatrix
+from graphics.shader_program_shape_2d_instanced import ShaderProgramShape2DInstanced
+
+ColorLike = Union[GraphicsColor, Sequence[float], np.ndarray]
+
+
+class GraphicsShape2DInstanced:
+    """
+    Many axis-aligned rectangles (x, y, width, height, colour each) in one
+    draw call, with program_shape_2d_instanced.
+
+    Instanced path: a 4-vertex unit-quad VBO plus one instance VBO of
+    (x, y, w, h, r, g, b, a) rows, drawn with glDrawArraysInstanced.
+
+    Fallback (no instancing on the context, or use_instancing set False
+    before load()): the rows are expanded to one merged VBO, each of the
+    4 vertices carrying its corner plus a copy of its rect / colour, drawn
+    as indexed triangles. Same shader either way.
+
+    set_rects() is the only update: one array is rewritten and uploaded.
+    """
+
+    # Unit quad in triangle-strip order, as GraphicsShapeInstance
+    unit_quad = np.array([
+        [0.0, 0.0],
+        [1.0, 0.0],
+        [0.0, 1.0],
+        [1.0, 1.0],
+    ], dtype=np.float32)
+
+    instance_floats: int = 8
+    merged_floats: int = 10
+
+    def __init__(self) -> None:
+        self.graphics: Optional[GraphicsLibrary] = None
+        self.use_instancing: bool = True
+
+        # (count, 8) float32: x, y, width, height, r, g, b, a
+        self.instances = np.zeros((0, self.instance_floats), dtype=np.float32)
+
+        self.quad_buffer: GraphicsArrayBuffer = GraphicsArrayBuffer()
+        self.instance_buffer: GraphicsArrayBuffer = GraphicsArrayBuffer()
+        self.merged_buffer: GraphicsArrayBuffer = GraphicsArrayBuffer()
+        self.index_buffer: Optional[int] = None
+        self.index_quad_count: int = 0
+
+        self.model_view_matrix: GraphicsMatrix = GraphicsMatrix()
+        self.color: GraphicsColor = GraphicsColor(1.0, 1.0, 1.0, 1.0)
+        self.is_buffer_dirty: bool = False
+
+    @property
+    def count(self) -> int:
+        return int(self.instances.shape[0])
+
+    @property
+    def is_instanced(self) -> bool:
+        return self.use_instancing and self.graphics is not None and self.graphics.instancing_supported
+
+    # ------------------------------------------------------------------
+    # Load / GPU setup
+    # ------------------------------------------------------------------
+    def load(self, graphics: Optional[GraphicsLibrary]) -> None:
+        self.graphics = graphics
+        if self.graphics is None:
+            raise ValueError("GraphicsShape2DInstanced.load: graphics is None")
+
+        if self.is_instanced:
+            self.quad_buffer.load_numpy(self.graphics, self.unit_quad)
+            self.instance_buffer.graphics = self.graphics
+            self.instance_buffer.buffer_index = self.graphics.buffer_array_generate()
+        else:
+            self.merged_buffer.graphics = self.graphics
+            self.merged_buffer.buffer_index = self.graphics.buffer_array_generate()
+        self.is_buffer_dirty = True
+
+    # ------------------------------------------------------------------
+    # Instance data
+    # ------------------------------------------------------------------
+    def set_rects(self, rects: np.ndarray, colors: ColorLike) -> None:
+        """
+        rects: (n, 4) x, y, width, height. colors: one colour for all, or
+        (n, 4) RGBA rows.
+        """
+        rects = np.asarray(rects, dtype=np.float32).reshape(-1, 4)
+        if isinstance(colors, GraphicsColor):
+            colors = (colors.r, colors.g, colors.b, colors.a)
+        colors = np.asarray(colors, dtype=np.float32)
+
+        instances = np.empty((rects.shape[0], self.instance_floats), dtype=np.float32)
+        instances[:, 0:4] = rects
+        instances[:, 4:8] = colors
+        self.instances = instances
+        self.is_buffer_dirty = True
+
+    def _upload(self) -> None:
+        graphics = self.graphics
+        if self.is_instanced:
+            graphics.buffer_array_write(self.instance_buffer.buffer_index, self.instances)
+            self.instance_buffer.size = int(self.instances.nbytes)
+            return
+
+        # Merged: 4 vertices per rect, each (corner, rect, colour)
+        count = self.count
+        merged = np.empty((count, 4, self.merged_floats), dtype=np.float32)
+        merged[:, :, 0:2] = self.unit_quad
+        merged[:, :, 2:10] = self.instances[:, None, :]
+        graphics.buffer_array_write(self.merged_buffer.buffer_index, merged)
+        self.merged_buffer.size = int(merged.nbytes)
+
+        if self.index_buffer is None or self.index_quad_count < count:
+            # Acquire before releasing, so the shared EBO grows in place
+            index_buffer = graphics.buffer_index_quads_acquire(count)
+            graphics.buffer_index_delete(self.index_buffer)
+            self.index_buffer = index_buffer
+            self.index_quad_count = count
+
+    # ------------------------------------------------------------------
+    # Render
+    # ------------------------------------------------------------------
+    def render(
+        self,
+        shader_program: Optional[ShaderProgramShape2DInstanced],
+        projection_matrix: Optional[GraphicsMatrix],
+    ) -> None:
+        if shader_program is None or shader_program.program == 0:
+            return
+        if self.graphics is None or self.count == 0:
+            return
+
+        graphics = self.graphics
+        program = shader_program
+
+        if self.is_buffer_dirty:
+            self._upload()
+            self.is_buffer_dirty = False
+
+        graphics.shader_program_use(program)
+        graphics.uniforms_modulate_color_set_color(program, self.color)
+        graphics.uniforms_matrices_set(
+            program=program,
+            projection_matrix=projection_matrix,
+            model_view_matrix=self.model_view_matrix,
+        )
+
+        float_size = 4
+        position = program.attribute_location_position
+        rect = program.attribute_location_instance_rect
+        color = program.attribute_location_instance_color
+        graphics.vertex_attributes_use((position, rect, color))
+
+        if self.is_instanced:
+            graphics.buffer_array_bind_array_buffer(self.quad_buffer)
+            graphics.vertex_attribute_link(position, 2, float_size * 2, 0)
+
+            stride = float_size * self.instance_floats
+            graphics.buffer_array_bind_array_buffer(self.instance_buffer)
+            graphics.vertex_attribute_link(rect, 4, stride, 0, divisor=1)
+            graphics.vertex_attribute_link(color, 4, stride, float_size * 4, divisor=1)
+
+            graphics.draw_arrays_instanced(gl.GL_TRIANGLE_STRIP, 0, 4, self.count)
+        else:
+            stride = float_size * self.merged_floats
+            graphics.buffer_array_bind_array_buffer(self.merged_buffer)
+            graphics.vertex_attribute_link(position, 2, stride, 0)
+            graphics.vertex_attribute_link(rect, 4, stride, float_size * 2)
+            graphics.vertex_attribute_link(color, 4, stride, float_size * 6)
+
+            graphics.draw_triangles(self.index_buffer, self.count * 6)
+
+    # ------------------------------------------------------------------
+    # Cleanup
+    # ------------------------------------------------------------------
+    def dispose(self) -> None:
+        """
+        Delete GPU buffers. Instance data is kept, so load() + render()
+        brings the same rects back. Safe to call multiple times.
+        """
+        self.quad_buffer.dispose()
+        self.instance_buffer.dispose()
+        self.merged_buffer.dispose()
+        if self.graphics is not None:
+            self.graphics.buffer_index_delete(self.index_buffer)
+        self.index_buffer = None
+        self.index_quad_count = 0
+        self.graphics = None
@@ -0,0 +1,263 @@
+# graphics_sprite_batch.py
+
+from __future__ import annotations
+import math
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from graphics.graphics_array_buffer import GraphicsArrayBuffer
+from graphics.graphics_color import GraphicsColor
+from graphics.graphics_library import GraphicsLibrary
+from graphics.graphics_matrix import GraphicsMatrix
+from graphics.graphics_sprite import GraphicsSprite
+from graphics.graphics_texture import GraphicsTexture
+from graphics.shader_program import ShaderProgram
+
+ColorTuple = Tuple[float, float, float, float]
+
+
+class GraphicsSpriteBatch:
+    """
+    Collects sprite quads and draws them with as few draw calls as possible.
+
+    Quads are transformed on the CPU into one float32 vertex array
+    (x, y, u, v per vertex, the sprite_2d layout) and drawn as indexed
+    triangles from a single fixed-size stream VBO (orphaned and refilled
+    per flush, never reallocated) with an identity model-view. A
+    flush (one upload + one draw) happens only when the texture or the
+    modulate color changes, when the batch is full, or at end().
+
+        batch.begin(pipeline.program_sprite_2d, projection_matrix)
+        batch.draw(sprite, x, y)
+        batch.draw_many(sprite, positions)
+        batch.end()
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self.capacity = max(1, int(capacity))
+
+        self.graphics: Optional[GraphicsLibrary] = None
+        self.graphics_array_buffer: GraphicsArrayBuffer = GraphicsArrayBuffer(usage="stream")
+
+        # 4 vertices per quad, 4 floats per vertex
+        self.vertices = np.zeros((self.capacity * 4, 4), dtype=np.float32)
+        self.index_buffer: Optional[int] = None
+        self.count: int = 0
+
+        self.shader_program: Optional[ShaderProgram] = None
+        self.projection_matrix: Optional[GraphicsMatrix] = None
+        self.model_view_matrix: GraphicsMatrix = GraphicsMatrix()
+        self.texture: Optional[GraphicsTexture] = None
+        self.color: ColorTuple = (1.0, 1.0, 1.0, 1.0)
+
+        # Per begin() / end(), for profiling
+        self.sprite_count: int = 0
+        self.draw_call_count: int = 0
+
+    # ------------------------------------------------------------------
+    # Load / GPU setup
+    # ------------------------------------------------------------------
+    def load(self, graphics: Optional[GraphicsLibrary]) -> None:
+        self.graphics = graphics
+        if self.graphics is None:
+            raise ValueError("GraphicsSpriteBatch.load: graphics is None")
+
+        # Two triangles per quad, from the library's shared quad EBO
+        self.index_buffer = self.graphics.buffer_index_quads_acquire(self.capacity)
+
+        # Stream buffer adopts self.vertices: flushes upload from it in place
+        self.graphics_array_buffer.load_numpy(self.graphics, self.vertices)
+
+    # ------------------------------------------------------------------
+    # Frame
+    # ------------------------------------------------------------------
+    def begin(self, shader_program: Optional[ShaderProgram], projection_matrix: Optional[GraphicsMatrix]) -> None:
+        self.shader_program = shader_program
+        self.projection_matrix = projection_matrix
+        self.texture = None
+        self.color = (1.0, 1.0, 1.0, 1.0)
+        self.count = 0
+        self.sprite_count = 0
+        self.draw_call_count = 0
+
+    def end(self) -> None:
+        self.flush()
+        self.shader_program = None
+
+    # ------------------------------------------------------------------
+    # Drawing
+    # ------------------------------------------------------------------
+    def draw(
+        self,
+        sprite: Optional[GraphicsSprite],
+        x: float,
+        y: float,
+        scale: float = 1.0,
+        rotation: float = 0.0,
+        color: Union[GraphicsColor, ColorTuple, None] = None,
+    ) -> None:
+        """
+        Queue `sprite` centred (per its start/end frame) at (x, y),
+        scaled, then rotated by `rotation` radians.
+        """
+        if not self._prepare(sprite, color):
+            return
+
+        x0 = sprite.start_x * scale
+        y0 = sprite.start_y * scale
+        x1 = sprite.end_x * scale
+        y1 = sprite.end_y * scale
+        if rotation == 0.0:
+            corners = ((x + x0, y + y0), (x + x1, y + y0), (x + x0, y + y1), (x + x1, y + y1))
+        else:
+            c = math.cos(rotation)
+            s = math.sin(rotation)
+            corners = tuple(
+                (x + cx * c - cy * s, y + cx * s + cy * c)
+                for cx, cy in ((x0, y0), (x1, y0), (x0, y1), (x1, y1))
+            )
+        self._append(sprite, corners)
+
+    def draw_matrix(
+        self,
+        sprite: Optional[GraphicsSprite],
+        model_view_matrix: GraphicsMatrix,
+        color: Union[GraphicsColor, ColorTuple, None] = None,
+    ) -> None:
+        """
+        Queue `sprite` transformed by a 2D model-view matrix (the same one
+        a GraphicsSpriteInstance would have been given).
+        """
+        if not self._prepare(sprite, color):
+            return
+
+        m = model_view_matrix.m
+        corners = tuple(
+            (m[0] * cx + m[4] * cy + m[12], m[1] * cx + m[5] * cy + m[13])
+            for cx, cy in (
+                (sprite.start_x, sprite.start_y), (sprite.end_x, sprite.start_y),
+                (sprite.start_x, sprite.end_y), (sprite.end_x, sprite.end_y),
+            )
+        )
+        self._append(sprite, corners)
+
+    def draw_many(
+        self,
+        sprite: Optional[GraphicsSprite],
+        positions: np.ndarray,
+        scale: Union[float, np.ndarray] = 1.0,
+        color: Union[GraphicsColor, ColorTuple, None] = None,
+    ) -> None:
+        """
+        Queue one copy of `sprite` per (x, y) row of `positions`, with a
+        shared or per-sprite scale. The vertices are built vectorized, so
+        thousands of markers cost a handful of numpy calls.
+        """
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 2)
+        if positions.shape[0] == 0 or not self._prepare(sprite, color):
+            return
+
+        local = np.array((
+            (sprite.start_x, sprite.start_y), (sprite.end_x, sprite.start_y),
+            (sprite.start_x, sprite.end_y), (sprite.end_x, sprite.end_y),
+        ), dtype=np.float32)
+        uv = self._texture_coordinates(sprite)
+        scale = np.broadcast_to(np.asarray(scale, dtype=np.float32).reshape(-1), (positions.shape[0],))
+
+        start = 0
+        while start < positions.shape[0]:
+            if self.count == self.capacity:
+                self.flush()
+            take = min(self.capacity - self.count, positions.shape[0] - start)
+            quads = self.vertices[self.count * 4:(self.count + take) * 4].reshape(take, 4, 4)
+            quads[:, :, 0:2] = positions[start:start + take, None, :] + local[None, :, :] * scale[start:start + take, None, None]
+            quads[:, :, 2:4] = uv
+            self.count += take
+            self.sprite_count += take
+            start += take
+
+    # ------------------------------------------------------------------
+    # Flush
+    # ------------------------------------------------------------------
+    def flush(self) -> None:
+        if self.count == 0:
+            return
+        graphics = self.graphics
+        program = self.shader_program
+        if graphics is None or program is None or self.index_buffer is None or self.texture is None:
+            self.count = 0
+            return
+
+        # Only the queued quads are drawn, so the rest may stay undefined
+        self.graphics_array_buffer.upload_range(0, self.count * 4 * 4, discard_rest=True)
+        graphics.link_buffer_to_shader_program(program, self.graphics_array_buffer)
+        graphics.uniforms_texture_set_texture(program, self.texture)
+        graphics.uniforms_modulate_color_set(program, *self.color)
+        graphics.uniforms_matrices_set(
+            program=program,
+            projection_matrix=self.projection_matrix,
+            model_view_matrix=self.model_view_matrix,
+        )
+        graphics.draw_triangles(self.index_buffer, self.count * 6)
+
+        self.draw_call_count += 1
+        self.count = 0
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _prepare(
+        self,
+        sprite: Optional[GraphicsSprite],
+        color: Union[GraphicsColor, ColorTuple, None],
+    ) -> bool:
+        # Flush first if this quad can't share the pending draw
+        if sprite is None or sprite.texture is None or self.shader_program is None:
+            return False
+        if color is None:
+            rgba: ColorTuple = (1.0, 1.0, 1.0, 1.0)
+        elif isinstance(color, GraphicsColor):
+            rgba = (color.r, color.g, color.b, color.a)
+        else:
+            rgba = tuple(float(c) for c in color)
+        if sprite.texture is not self.texture or rgba != self.color:
+            self.flush()
+            self.texture = sprite.texture
+            self.color = rgba
+        return True
+
+    def _append(self, sprite: GraphicsSprite, corners) -> None:
+        if self.count == self.capacity:
+            self.flush()
+        base = self.count * 4
+        uv = self._texture_coordinates(sprite)
+        self.vertices[base:base + 4] = (
+            (corners[0][0], corners[0][1], uv[0][0], uv[0][1]),
+            (corners[1][0], corners[1][1], uv[1][0], uv[1][1]),
+            (corners[2][0], corners[2][1], uv[2][0], uv[2][1]),
+            (corners[3][0], corners[3][1], uv[3][0], uv[3][1]),
+        )
+        self.count += 1
+        self.sprite_count += 1
+
+    @classmethod
+    def _texture_coordinates(cls, sprite: GraphicsSprite) -> Tuple[Tuple[float, float], ...]:
+        return (
+            (sprite.start_u, sprite.start_v), (sprite.end_u, sprite.start_v),
+            (sprite.start_u, sprite.end_v), (sprite.end_u, sprite.end_v),
+        )
+
+    # ------------------------------------------------------------------
+    # Cleanup
+    # ------------------------------------------------------------------
+    def dispose(self) -> None:
+        """
+        Delete the GPU buffer. Safe to call multiple times.
+        """
+        self.graphics_array_buffer.dispose()
+        if self.graphics is not None:
+            self.graphics.buffer_index_delete(self.index_buffer)
+        self.index_buffer = None
+        self.graphics = None
+        self.count = 0
@@ -28,13 +28,15 @@ class GraphicsSpriteInstance(Generic[T]):
             raise ValueError("GraphicsSpriteInstance requires exactly 4 vertices")
 
         self.vertex_array: list[T] = list(vertex_array)
-        self.graphics_array_buffer: GraphicsArrayBuffer[T] = GraphicsArrayBuffer()
+        # Moved every frame: positions are patched in place, only the
+        # changed floats are re-sent
+        self.graphics_array_buffer: GraphicsArrayBuffer[T] = GraphicsArrayBuffer(usage="dynamic")
 
         self.graphics: Optional[GraphicsLibrary] = None
         self.sprite: Optional[GraphicsSprite] = None
 
         self.indices = [0, 1, 2, 3]
-        self.index_buffer: Optional[object] = None
+        self.index_buffer: Optional[int] = None
 
         self.projection_matrix: GraphicsMatrix = GraphicsMatrix()
         self.model_view_matrix: GraphicsMatrix = GraphicsMatrix()
@@ -137,7 +139,8 @@ class GraphicsSpriteInstance(Generic[T]):
         # --------------------------------------------------------------
         # Upload buffers
         # --------------------------------------------------------------
-        self.index_buffer = self.graphics.buffer_index_generate_from_list(self.indices)
+        # Every instance with the same indices draws from one shared EBO
+        self.index_buffer = self.graphics.buffer_index_generate_shared(self.indices)
         self.graphics_array_buffer.load(self.graphics, self.vertex_array)
         self.is_vertex_buffer_dirty = False
 
@@ -178,9 +181,6 @@ class GraphicsSpriteInstance(Generic[T]):
         # Draw as triangle strip with 4 indices
         graphics.draw_triangle_strips(self.index_buffer, 4)
 
-        # Unbind
-        graphics.unlink_buffer_from_shader_program(program)
-
     def dispose(self) -> None:
         """
         Delete GPU buffers and reset bindings.
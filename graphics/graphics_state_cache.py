@@ -0,0 +1,169 @@
+# graphics_state_cache.py
+
+from __future__ import annotations
+from typing import Dict, Hashable, Optional, Set, Tuple
+
+
+class GraphicsStateCache:
+    """
+    Shadow copy of the GL state GraphicsLibrary changes most often:
+    current program, ARRAY_BUFFER / ELEMENT_ARRAY_BUFFER bindings, active texture unit and the
+    texture bound on it, blending, enabled vertex attribute arrays, their
+    pointers and divisors.
+
+    Each set_* returns True when the GL call has to be issued (and
+    records the new value), False when it would be a no-op. Every answer
+    is counted per call kind, so issued vs skipped can be read back with
+    counters().
+
+    None means "unknown": the next set_* always issues. invalidate()
+    forgets everything, for when code outside GraphicsLibrary may have
+    touched GL state (a new context, a third-party draw).
+    """
+
+    def __init__(self) -> None:
+        self.issued: Dict[str, int] = {}
+        self.skipped: Dict[str, int] = {}
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        self.program: Optional[int] = None
+        self.array_buffer: Optional[int] = None
+        self.element_array_buffer: Optional[int] = None
+        self.active_texture_unit: Optional[int] = None
+        self.textures: Dict[int, int] = {}
+        self.blend_enabled: Optional[bool] = None
+        self.blend_function: Optional[Tuple[int, int]] = None
+        # None = unknown; otherwise the exact set of enabled locations
+        self.enabled_attributes: Optional[Set[int]] = None
+        self.attribute_pointers: Dict[int, Tuple[Hashable, ...]] = {}
+        self.attribute_divisors: Dict[int, int] = {}
+
+    # ------------------------------------------------------------------
+    # Counters
+    # ------------------------------------------------------------------
+    def _count(self, kind: str, issue: bool) -> bool:
+        table = self.issued if issue else self.skipped
+        table[kind] = table.get(kind, 0) + 1
+        return issue
+
+    def counters(self) -> Dict[str, Tuple[int, int]]:
+        """
+        {call kind: (issued, skipped)}
+        """
+        kinds = set(self.issued) | set(self.skipped)
+        return {kind: (self.issued.get(kind, 0), self.skipped.get(kind, 0)) for kind in sorted(kinds)}
+
+    @property
+    def issued_total(self) -> int:
+        return sum(self.issued.values())
+
+    @property
+    def skipped_total(self) -> int:
+        return sum(self.skipped.values())
+
+    def reset_counters(self) -> None:
+        self.issued.clear()
+        self.skipped.clear()
+
+    # ------------------------------------------------------------------
+    # Bindings
+    # ------------------------------------------------------------------
+    def set_program(self, program: int) -> bool:
+        if self.program == program:
+            return self._count("program", False)
+        self.program = program
+        return self._count("program", True)
+
+    def set_array_buffer(self, buffer_index: int) -> bool:
+        if self.array_buffer == buffer_index:
+            return self._count("array_buffer", False)
+        self.array_buffer = buffer_index
+        return self._count("array_buffer", True)
+
+    def set_element_array_buffer(self, buffer_index: int) -> bool:
+        if self.element_array_buffer == buffer_index:
+            return self._count("element_array_buffer", False)
+        self.element_array_buffer = buffer_index
+        return self._count("element_array_buffer", True)
+
+    def set_active_texture_unit(self, unit: int) -> bool:
+        if self.active_texture_unit == unit:
+            return self._count("active_texture", False)
+        self.active_texture_unit = unit
+        return self._count("active_texture", True)
+
+    def set_texture(self, texture_index: int) -> bool:
+        # Bound per unit; an unknown unit means an unknown binding
+        unit = self.active_texture_unit
+        if unit is not None and self.textures.get(unit) == texture_index:
+            return self._count("texture", False)
+        if unit is not None:
+            self.textures[unit] = texture_index
+        return self._count("texture", True)
+
+    # ------------------------------------------------------------------
+    # Blending
+    # ------------------------------------------------------------------
+    def set_blend_enabled(self, enabled: bool) -> bool:
+        if self.blend_enabled == enabled:
+            return self._count("blend_enable", False)
+        self.blend_enabled = enabled
+        return self._count("blend_enable", True)
+
+    def set_blend_function(self, source: int, destination: int) -> bool:
+        function = (source, destination)
+        if self.blend_function == function:
+            return self._count("blend_function", False)
+        self.blend_function = function
+        return self._count("blend_function", True)
+
+    # ------------------------------------------------------------------
+    # Vertex attributes
+    # ------------------------------------------------------------------
+    def set_attribute_enabled(self, location: int, enabled: bool) -> bool:
+        attributes = self.enabled_attributes
+        if attributes is not None and (location in attributes) == enabled:
+            return self._count("attribute_enable", False)
+        if attributes is not None:
+            if enabled:
+                attributes.add(location)
+            else:
+                attributes.discard(location)
+        return self._count("attribute_enable", True)
+
+    def attributes_to_disable(self, keep: Set[int]) -> Set[int]:
+        """
+        Known-enabled locations outside `keep`.
+        """
+        if self.enabled_attributes is None:
+            return set()
+        return self.enabled_attributes - keep
+
+    def set_attribute_pointer(self, location: int, pointer: Tuple[Hashable, ...]) -> bool:
+        # pointer includes the bound buffer; the GL pointer captures it
+        if self.attribute_pointers.get(location) == pointer:
+            return self._count("attribute_pointer", False)
+        self.attribute_pointers[location] = pointer
+        return self._count("attribute_pointer", True)
+
+    def set_attribute_divisor(self, location: int, divisor: int) -> bool:
+        if self.attribute_divisors.get(location) == divisor:
+            return self._count("attribute_divisor", False)
+        self.attribute_divisors[location] = divisor
+        return self._count("attribute_divisor", True)
+
+    # ------------------------------------------------------------------
+    # Deletion (GL unbinds deleted names)
+    # ------------------------------------------------------------------
+    def forget_buffer(self, buffer_index: int) -> None:
+        if self.array_buffer == buffer_index:
+            self.array_buffer = 0
+        if self.element_array_buffer == buffer_index:
+            self.element_array_buffer = 0
+        for location in [l for l, p in self.attribute_pointers.items() if p and p[0] == buffer_index]:
+            del self.attribute_pointers[location]
+
+    def forget_texture(self, texture_index: int) -> None:
+        for unit in [u for u, t in self.textures.items() if t == texture_index]:
+            self.textures[unit] = 0
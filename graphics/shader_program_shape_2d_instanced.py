@@ -0,0 +1,36 @@
+# shader_program_shape_2d_instanced.py
+
+from graphics.shader_program import ShaderProgram
+
+class ShaderProgramShape2DInstanced(ShaderProgram):
+    """
+    Unit quad (Positions) stretched to a per-instance rect and tinted by a
+    per-instance colour. The same program serves the merged-buffer
+    fallback: there InstanceRect / InstanceColor are just repeated per vertex.
+    """
+
+    def __init__(self, name: str, vertex_shader: int, fragment_shader: int):
+        super().__init__(name, vertex_shader, fragment_shader)
+
+        # Attribute locations
+        self.attribute_location_position = self.get_attribute_location("Positions")
+        self.attribute_location_instance_rect = self.get_attribute_location("InstanceRect")
+        self.attribute_location_instance_color = self.get_attribute_location("InstanceColor")
+
+        # Uniform locations
+        self.uniform_location_modulate_color = self.get_uniform_location("ModulateColor")
+        self.uniform_location_projection_matrix = self.get_uniform_location("ProjectionMatrix")
+        self.uniform_location_model_view_matrix = self.get_uniform_location("ModelViewMatrix")
+
+        print(f"===> {name} ... attribute_location_position = {self.attribute_location_position}")
+        print(f"===> {name} ... attribute_location_instance_rect = {self.attribute_location_instance_rect}")
+        print(f"===> {name} ... attribute_location_instance_color = {self.attribute_location_instance_color}")
+        print(f"===> {name} ... uniform_location_modulate_color = {self.uniform_location_modulate_color}")
+        print(f"===> {name} ... uniform_location_projection_matrix = {self.uniform_location_projection_matrix}")
+        print(f"===> {name} ... uniform_location_model_view_matrix = {self.uniform_location_model_view_matrix}")
+
+        # Strides / offsets depend on the path (quad VBO + instance VBO, or
+        # one merged VBO) and are set by GraphicsShape2DInstanced.
+        self.attribute_size_position = 2
+        self.attribute_size_instance_rect = 4
+        self.attribute_size_instance_color = 4
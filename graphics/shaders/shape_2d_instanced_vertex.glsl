@@ -0,0 +1,12 @@
+// shape_2d_instanced_vertex.glsl
+attribute vec2 Positions;
+attribute vec4 InstanceRect;
+attribute vec4 InstanceColor;
+uniform mat4 ProjectionMatrix;
+uniform mat4 ModelViewMatrix;
+varying vec4 ColorOut;
+void main(void) {
+    vec2 position = InstanceRect.xy + Positions * InstanceRect.zw;
+    gl_Position = ProjectionMatrix * ModelViewMatrix * vec4(position, 0.0, 1.0);
+    ColorOut = InstanceColor;
+}
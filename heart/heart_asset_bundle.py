@@ -3,7 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
-from filesystem.file_utils import FileUtils
+from filesystem.asset_manifest import AssetManifest
 
 from graphics.graphics_texture import GraphicsTexture
 from graphics.graphics_sprite import GraphicsSprite
@@ -26,25 +26,30 @@ class HeartAssetBundle:
     
     def __init__(self) -> None:
 
-        self.ekg_image_reference = FileUtils.load_local_pillow_image("/data/cardio_img/", "/7663343-0001")
-        
-        self.ekg_image_a = FileUtils.load_local_pillow_image("/data/cardio_img/", "10140238-0001")
-        self.ekg_image_b = FileUtils.load_local_pillow_image("/data/cardio_img/", "11842146-0001")
-        self.ekg_image_c = FileUtils.load_local_pillow_image("/data/cardio_img/", "19030958-0001")
-        self.ekg_image_d = FileUtils.load_local_pillow_image("/data/cardio_img/", "19585145-0001")
-        self.ekg_image_e = FileUtils.load_local_pillow_image("/data/cardio_img/", "7663343-0001")
+        # Registered only; the reference decodes on first access. Scans are
+        # shown through HeartScene's carousel, which decodes each on demand.
+        self.manifest = AssetManifest()
+        self._ekg_image_reference = self.manifest.register_image("/data/cardio_img/", "/7663343-0001")
         
         self.ekg_texture_original: Optional[GraphicsTexture] = None
         self.ekg_sprite_original: Optional[GraphicsSprite] = None
         
         self.loaded = False
 
+    # ------------------------------------------------------------------
+    # Lazy images (decoded on first access)
+    # ------------------------------------------------------------------
+    @property
+    def ekg_image_reference(self):
+        return self._ekg_image_reference.get()
+
     # ------------------------------------------------------------------
     # Initial load: create texture + sprite instances
     # ------------------------------------------------------------------
     def load(self, graphics: GraphicsLibrary) -> None:
 
-        _ow, _oh = self.ekg_image_reference.size
+        # Header read only; the texture is filled later by the Zebra pipeline
+        _ow, _oh = self._ekg_image_reference.size
 
         self.ekg_texture_original = GraphicsTexture(graphics=graphics)
         self.ekg_texture_original.load_random(width=_ow, height=_oh)
@@ -61,6 +66,7 @@ class HeartAssetBundle:
     # Dispose all textures (sprites and dict stay)
     # ------------------------------------------------------------------
     def dispose(self) -> None:
+        self.manifest.dispose()
         self.loaded = False
 
     # ------------------------------------------------------------------
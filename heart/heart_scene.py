@@ -1,5 +1,6 @@
 # pong_scene.py
 from __future__ import annotations
+from typing import Optional
 from OpenGL import GL as gl
 from filesystem.file_utils import FileUtils
 from graphics.graphics_scene import GraphicsScene
@@ -14,9 +15,10 @@ from graphics.graphics_sprite_2d_instance import GraphicsSprite2DInstance
 
 from graphics.graphics_texture import GraphicsTexture
 from heart.heart_asset_bundle import HeartAssetBundle
-import random
-
-rng = random.Random()
+from heart.heart_zebra_pipeline import HeartZebraPipeline
+from heart.heart_waveform_renderer import HeartWaveformRenderer
+from ecg.ecg_csv_loader import EcgCsvLoader
+from image.image_carousel import ImageCarousel, ImageCarouselFrame
 
 class HeartScene(GraphicsScene):
 
@@ -34,6 +36,14 @@ class HeartScene(GraphicsScene):
         self.mouse_y = float(graphics.frame_buffer_height) / 2.0
 
         self.cario_image = GraphicsSprite2DInstance()
+
+        self.zebra = HeartZebraPipeline()
+
+        self.carousel = ImageCarousel.from_local_directory("data/cardio_img")
+        self.carousel_frame: Optional[ImageCarouselFrame] = None
+
+        self.waveform = HeartWaveformRenderer()
+        self.waveform_dragging = False
         
         
     
@@ -45,6 +55,15 @@ class HeartScene(GraphicsScene):
 
     def load(self) -> None:
         self.cario_image.load(self.graphics, self.assets.ekg_sprite_original)
+        self.zebra.start()
+        self.carousel.start()
+
+        try:
+            record = EcgCsvLoader.load_local_cached("data/cardio_csv", "7663343")
+        except (OSError, ValueError) as e:
+            print(f"⚠️ HeartScene.load: could not load ECG record | {e}")
+            record = None
+        self.waveform.load(self.graphics, record)
 
 
     def load_complete(self) -> None:
@@ -52,9 +71,25 @@ class HeartScene(GraphicsScene):
 
     def resize(self) -> None:
         graphics = self.graphics
+        width = float(graphics.frame_buffer_width)
+        height = float(graphics.frame_buffer_height)
+        # Traces fill the lower half of the window
+        self.waveform.fit(16.0, height * 0.5, width - 32.0, height * 0.5 - 16.0)
     
     def update(self, dt: float) -> None:
-        ...
+        # Show the carousel image once it has been decoded
+        frame = self.carousel.current()
+        if frame is not None and frame is not self.carousel_frame:
+            self.carousel_frame = frame
+            self.zebra.set_source(frame.pixels, key=str(frame.path))
+
+        # Hand this frame's slider state to the worker, pick up any result
+        self.zebra.update()
+        if self.zebra.upload(self.assets.ekg_texture_original):
+            # Image size changed: texture storage was recreated
+            self.assets.ekg_sprite_original.load(self.assets.ekg_texture_original)
+            self.cario_image.dispose()
+            self.cario_image.load(self.graphics, self.assets.ekg_sprite_original)
 
         
     def draw(self) -> None:
@@ -76,33 +111,37 @@ class HeartScene(GraphicsScene):
 
         self.cario_image.render(sprite_program)
 
+        self.graphics.blend_set_alpha()
+        self.waveform.render(shape_program, projection_matrix)
+
 
     # --------------------------------------------------------------
     # Input
     # --------------------------------------------------------------
 
     def mouse_down(self, button: int, xpos: float, ypos: float) -> None:
-        ...
-        value = random.randint(0, 4)
-        if value == 0:
-            self.assets.ekg_texture_original.write_pillow(self.assets.ekg_image_a)
-        elif value == 1:
-            self.assets.ekg_texture_original.write_pillow(self.assets.ekg_image_b)
-        elif value == 2:
-            self.assets.ekg_texture_original.write_pillow(self.assets.ekg_image_c)
-        elif value == 3:
-            self.assets.ekg_texture_original.write_pillow(self.assets.ekg_image_d)
-        else:
-            self.assets.ekg_texture_original.write_pillow(self.assets.ekg_image_e)
+        self.mouse_x = xpos
+        self.mouse_y = ypos
+        self.waveform_dragging = True
     
+    def next_image(self) -> None:
+        self.carousel.next()
+
+    def previous_image(self) -> None:
+        self.carousel.previous()
+
     def mouse_up(self, button: int, xpos: float, ypos: float) -> None:
-        ...
+        self.waveform_dragging = False
         
     def mouse_move(self, xpos: float, ypos: float) -> None:
-        ...
+        if self.waveform_dragging:
+            self.waveform.pan_by(xpos - self.mouse_x, ypos - self.mouse_y)
+        self.mouse_x = xpos
+        self.mouse_y = ypos
     
     def mouse_wheel(self, direction: int) -> None:
-        print(f"HeartScene.mouse_wheel(direction={direction})")
+        # Zoom the traces around the cursor; only the matrix changes
+        self.waveform.zoom_at(self.mouse_x, 1.25 if direction > 0 else 0.8)
 
     def key_down(
         self,
@@ -134,5 +173,7 @@ class HeartScene(GraphicsScene):
     # --------------------------------------------------------------
 
     def dispose(self) -> None:
-        ...
+        self.carousel.dispose()
+        self.zebra.dispose()
+        self.waveform.dispose()
     
\ No newline at end of file
@@ -0,0 +1,412 @@
+# heart/heart_waveform_renderer.py
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+from OpenGL import GL as gl
+
+from ecg.ecg_record import EcgRecord
+from graphics.graphics_array_buffer import GraphicsArrayBuffer
+from graphics.graphics_library import GraphicsLibrary
+from graphics.graphics_matrix import GraphicsMatrix
+from graphics.shader_program import ShaderProgram
+
+
+@dataclass
+class HeartWaveformLevel:
+    """
+    One level of detail inside the shared vertex buffer.
+
+    bucket is the number of samples folded into each (min, max) vertex
+    pair; level 0 (bucket 1) is the raw trace, one vertex per sample.
+    x is a CPU copy of the level's vertex sample positions, sorted within
+    each lead, used to clip draws to the visible range.
+    """
+    bucket: int
+    x: np.ndarray
+    # Per lead: (firsts, counts) of its runs, absolute in the vertex buffer
+    lead_runs: List[Tuple[np.ndarray, np.ndarray]]
+    # Per lead: [start, end) vertex span, absolute in the vertex buffer
+    lead_spans: List[Tuple[int, int]]
+    # First vertex of this level in the vertex buffer
+    base: int
+
+
+class HeartWaveformRenderer:
+    """
+    Draws every lead of an EcgRecord as GPU line strips.
+
+    Vertices live in "trace space" and are built once, vectorized:
+        x = sample index
+        y = lead baseline - value   (leads stacked lead_spacing apart,
+                                     positive values point up on screen)
+    Blank samples (NaN) split a lead into separate runs; each lead is one
+    glMultiDrawArrays call over its runs, all from a single VBO.
+
+    Long records also get a min/max pyramid, like an audio editor's
+    waveform overview: level k folds 2^k samples into one (min, max)
+    vertex pair, placed at the samples they came from. render() picks the
+    level the current zoom needs (at most max_vertices_per_pixel vertices
+    per pixel column) and only draws its visible sample range, so a frame
+    costs about the same for a ten-second strip as for an hour.
+
+    Pan and zoom only change the model-view matrix (see model_view_matrix),
+    so moving around never touches the vertex data.
+    """
+
+    # Vertical distance between lead baselines, in record units (mV)
+    lead_spacing: float = 2.5
+
+    # Level selection budget; a min/max pair per pixel column is 2
+    max_vertices_per_pixel: float = 2.0
+
+    lead_colors: Tuple[Tuple[float, float, float], ...] = (
+        (0.95, 0.35, 0.35), (0.95, 0.60, 0.30), (0.95, 0.85, 0.30),
+        (0.60, 0.90, 0.35), (0.35, 0.90, 0.55), (0.30, 0.90, 0.85),
+        (0.35, 0.70, 0.95), (0.40, 0.50, 0.95), (0.60, 0.40, 0.95),
+        (0.85, 0.40, 0.95), (0.95, 0.40, 0.75), (0.85, 0.85, 0.85),
+    )
+
+    def __init__(self) -> None:
+        self.graphics: Optional[GraphicsLibrary] = None
+        self.record: Optional[EcgRecord] = None
+        self.graphics_array_buffer: GraphicsArrayBuffer = GraphicsArrayBuffer()
+
+        self.levels: List[HeartWaveformLevel] = []
+        self.lead_visible: List[bool] = []
+
+        # View: screen = origin + zoom * (trace - pan)
+        self.origin_x: float = 0.0
+        self.origin_y: float = 0.0
+        self.pan_x: float = 0.0
+        self.pan_y: float = 0.0
+        self.zoom_x: float = 1.0   # pixels per sample
+        self.zoom_y: float = 40.0  # pixels per record unit
+
+        self.alpha: float = 1.0
+
+        # Last render(), for overlays / profiling
+        self.level_index: int = 0
+        self.drawn_vertex_count: int = 0
+
+    # ------------------------------------------------------------------
+    # Geometry (built once per record)
+    # ------------------------------------------------------------------
+    @classmethod
+    def build_vertices(
+        cls,
+        values: np.ndarray,
+        lead_spacing: float,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (samples, leads) -> (vertices (n, 2) float32, run firsts, run counts,
+        run lead index). Runs are maximal stretches of non-NaN samples.
+        """
+        values = np.asarray(values)
+        samples, leads = values.shape
+
+        # Lead-major order, so each lead's runs are contiguous
+        lead, sample = np.nonzero(~np.isnan(values.T))
+        return cls._build_strips(lead, sample, sample, values[sample, lead], leads, lead_spacing)
+
+    @classmethod
+    def build_min_max_vertices(
+        cls,
+        minimum: np.ndarray,
+        minimum_index: np.ndarray,
+        maximum: np.ndarray,
+        maximum_index: np.ndarray,
+        lead_spacing: float,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Same output as build_vertices, for one pyramid level given as
+        (buckets, leads) min / max values and the sample index of each.
+        Each bucket becomes two vertices in time order; empty buckets
+        (min = +inf) split runs.
+        """
+        buckets, leads = minimum.shape
+        minimum_first = minimum_index <= maximum_index
+        x = np.stack((
+            np.where(minimum_first, minimum_index, maximum_index),
+            np.where(minimum_first, maximum_index, minimum_index),
+        ), axis=2)
+        y = np.stack((
+            np.where(minimum_first, minimum, maximum),
+            np.where(minimum_first, maximum, minimum),
+        ), axis=2)
+
+        # Lead-major like build_vertices: (leads, buckets, 2), masked
+        valid = np.isfinite(minimum).T
+        lead, bucket = np.nonzero(valid)
+        pairs = np.repeat(valid[:, :, None], 2, axis=2)
+        return cls._build_strips(
+            np.repeat(lead, 2), np.repeat(bucket, 2),
+            x.transpose(1, 0, 2)[pairs], y.transpose(1, 0, 2)[pairs],
+            leads, lead_spacing,
+        )
+
+    @classmethod
+    def _build_strips(
+        cls,
+        lead: np.ndarray,
+        key: np.ndarray,
+        x: np.ndarray,
+        value: np.ndarray,
+        leads: int,
+        lead_spacing: float,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        # key is the sample (or bucket) index: a run breaks where the lead
+        # changes or keys skip, i.e. across a gap.
+        count = lead.shape[0]
+        vertices = np.empty((count, 2), dtype=np.float32)
+        vertices[:, 0] = x
+        baseline = (np.arange(leads, dtype=np.float32) + 0.5) * np.float32(lead_spacing)
+        vertices[:, 1] = baseline[lead] - value
+
+        if count == 0:
+            empty = np.empty(0, dtype=np.int32)
+            return (vertices, empty, empty, empty)
+
+        breaks = np.flatnonzero((np.diff(lead) != 0) | (np.diff(key) > 1)) + 1
+        firsts = np.concatenate(([0], breaks)).astype(np.int32)
+        counts = np.diff(np.concatenate((firsts, [count]))).astype(np.int32)
+        return (vertices, firsts, counts, lead[firsts].astype(np.int32))
+
+    @classmethod
+    def build_pyramid(
+        cls,
+        values: np.ndarray,
+        lead_spacing: float,
+    ) -> List[Tuple[int, Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]]:
+        """
+        [(bucket, build_vertices-style tuple)] from raw (bucket 1) up to a
+        single bucket. Each level folds the previous one's min / max
+        arrays pairwise, so the whole pyramid is O(samples). Bucket 2 is
+        folded but not emitted: two vertices per two samples is no smaller
+        than the raw trace.
+        """
+        values = np.asarray(values, dtype=np.float32)
+        samples, leads = values.shape
+        levels = [(1, cls.build_vertices(values, lead_spacing))]
+
+        blank = np.isnan(values)
+        minimum = np.where(blank, np.float32(np.inf), values)
+        maximum = np.where(blank, np.float32(-np.inf), values)
+        index = np.broadcast_to(np.arange(samples, dtype=np.int64)[:, None], (samples, leads))
+        minimum_index = index
+        maximum_index = index
+
+        bucket = 1
+        while minimum.shape[0] > 1:
+            minimum, minimum_index = cls._fold(minimum, minimum_index, np.inf, np.argmin)
+            maximum, maximum_index = cls._fold(maximum, maximum_index, -np.inf, np.argmax)
+            bucket *= 2
+            if bucket == 2:
+                continue
+            levels.append((bucket, cls.build_min_max_vertices(
+                minimum, minimum_index, maximum, maximum_index, lead_spacing,
+            )))
+        return levels
+
+    @classmethod
+    def _fold(
+        cls,
+        values: np.ndarray,
+        index: np.ndarray,
+        fill: float,
+        pick,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        # Rows (2i, 2i + 1) -> row i, keeping the picked value's sample index
+        rows, leads = values.shape
+        if rows % 2:
+            values = np.concatenate((values, np.full((1, leads), fill, dtype=values.dtype)))
+            index = np.concatenate((index, index[-1:]))
+        values = values.reshape(-1, 2, leads)
+        index = index.reshape(-1, 2, leads)
+        chosen = pick(values, axis=1)[:, None, :]
+        return (
+            np.take_along_axis(values, chosen, axis=1)[:, 0, :],
+            np.take_along_axis(index, chosen, axis=1)[:, 0, :],
+        )
+
+    def load(self, graphics: GraphicsLibrary, record: Optional[EcgRecord]) -> None:
+        self.dispose()
+        self.graphics = graphics
+        self.record = record
+        if record is None:
+            return
+
+        # All levels share one VBO, back to back
+        chunks: List[np.ndarray] = []
+        base = 0
+        for bucket, (vertices, firsts, counts, run_leads) in self.build_pyramid(record.values, self.lead_spacing):
+            firsts = firsts + np.int32(base)
+            lead_runs = []
+            lead_spans = []
+            for index in range(record.lead_count):
+                selected = run_leads == index
+                lead_firsts = firsts[selected]
+                lead_counts = counts[selected]
+                lead_runs.append((lead_firsts, lead_counts))
+                if lead_firsts.size:
+                    lead_spans.append((int(lead_firsts[0]), int(lead_firsts[-1] + lead_counts[-1])))
+                else:
+                    lead_spans.append((base, base))
+            self.levels.append(HeartWaveformLevel(
+                bucket=bucket,
+                x=np.ascontiguousarray(vertices[:, 0]),
+                lead_runs=lead_runs,
+                lead_spans=lead_spans,
+                base=base,
+            ))
+            chunks.append(vertices)
+            base += vertices.shape[0]
+
+        self.graphics_array_buffer.load_numpy(graphics, np.concatenate(chunks))
+        self.lead_visible = [True] * record.lead_count
+
+    # ------------------------------------------------------------------
+    # View
+    # ------------------------------------------------------------------
+    @property
+    def trace_height(self) -> float:
+        if self.record is None:
+            return 0.0
+        return self.record.lead_count * self.lead_spacing
+
+    def fit(self, x: float, y: float, width: float, height: float) -> None:
+        """
+        Show the whole record inside the given screen rectangle.
+        """
+        if self.record is None or self.record.sample_count <= 1:
+            return
+        self.origin_x = float(x)
+        self.origin_y = float(y)
+        self.pan_x = 0.0
+        self.pan_y = 0.0
+        self.zoom_x = float(width) / float(self.record.sample_count - 1)
+        self.zoom_y = float(height) / max(self.trace_height, 1e-6)
+
+    def zoom_at(self, screen_x: float, factor: float) -> None:
+        """
+        Horizontal zoom keeping the sample under screen_x in place.
+        """
+        factor = float(factor)
+        if factor <= 0.0:
+            return
+        anchor = self.screen_to_sample(screen_x)
+        self.zoom_x *= factor
+        self.pan_x = anchor - (float(screen_x) - self.origin_x) / self.zoom_x
+
+    def pan_by(self, dx: float, dy: float) -> None:
+        """
+        Pan by a screen-space delta.
+        """
+        self.pan_x -= float(dx) / self.zoom_x
+        self.pan_y -= float(dy) / self.zoom_y
+
+    def screen_to_sample(self, screen_x: float) -> float:
+        return self.pan_x + (float(screen_x) - self.origin_x) / self.zoom_x
+
+    def model_view_matrix(self) -> GraphicsMatrix:
+        matrix = GraphicsMatrix()
+        matrix.translation(self.origin_x, self.origin_y, 0.0)
+        matrix.scale_xyz(self.zoom_x, self.zoom_y, 1.0)
+        matrix.translate(-self.pan_x, -self.pan_y, 0.0)
+        return matrix
+
+    # ------------------------------------------------------------------
+    # Level of detail
+    # ------------------------------------------------------------------
+    def select_level(self) -> int:
+        """
+        Finest level within max_vertices_per_pixel at the current zoom_x.
+        """
+        if not self.levels:
+            return 0
+        samples_per_pixel = 1.0 / max(self.zoom_x, 1e-12)
+        if samples_per_pixel <= self.max_vertices_per_pixel:
+            return 0
+        # Level k emits 2 vertices per 2^k samples
+        for index in range(1, len(self.levels)):
+            if 2.0 * samples_per_pixel / self.levels[index].bucket <= self.max_vertices_per_pixel:
+                return index
+        return len(self.levels) - 1
+
+    def visible_runs(
+        self,
+        level: HeartWaveformLevel,
+        lead: int,
+        sample_start: float,
+        sample_end: float,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The lead's runs at `level`, trimmed to [sample_start, sample_end]
+        plus one vertex either side so strips reach the screen edges.
+        """
+        firsts, counts = level.lead_runs[lead]
+        if firsts.size == 0:
+            return (firsts, counts)
+        span_start, span_end = level.lead_spans[lead]
+
+        # Keys in x's dtype: a float64 key would make searchsorted convert
+        # the whole (level-sized) array on every call.
+        x = level.x[span_start - level.base:span_end - level.base]
+        lo = span_start + max(int(np.searchsorted(x, x.dtype.type(sample_start), side="right")) - 1, 0)
+        hi = span_start + min(int(np.searchsorted(x, x.dtype.type(sample_end), side="left")) + 1, x.shape[0])
+
+        # Only the runs overlapping [lo, hi)
+        ends = firsts + counts
+        r0 = int(np.searchsorted(ends, lo, side="right"))
+        r1 = int(np.searchsorted(firsts, hi, side="left"))
+        firsts = np.maximum(firsts[r0:r1], lo)
+        ends = np.minimum(ends[r0:r1], hi)
+        keep = (ends - firsts) >= 2
+        return (firsts[keep], (ends - firsts)[keep])
+
+    # ------------------------------------------------------------------
+    # Render
+    # ------------------------------------------------------------------
+    def render(self, shader_program: Optional[ShaderProgram], projection_matrix: GraphicsMatrix) -> None:
+        if shader_program is None or self.graphics is None:
+            return
+        if self.graphics_array_buffer.buffer_index == -1 or not self.levels:
+            return
+
+        graphics = self.graphics
+        program = shader_program
+
+        self.level_index = self.select_level()
+        level = self.levels[self.level_index]
+        sample_start = self.screen_to_sample(0.0)
+        sample_end = self.screen_to_sample(float(graphics.frame_buffer_width))
+
+        graphics.link_buffer_to_shader_program(program, self.graphics_array_buffer)
+        graphics.uniforms_matrices_set(
+            program=program,
+            projection_matrix=projection_matrix,
+            model_view_matrix=self.model_view_matrix(),
+        )
+
+        drawn = 0
+        for index in range(len(level.lead_runs)):
+            if not self.lead_visible[index]:
+                continue
+            firsts, counts = self.visible_runs(level, index, sample_start, sample_end)
+            if firsts.size == 0:
+                continue
+            r, g, b = self.lead_colors[index % len(self.lead_colors)]
+            graphics.uniforms_modulate_color_set(program, r, g, b, self.alpha)
+            graphics.draw_multi_arrays(gl.GL_LINE_STRIP, firsts, counts)
+            drawn += int(counts.sum())
+        self.drawn_vertex_count = drawn
+
+    # ------------------------------------------------------------------
+    # Cleanup
+    # ------------------------------------------------------------------
+    def dispose(self) -> None:
+        self.graphics_array_buffer.dispose()
+        self.levels = []
+        self.lead_visible = []
+        self.record = None
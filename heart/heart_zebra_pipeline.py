@@ -0,0 +1,300 @@
+# heart/heart_zebra_pipeline.py
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, List, Optional, Union
+
+import numpy as np
+from PIL import Image
+
+from image.bitmap import Bitmap
+from image.bitmap_threshold import BitmapThreshold
+from graphics.graphics_texture import GraphicsTexture
+
+ZebraSource = Union[Bitmap, Image.Image, np.ndarray]
+
+
+@dataclass(frozen=True)
+class HeartZebraSettings:
+    threshold: int = 128
+    knockout: int = 0
+    bw: bool = False
+
+
+class HeartZebraPipeline:
+    """
+    Zebra CV1 controls -> BitmapThreshold -> EKG texture, off the render thread.
+
+    Qt signal handlers (set_threshold / set_knockout / set_bw / set_source)
+    only record the latest value. Once per frame, update() hands the newest
+    request to a worker thread; anything that changed in between is
+    coalesced (latest wins). The worker processes into one of three
+    buffers and publishes it; upload() takes the published buffer, if
+    any, and writes it to the texture. Neither update() nor upload()
+    ever waits on image processing.
+
+    Three buffers: one being uploaded, one published and one being written,
+    so the worker never writes over pixels the GL thread is reading.
+
+    Calibrate: the worker also publishes the 256-bin gray histogram of the
+    current source, so calibrate() is just an Otsu pass over 256 bins.
+    Histograms are cached (LRU, 256 bins each) under the key given to
+    set_source(), e.g. the carousel path, and a cached one is published
+    before any grayscale work on the new image starts. The threshold goes
+    to on_calibrated (hook it to the slider) and into the pipeline's own
+    settings.
+    """
+
+    # Histograms kept for recently seen source images
+    histogram_cache_size: int = 32
+
+    def __init__(self) -> None:
+        self.stage = BitmapThreshold()
+
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        # Render thread side (collected from signals, sent once per frame)
+        self._settings = HeartZebraSettings()
+        self._source: Optional[ZebraSource] = None
+        self._source_key: Optional[Hashable] = None
+        self._source_serial = 0
+        self._dirty = False
+        self._calibrate_pending = False
+        self.on_calibrated: Optional[Callable[[int], None]] = None
+
+        # Shared with the worker, guarded by _condition
+        self._request_settings: Optional[HeartZebraSettings] = None
+        self._request_source: Optional[ZebraSource] = None
+        self._request_source_key: Optional[Hashable] = None
+        self._request_serial = 0
+        self._request_generation = 0
+        self._published: Optional[np.ndarray] = None
+        self._published_generation = 0
+        self._published_histogram: Optional[np.ndarray] = None
+        self._published_histogram_serial = 0
+        self._free: List[np.ndarray] = []
+
+        # Worker-only; source key -> 256-bin histogram
+        self._worker_source_serial = 0
+        self._histograms: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
+
+        # Render thread only
+        self._uploaded_generation = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="HeartZebraPipeline", daemon=True)
+        self._thread.start()
+
+    def dispose(self) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        thread.join(timeout=1.0)
+        self._thread = None
+
+    # ------------------------------------------------------------------
+    # Inputs (render / Qt thread; record only)
+    # ------------------------------------------------------------------
+    @property
+    def settings(self) -> HeartZebraSettings:
+        return self._settings
+
+    def set_threshold(self, value: int) -> None:
+        self._set_settings(threshold=max(0, min(255, int(value))))
+
+    def set_knockout(self, value: int) -> None:
+        self._set_settings(knockout=max(0, min(100, int(value))))
+
+    def set_bw(self, value: bool) -> None:
+        self._set_settings(bw=bool(value))
+
+    def reset(self) -> None:
+        self._settings = HeartZebraSettings()
+        self._dirty = True
+
+    def calibrate(self) -> None:
+        """
+        Pick a threshold for the current image (Otsu). Runs at the next
+        update() once the image's histogram is available.
+        """
+        self._calibrate_pending = True
+
+    def set_source(self, source: Optional[ZebraSource], key: Optional[Hashable] = None) -> None:
+        """
+        New image to process (Bitmap, Pillow image or (H, W, 3|4) array).
+        Decoding and grayscale happen on the worker. `key` identifies the
+        image across decodes (e.g. its path) for the histogram cache;
+        without one the histogram is not cached.
+        """
+        if source is None:
+            return
+        self._source = source
+        self._source_key = key
+        self._source_serial += 1
+        self._dirty = True
+
+    def _set_settings(self, **changes) -> None:
+        settings = HeartZebraSettings(**{**self._settings.__dict__, **changes})
+        if settings != self._settings:
+            self._settings = settings
+            self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Per frame (render thread)
+    # ------------------------------------------------------------------
+    def update(self) -> None:
+        """
+        Send this frame's latest settings/source to the worker, if changed.
+        """
+        if self._calibrate_pending:
+            self._update_calibrate()
+        if not self._dirty:
+            return
+        self._dirty = False
+        with self._condition:
+            self._request_settings = self._settings
+            if self._request_serial != self._source_serial:
+                self._request_source = self._source
+                self._request_source_key = self._source_key
+                self._request_serial = self._source_serial
+            self._request_generation += 1
+            self._condition.notify()
+
+    def _update_calibrate(self) -> None:
+        with self._condition:
+            histogram = self._published_histogram
+            is_current = self._published_histogram_serial == self._source_serial
+        if histogram is None or not is_current:
+            return
+        self._calibrate_pending = False
+        threshold = BitmapThreshold.otsu_threshold(histogram)
+        self.set_threshold(threshold)
+        if self.on_calibrated is not None:
+            self.on_calibrated(threshold)
+
+    def upload(self, texture: Optional[GraphicsTexture]) -> bool:
+        """
+        Write the newest finished result into `texture`. Returns True if
+        the texture storage was (re)created because the image size changed,
+        so sprites built on it need to be reloaded.
+        """
+        if texture is None or texture.graphics is None:
+            return False
+        with self._condition:
+            pixels = self._published
+            generation = self._published_generation
+            self._published = None
+        if pixels is None:
+            return False
+
+        resized = False
+        try:
+            if generation > self._uploaded_generation:
+                height, width = pixels.shape[0], pixels.shape[1]
+                flat = pixels.reshape(-1)
+                if texture.width != width or texture.height != height or texture.texture_index < 0:
+                    texture.load_numpy(flat, width, height)
+                    resized = True
+                else:
+                    texture.write_numpy(flat)
+                self._uploaded_generation = generation
+        finally:
+            with self._condition:
+                self._free.append(pixels)
+        return resized
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._running and self._request_settings is None:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                settings = self._request_settings
+                source = self._request_source
+                source_key = self._request_source_key
+                serial = self._request_serial
+                generation = self._request_generation
+                self._request_settings = None
+                self._request_source = None
+                self._request_source_key = None
+
+            try:
+                if source is not None and serial != self._worker_source_serial:
+                    # A cached histogram goes out before the grayscale pass
+                    histogram = self._cached_histogram(source_key)
+                    if histogram is not None:
+                        self._publish_histogram(histogram, serial)
+                    self.stage.set_source(self._source_pixels(source))
+                    self._worker_source_serial = serial
+                    if histogram is None:
+                        histogram = self.stage.histogram()
+                        self._cache_histogram(source_key, histogram)
+                        self._publish_histogram(histogram, serial)
+                if self.stage.gray is None:
+                    continue
+
+                out = self._take_buffer()
+                self.stage.apply(settings.threshold, settings.knockout, settings.bw, out=out)
+            except Exception as e:
+                print(f"⚠️ HeartZebraPipeline: processing failed | {e}")
+                continue
+
+            with self._condition:
+                if self._published is not None:
+                    self._free.append(self._published)
+                self._published = out
+                self._published_generation = generation
+
+    def _take_buffer(self) -> np.ndarray:
+        shape = (self.stage.height, self.stage.width, 4)
+        with self._condition:
+            while self._free:
+                buffer = self._free.pop()
+                if buffer.shape == shape:
+                    return buffer
+        return np.empty(shape, dtype=np.uint8)
+
+    def _publish_histogram(self, histogram: np.ndarray, serial: int) -> None:
+        with self._condition:
+            self._published_histogram = histogram
+            self._published_histogram_serial = serial
+
+    def _cached_histogram(self, key: Optional[Hashable]) -> Optional[np.ndarray]:
+        if key is None:
+            return None
+        histogram = self._histograms.get(key)
+        if histogram is not None:
+            self._histograms.move_to_end(key)
+        return histogram
+
+    def _cache_histogram(self, key: Optional[Hashable], histogram: np.ndarray) -> None:
+        if key is None:
+            return
+        self._histograms[key] = histogram
+        while len(self._histograms) > self.histogram_cache_size:
+            self._histograms.popitem(last=False)
+
+    @classmethod
+    def _source_pixels(cls, source: ZebraSource) -> np.ndarray:
+        if isinstance(source, Bitmap):
+            return source.pixels
+        if isinstance(source, Image.Image):
+            image = source if source.mode in ("RGBA", "RGB", "L") else source.convert("RGBA")
+            return np.asarray(image)
+        return np.asarray(source)
@@ -0,0 +1,185 @@
+# image/batch_engine.py
+
+from __future__ import annotations
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from image.bitmap import Bitmap
+from image.pooling_mode import PoolingMode
+from image.pooling_engine import PoolingEngine
+from image.convolve_engine import ConvolveEngine
+from image.convolve_method import ConvolveMethod
+from image.convolve_kernel_alignment import ConvolveKernelAlignment
+from image.convolve_padding_mode import (
+    ConvolvePaddingMode,
+    ConvolvePaddingSame,
+    ConvolvePaddingValid,
+)
+
+BatchInput = Union[Sequence[Bitmap], np.ndarray]
+
+
+@dataclass
+class BatchReport:
+    """Throughput numbers for one batch call."""
+    operation: str
+    images: int
+    pixels: int
+    shards: int
+    workers: int
+    seconds: float
+
+    @property
+    def images_per_second(self) -> float:
+        return self.images / self.seconds if self.seconds > 0.0 else 0.0
+
+    @property
+    def megapixels_per_second(self) -> float:
+        return self.pixels / 1_000_000.0 / self.seconds if self.seconds > 0.0 else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"[BatchEngine] {self.operation}: {self.images} images in {self.seconds:0.3f}s "
+            f"({self.images_per_second:0.1f} img/s, {self.megapixels_per_second:0.1f} MP/s, "
+            f"{self.shards} shards on {self.workers} workers)"
+        )
+
+
+class BatchEngine:
+    """
+    Convolve / pool many images at once on a thread pool.
+
+    Input is either a list of Bitmaps (sizes may differ; one task per
+    bitmap) or an (N, H, W, C) array (split along N into shards of
+    shard_size). shard_size applies to array input only; it is ignored
+    for Bitmap lists. NumPy releases the GIL inside the heavy array ops, so
+    shards really run in parallel.
+
+    Every call returns (outputs, BatchReport):
+        Bitmap list in  -> list of Bitmaps out (same order)
+        ndarray in      -> ndarray out, from ConvolveEngine / PoolingEngine
+    """
+
+    default_shard_size: int = 8
+
+    @classmethod
+    def convolve(
+        cls,
+        images: BatchInput,
+        kernel,
+        padding: ConvolvePaddingMode = ConvolvePaddingSame(),
+        alignment: ConvolveKernelAlignment = ConvolveKernelAlignment.CENTER,
+        offset_x: int = 0,
+        offset_y: int = 0,
+        pad_value: float = 0.0,
+        method: ConvolveMethod = ConvolveMethod.AUTO,
+        workers: Optional[int] = None,
+        shard_size: Optional[int] = None,
+    ) -> Tuple[Union[List[Bitmap], np.ndarray], BatchReport]:
+        """
+        Bitmap.convolve / ConvolveEngine.convolve over every image.
+        workers: thread count (default: CPU count). shard_size: images per
+        task for array input; Bitmap lists always run one task per bitmap.
+        """
+        kernel = np.asarray(kernel, dtype=np.float64)
+        options = dict(
+            padding=padding,
+            alignment=alignment,
+            offset_x=offset_x,
+            offset_y=offset_y,
+            pad_value=pad_value,
+            method=method,
+        )
+        return cls._run(
+            "convolve",
+            images,
+            lambda bitmap: bitmap.convolve(kernel, **options),
+            lambda chunk: ConvolveEngine.convolve(chunk, kernel, **options),
+            workers,
+            shard_size,
+        )
+
+    @classmethod
+    def pool(
+        cls,
+        images: BatchInput,
+        mode: PoolingMode,
+        window_width: int,
+        window_height: int,
+        stride_x: Optional[int] = None,
+        stride_y: Optional[int] = None,
+        padding: ConvolvePaddingMode = ConvolvePaddingValid(),
+        workers: Optional[int] = None,
+        shard_size: Optional[int] = None,
+    ) -> Tuple[Union[List[Bitmap], np.ndarray], BatchReport]:
+        """
+        Bitmap.pool / PoolingEngine.pool over every image; workers and
+        shard_size as in convolve() (shard_size is array input only).
+        """
+        options = dict(
+            stride_x=stride_x,
+            stride_y=stride_y,
+            padding=padding,
+        )
+        return cls._run(
+            "pool",
+            images,
+            lambda bitmap: bitmap.pool(mode, window_width, window_height, **options),
+            lambda chunk: PoolingEngine.pool(chunk, mode, window_width, window_height, **options),
+            workers,
+            shard_size,
+        )
+
+    # ------------------------------
+    # Internals
+    # ------------------------------
+    @classmethod
+    def _run(
+        cls,
+        operation: str,
+        images: BatchInput,
+        bitmap_task: Callable[[Bitmap], Bitmap],
+        array_task: Callable[[np.ndarray], np.ndarray],
+        workers: Optional[int],
+        shard_size: Optional[int],
+    ) -> Tuple[Union[List[Bitmap], np.ndarray], BatchReport]:
+        workers = max(1, int(workers) if workers is not None else (os.cpu_count() or 1))
+        start = time.perf_counter()
+
+        if isinstance(images, np.ndarray):
+            if images.ndim != 4:
+                raise ValueError(f"array input must be (N, H, W, C), got shape {images.shape}")
+            size = max(1, int(shard_size) if shard_size is not None else cls.default_shard_size)
+            shards = [images[i:i + size] for i in range(0, images.shape[0], size)]
+            if shards:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    parts = list(pool.map(array_task, shards))
+                outputs = np.concatenate(parts, axis=0)
+            else:
+                # N == 0: let the operation give the empty result its real
+                # dtype and output H / W
+                outputs = array_task(images)
+            image_count = int(images.shape[0])
+            pixel_count = image_count * int(images.shape[1]) * int(images.shape[2])
+            shard_count = len(shards)
+        else:
+            bitmaps = list(images)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                outputs = list(pool.map(bitmap_task, bitmaps))
+            image_count = len(bitmaps)
+            pixel_count = sum(b.width * b.height for b in bitmaps)
+            shard_count = len(bitmaps)
+
+        report = BatchReport(
+            operation=operation,
+            images=image_count,
+            pixels=pixel_count,
+            shards=shard_count,
+            workers=workers,
+            seconds=time.perf_counter() - start,
+        )
+        return (outputs, report)
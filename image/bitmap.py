@@ -2,12 +2,207 @@
 
 from __future__ import annotations
 from typing import TYPE_CHECKING
-from typing import List, Tuple
+from typing import Iterator, List, Sequence, Tuple, Union
+import weakref
 import numpy as np
 from PIL import Image
 from image.rgba import RGBA
+from image.rgba_packed import RGBAPacked
+from image.bitmap_blend import BitmapBlend
+from image.stamp_mode import StampMode
+from image.convolve_padding_mode import (
+    ConvolvePaddingMode,
+    ConvolvePaddingSame,
+    ConvolvePaddingValid,
+    convolve_padding_amounts,
+)
+from image.convolve_kernel_alignment import ConvolveKernelAlignment
+from image.convolve_method import ConvolveMethod
+from image.convolve_engine import ConvolveEngine
+from image.pooling_mode import PoolingMode
+from image.pooling_engine import PoolingEngine
 from typing import Optional
 
+# ----------------------------------------------------------------------
+# Pixel + column views over the (H, W, 4) storage
+# ----------------------------------------------------------------------
+
+class BitmapPixel:
+    """
+    Lightweight RGBA-compatible view of one pixel inside a Bitmap.
+    Reads and writes go straight through to the bitmap's pixel array
+    (writes trigger copy-on-write if the storage is shared).
+    """
+
+    __slots__ = ("_bitmap", "_x", "_y")
+
+    def __init__(self, bitmap: "Bitmap", x: int, y: int) -> None:
+        self._bitmap = bitmap
+        self._x = x
+        self._y = y
+
+    def _read(self, channel: int) -> int:
+        return int(self._bitmap.pixels[self._y, self._x, channel])
+
+    def _write(self, channel: int, value: int) -> None:
+        bitmap = self._bitmap
+        bitmap._prepare_write()
+        bitmap.pixels[self._y, self._x, channel] = value
+
+    # ------------------------------
+    # Integer accessors (0–255)
+    # ------------------------------
+    @property
+    def ri(self) -> int:
+        return self._read(0)
+
+    @ri.setter
+    def ri(self, v) -> None:
+        self._write(0, RGBA._clamp_int(v))
+
+    @property
+    def gi(self) -> int:
+        return self._read(1)
+
+    @gi.setter
+    def gi(self, v) -> None:
+        self._write(1, RGBA._clamp_int(v))
+
+    @property
+    def bi(self) -> int:
+        return self._read(2)
+
+    @bi.setter
+    def bi(self, v) -> None:
+        self._write(2, RGBA._clamp_int(v))
+
+    @property
+    def ai(self) -> int:
+        return self._read(3)
+
+    @ai.setter
+    def ai(self, v) -> None:
+        self._write(3, RGBA._clamp_int(v))
+
+    # ------------------------------
+    # Float accessors (0.0–1.0)
+    # ------------------------------
+    @property
+    def rf(self) -> float:
+        return self._read(0) / 255.0
+
+    @rf.setter
+    def rf(self, v) -> None:
+        self._write(0, int(RGBA._clamp_float(v) * 255))
+
+    @property
+    def gf(self) -> float:
+        return self._read(1) / 255.0
+
+    @gf.setter
+    def gf(self, v) -> None:
+        self._write(1, int(RGBA._clamp_float(v) * 255))
+
+    @property
+    def bf(self) -> float:
+        return self._read(2) / 255.0
+
+    @bf.setter
+    def bf(self, v) -> None:
+        self._write(2, int(RGBA._clamp_float(v) * 255))
+
+    @property
+    def af(self) -> float:
+        return self._read(3) / 255.0
+
+    @af.setter
+    def af(self, v) -> None:
+        self._write(3, int(RGBA._clamp_float(v) * 255))
+
+    # ------------------------------
+    # Utility
+    # ------------------------------
+    def to_rgba(self) -> RGBA:
+        r, g, b, a = self.tuple()
+        return RGBA(r, g, b, a)
+
+    def to_packed(self) -> RGBAPacked:
+        # Array values are already 0..255: pack without clamping
+        return RGBAPacked.from_tuple(self.tuple())
+
+    def to_gray(self) -> int:
+        return self.to_packed().to_gray()
+
+    def tuple(self):
+        r, g, b, a = self._bitmap.pixels[self._y, self._x]
+        return (int(r), int(g), int(b), int(a))
+
+    def __str__(self):
+        return f"({self.rf:0.2f}, {self.gf:0.2f}, {self.bf:0.2f}, {self.af:0.2f})"
+
+    def __repr__(self):
+        return self.__str__()
+
+
+class BitmapColumn:
+    """
+    View of one column (fixed x) of a Bitmap, so rgba[x][y] keeps working.
+    Assigning rgba[x][y] = color copies the color's channels in.
+    """
+
+    __slots__ = ("_bitmap", "_x")
+
+    def __init__(self, bitmap: "Bitmap", x: int) -> None:
+        self._bitmap = bitmap
+        self._x = x
+
+    def __len__(self) -> int:
+        return self._bitmap.height
+
+    def __getitem__(self, y: int) -> BitmapPixel:
+        y = int(y)
+        if y < 0 or y >= self._bitmap.height:
+            raise IndexError(f"y out of range: {y}")
+        return BitmapPixel(self._bitmap, self._x, y)
+
+    def __setitem__(self, y: int, color) -> None:
+        y = int(y)
+        if y < 0 or y >= self._bitmap.height:
+            raise IndexError(f"y out of range: {y}")
+        if isinstance(color, (tuple, list)):
+            r, g, b, a = color
+        elif isinstance(color, RGBAPacked):
+            r, g, b, a = color.tuple()
+        else:
+            r, g, b, a = color.ri, color.gi, color.bi, color.ai
+        bitmap = self._bitmap
+        bitmap._prepare_write()
+        bitmap.pixels[y, self._x] = (r, g, b, a)
+
+
+class BitmapColumns:
+    """
+    View of every column of a Bitmap: rgba[x] -> BitmapColumn.
+    """
+
+    __slots__ = ("_bitmap",)
+
+    def __init__(self, bitmap: "Bitmap") -> None:
+        self._bitmap = bitmap
+
+    def __len__(self) -> int:
+        return self._bitmap.width
+
+    def __getitem__(self, x: int) -> BitmapColumn:
+        x = int(x)
+        if x < 0 or x >= self._bitmap.width:
+            raise IndexError(f"x out of range: {x}")
+        return BitmapColumn(self._bitmap, x)
+
+    def __iter__(self):
+        for x in range(self._bitmap.width):
+            yield BitmapColumn(self._bitmap, x)
+
 # ----------------------------------------------------------------------
 # Bitmap: rgba[x][y] with OpenCV + Pillow interop
 # ----------------------------------------------------------------------
@@ -16,34 +211,132 @@ class Bitmap:
     """
     Bitmap with:
         - width, height
-        - pixels stored as rgba[x][y] where:
+        - pixels stored as one contiguous (H, W, 4) uint8 ndarray,
+          channel order R, G, B, A
+        - rgba[x][y] still available as a view where:
             x = 0..width-1  (left to right)
             y = 0..height-1 (top to bottom)
+
+    Copy-on-write:
+        crop() returns a view over this bitmap's storage instead of a
+        copy. While storage is shared, every bitmap in the group holds a
+        read-only array. The first write through any Bitmap method (or
+        an explicit materialize()) gives that bitmap its own copy.
     """
 
     def __init__(self, width: int = 0, height: int = 0) -> None:
         self.width: int = 0
         self.height: int = 0
-        self.rgba: List[List[RGBA]] = []  # rgba[x][y]
+        self.pixels: np.ndarray = np.zeros((0, 0, 4), dtype=np.uint8)  # pixels[y, x]
+        self._cow_group: Optional[weakref.WeakSet] = None  # bitmaps sharing storage
         if width > 0 and height > 0:
             self.allocate(width, height)
 
+    @property
+    def rgba(self) -> BitmapColumns:
+        """
+        rgba[x][y] view over the pixel array. Cheap to create;
+        prefer slicing self.pixels directly for bulk work.
+        """
+        return BitmapColumns(self)
+
     # --------------------------------------------------
-    # The ONLY place we allocate the internal rgba array
+    # Copy-on-write storage
+    # --------------------------------------------------
+    @property
+    def is_shared(self) -> bool:
+        """
+        True if another live bitmap views the same storage.
+        """
+        group = self._cow_group
+        return group is not None and len(group) > 1
+
+    def materialize(self) -> None:
+        """
+        Make sure this bitmap owns a private, writable pixel array.
+        Copies only if the storage is still shared.
+        """
+        self._prepare_write()
+
+    def _prepare_write(self) -> None:
+        """
+        Called before any in-place write to self.pixels.
+        """
+        group = self._cow_group
+        if group is None:
+            return
+        if len(group) > 1:
+            self._adopt_pixels(self.pixels.copy())
+            return
+
+        # Last one standing: take the buffer back without copying.
+        group.discard(self)
+        self._cow_group = None
+        if not self._unlock_pixels():
+            self.pixels = self.pixels.copy()
+
+    def _unlock_pixels(self) -> bool:
+        """
+        Re-enable writes on self.pixels and the arrays it views.
+        """
+        chain = []
+        array = self.pixels
+        while isinstance(array, np.ndarray):
+            chain.append(array)
+            array = array.base
+        try:
+            for array in reversed(chain):
+                array.flags.writeable = True
+        except ValueError:
+            return False
+        return True
+
+    def _adopt_pixels(self, pixels: np.ndarray) -> None:
+        """
+        Swap in a new (H, W, 4) array and leave any sharing group.
+        """
+        group = self._cow_group
+        if group is not None:
+            group.discard(self)
+            self._cow_group = None
+        self.pixels = pixels
+        self.height = int(pixels.shape[0])
+        self.width = int(pixels.shape[1])
+
+    def _share_pixels(self, view: np.ndarray) -> "Bitmap":
+        """
+        New bitmap viewing `view` (a slice of self.pixels), both marked
+        read-only and joined to the same sharing group.
+        """
+        group = self._cow_group
+        if group is None:
+            group = weakref.WeakSet()
+            group.add(self)
+            self._cow_group = group
+        self.pixels.flags.writeable = False
+        view.flags.writeable = False
+
+        result = Bitmap()
+        result._adopt_pixels(view)
+        result._cow_group = group
+        group.add(result)
+        return result
+
+    @staticmethod
+    def _allocate_pixels(width: int, height: int) -> np.ndarray:
+        pixels = np.zeros((height, width, 4), dtype=np.uint8)
+        pixels[:, :, 3] = 255
+        return pixels
+
+    # --------------------------------------------------
+    # The ONLY place we allocate the internal pixel array
     # --------------------------------------------------
     def allocate(self, width: int, height: int) -> None:
         """
         Resize the bitmap and allocate internal storage.
-        This is the ONLY place rgba[][] is allocated.
+        New pixels are opaque black (0,0,0,255).
         """
-        self.width = int(width)
-        self.height = int(height)
-
-        # rgba[x][y]
-        self.rgba = [
-            [RGBA(0, 0, 0, 255) for _y in range(self.height)]
-            for _x in range(self.width)
-        ]
+        self._adopt_pixels(self._allocate_pixels(max(0, int(width)), max(0, int(height))))
 
     # --------------------------------------------------
     # Expansion / copy
@@ -65,56 +358,24 @@ class Bitmap:
             # Nothing to do; we only expand, never shrink.
             return
 
-        old_w = self.width
-        old_h = self.height
-        old_rgba = self.rgba
-
-        # Allocate new storage
-        new_rgba = [
-            [RGBA(0, 0, 0, 255) for _y in range(new_h)]
-            for _x in range(new_w)
-        ]
+        new_pixels = self._allocate_pixels(new_w, new_h)
 
-        copy_w = min(old_w, new_w)
-        copy_h = min(old_h, new_h)
+        copy_w = min(self.width, new_w)
+        copy_h = min(self.height, new_h)
 
         # Copy old pixels into the new buffer (top-left aligned)
-        for x in range(copy_w):
-            src_col = old_rgba[x]
-            dst_col = new_rgba[x]
-            for y in range(copy_h):
-                src_px = src_col[y]
-                dst_px = dst_col[y]
-                dst_px.ri = src_px.ri
-                dst_px.gi = src_px.gi
-                dst_px.bi = src_px.bi
-                dst_px.ai = src_px.ai
+        new_pixels[:copy_h, :copy_w] = self.pixels[:copy_h, :copy_w]
 
         # Swap in the new buffer
-        self.width = new_w
-        self.height = new_h
-        self.rgba = new_rgba
+        self._adopt_pixels(new_pixels)
 
     def copy(self) -> "Bitmap":
         """
         Deep copy this bitmap into a new Bitmap instance.
-        Pixels are duplicated (no shared RGBA objects).
+        Pixels are duplicated (no shared storage).
         """
         result = Bitmap()
-        result.allocate(self.width, self.height)
-        new_rgba = result.rgba
-
-        for x in range(self.width):
-            src_col = self.rgba[x]
-            dst_col = new_rgba[x]
-            for y in range(self.height):
-                src_px = src_col[y]
-                dst_px = dst_col[y]
-                dst_px.ri = src_px.ri
-                dst_px.gi = src_px.gi
-                dst_px.bi = src_px.bi
-                dst_px.ai = src_px.ai
-
+        result._adopt_pixels(self.pixels.copy())
         return result
 
     # --------------------------------------------------
@@ -181,115 +442,138 @@ class Bitmap:
     # --------------------------------------------------
     # Import from OpenCV (NumPy array)
     # --------------------------------------------------
-    def import_opencv(self, mat: np.ndarray) -> None:
+    def import_opencv(self, mat: np.ndarray, swap_rb: bool = True) -> None:
         """
         Import from an OpenCV-style NumPy array.
         Supports:
             - H x W (grayscale)
             - H x W x 3 (BGR)
             - H x W x 4 (BGRA)
+
+        Each layout is converted with a single slice/reorder over the
+        whole array. Values outside 0..255 are clamped.
+
+        swap_rb=False means the caller's channels are already R, G, B(, A).
+        In that case a C-contiguous H x W x 4 uint8 array is adopted as-is
+        (zero copy, the bitmap shares memory with `mat`).
         """
         if mat is None:
             raise ValueError("mat is None")
 
+        mat = self._opencv_to_uint8(mat)
+
         if mat.ndim == 2:
             # Grayscale: shape = (H, W)
             h, w = mat.shape
-            self.allocate(w, h)
-            for y in range(h):
-                for x in range(w):
-                    v = int(mat[y, x])
-                    self.rgba[x][y] = RGBA(v, v, v, 255)
+            pixels = np.empty((h, w, 4), dtype=np.uint8)
+            pixels[:, :, :3] = mat[:, :, None]
+            pixels[:, :, 3] = 255
 
         elif mat.ndim == 3:
             h, w, c = mat.shape
             if c not in (3, 4):
                 raise ValueError(f"Unsupported channel count: {c}")
 
-            self.allocate(w, h)
-
             if c == 3:
                 # BGR
-                for y in range(h):
-                    for x in range(w):
-                        b, g, r = mat[y, x]
-                        self.rgba[x][y] = RGBA(int(r), int(g), int(b), 255)
-            elif c == 4:
+                pixels = np.empty((h, w, 4), dtype=np.uint8)
+                pixels[:, :, :3] = mat[:, :, ::-1] if swap_rb else mat
+                pixels[:, :, 3] = 255
+            elif not swap_rb and mat.flags["C_CONTIGUOUS"] and mat.flags["WRITEABLE"]:
+                # Already RGBA: adopt the caller's buffer
+                pixels = mat
+            elif swap_rb:
                 # BGRA
-                for y in range(h):
-                    for x in range(w):
-                        b, g, r, a = mat[y, x]
-                        self.rgba[x][y] = RGBA(int(r), int(g), int(b), int(a))
+                pixels = np.ascontiguousarray(mat[:, :, (2, 1, 0, 3)])
+            else:
+                pixels = np.ascontiguousarray(mat)
 
         else:
             raise ValueError(f"Unsupported mat.ndim = {mat.ndim}")
 
+        self._adopt_pixels(pixels)
+
+    @staticmethod
+    def _opencv_to_uint8(mat: np.ndarray) -> np.ndarray:
+        """
+        OpenCV hands us uint8 almost always; anything else (uint16 PNGs,
+        float mats) is clamped to 0..255 and truncated like RGBA() does.
+        """
+        mat = np.asarray(mat)
+        if mat.dtype == np.uint8:
+            return mat
+        return np.clip(mat, 0, 255).astype(np.uint8)
+
     # --------------------------------------------------
     # Import from Pillow Image
     # --------------------------------------------------
     def import_pillow(self, image: Image.Image) -> None:
         """
         Import from a Pillow Image.
-        Converts to RGBA first to simplify handling.
+        Converts to RGBA first to simplify handling, then takes the
+        whole buffer in one copy through the array interface.
         """
         if image is None:
             raise ValueError("image is None")
 
-        img = image.convert("RGBA")
+        img = image if image.mode == "RGBA" else image.convert("RGBA")
         w, h = img.size
-        self.allocate(w, h)
 
-        pixels = img.load()
-        for x in range(w):
-            for y in range(h):
-                r, g, b, a = pixels[x, y]
-                self.rgba[x][y] = RGBA(int(r), int(g), int(b), int(a))
+        # One bulk copy; Pillow's buffer is read-only so we must own ours.
+        pixels = np.array(img, dtype=np.uint8)
+        if pixels.shape != (h, w, 4):
+            pixels = pixels.reshape((h, w, 4))
+
+        self._adopt_pixels(pixels)
 
     # --------------------------------------------------
     # Export to OpenCV (NumPy array)
     # --------------------------------------------------
-    def export_opencv(self) -> np.ndarray:
+    def export_opencv(self, swap_rb: bool = True) -> np.ndarray:
         """
         Export to an OpenCV-style NumPy array (H x W x 4, BGRA).
         Caller can convert to BGR if desired:
             bgr = bgra[:, :, :3]
-        """
-        h = self.height
-        w = self.width
-        mat = np.zeros((h, w, 4), dtype=np.uint8)
 
-        for x in range(w):
-            for y in range(h):
-                px = self.rgba[x][y]
-                # OpenCV expects B, G, R, A
-                mat[y, x, 0] = px.bi
-                mat[y, x, 1] = px.gi
-                mat[y, x, 2] = px.ri
-                mat[y, x, 3] = px.ai
+        swap_rb=False skips the channel reorder and returns the bitmap's
+        own H x W x 4 RGBA array (zero copy). Writes to it show up in the
+        bitmap. Use this when channel order doesn't matter to the caller
+        or it will convert itself (cv2.COLOR_RGBA2BGRA).
+        """
+        if not swap_rb:
+            self.materialize()
+            return self.pixels
 
-        return mat
+        # OpenCV expects B, G, R, A
+        return np.ascontiguousarray(self.pixels[:, :, (2, 1, 0, 3)])
 
     # --------------------------------------------------
     # Export to Pillow Image
     # --------------------------------------------------
-    def export_pillow(self) -> Image.Image:
+    def export_pillow(self, share: bool = False) -> Image.Image:
         """
         Export to a Pillow RGBA Image.
-        """
-        img = Image.new("RGBA", (self.width, self.height))
-        pixels = img.load()
 
-        for x in range(self.width):
-            for y in range(self.height):
-                px = self.rgba[x][y]
-                pixels[x, y] = (px.ri, px.gi, px.bi, px.ai)
+        share=False (default): the image owns a copy of the pixels.
+        share=True: the image wraps this bitmap's buffer with no copy
+        (Image.frombuffer). The image is read-only and reflects later
+        writes to this bitmap, so only use it for immediate consumers
+        such as encoding or texture upload.
+        """
+        size = (self.width, self.height)
+        if self.width <= 0 or self.height <= 0:
+            return Image.new("RGBA", size)
 
-        return img
+        pixels = np.ascontiguousarray(self.pixels)
+        img = Image.frombuffer("RGBA", size, pixels, "raw", "RGBA", 0, 1)
+        if share:
+            return img
+        return img.copy()
 
     # --------------------------------------------------
     # Flood fill: set every pixel to the same RGBA color
     # --------------------------------------------------
-    def flood(self, color: RGBA) -> None:
+    def flood(self, color: Union[RGBA, RGBAPacked]) -> None:
         """
         Set every pixel in this bitmap to the given RGBA color.
 
@@ -299,19 +583,11 @@ class Bitmap:
             return
 
         # Use the int components from the input color.
-        r = color.ri
-        g = color.gi
-        b = color.bi
-        a = color.ai
-
-        for x in range(self.width):
-            col = self.rgba[x]
-            for y in range(self.height):
-                px = col[y]
-                px.ri = r
-                px.gi = g
-                px.bi = b
-                px.ai = a
+        self._prepare_write()
+        if isinstance(color, RGBAPacked):
+            self.pixels[:, :] = color.tuple()
+        else:
+            self.pixels[:, :] = (color.ri, color.gi, color.bi, color.ai)
 
     # --------------------------------------------------
     # Internal helper: compute overlap for stamping
@@ -340,6 +616,26 @@ class Bitmap:
         start_gy = start_dy - y
         return (start_dx, end_dx, start_dy, end_dy, start_gx, start_gy)
 
+    # --------------------------------------------------
+    # Internal helper: overlap as (dst, src) array views
+    # --------------------------------------------------
+    def _stamp_regions(self, glyph: "Bitmap", x: int, y: int):
+        """
+        Same overlap as _compute_stamp_bounds, returned as a pair of
+        equally-sized (dst, src) views, or None if there is no overlap.
+        The dst view is writable (copy-on-write already applied).
+        """
+        bounds = self._compute_stamp_bounds(glyph, x, y)
+        if bounds is None:
+            return None
+        self._prepare_write()
+        start_dx, end_dx, start_dy, end_dy, start_gx, start_gy = bounds
+        end_gx = start_gx + (end_dx - start_dx)
+        end_gy = start_gy + (end_dy - start_dy)
+        dst = self.pixels[start_dy:end_dy, start_dx:end_dx]
+        src = glyph.pixels[start_gy:end_gy, start_gx:end_gx]
+        return (dst, src)
+
     # --------------------------------------------------
     # Stamp: overwrite pixels from glyph into this bitmap
     # --------------------------------------------------
@@ -356,47 +652,121 @@ class Bitmap:
         - If the stamp is partially off-screen, only the visible
             part is drawn.
         """
-        bounds = self._compute_stamp_bounds(glyph, x, y)
-        if bounds is None:
+        regions = self._stamp_regions(glyph, x, y)
+        if regions is None:
             return
-        start_dx, end_dx, start_dy, end_dy, start_gx, start_gy = bounds
-        for dy in range(start_dy, end_dy):
-            gy = start_gy + (dy - start_dy)
-            for dx in range(start_dx, end_dx):
-                gx = start_gx + (dx - start_dx)
-                self.rgba[dx][dy] = glyph.rgba[gx][gy]
+        dst, src = regions
+        dst[...] = src
 
     # --------------------------------------------------
     # Stamp with classic alpha
     # --------------------------------------------------
     def stamp_alpha(self, glyph: "Bitmap", x: int, y: int) -> None:
-        bounds = self._compute_stamp_bounds(glyph, x, y)
-        if bounds is None:
+        """
+        Alpha-blend `glyph` onto this bitmap at (x, y), compositing the
+        whole overlap in one pass. Same result as RGBA.blend_alpha
+        per pixel.
+        """
+        regions = self._stamp_regions(glyph, x, y)
+        if regions is None:
             return
-        start_dx, end_dx, start_dy, end_dy, start_gx, start_gy = bounds
-        for dy in range(start_dy, end_dy):
-            gy = start_gy + (dy - start_dy)
-            for dx in range(start_dx, end_dx):
-                gx = start_gx + (dx - start_dx)
-                src_px = glyph.rgba[gx][gy]
-                dst_px = self.rgba[dx][dy]
-                self.rgba[dx][dy] = RGBA.blend_alpha(src_px, dst_px)
-                
+        dst, src = regions
+        dst[...] = BitmapBlend.alpha(src, dst)
+
     # --------------------------------------------------
     # Stamp with additive blending
     # --------------------------------------------------
     def stamp_additive(self, glyph: "Bitmap", x: int, y: int) -> None:
-        bounds = self._compute_stamp_bounds(glyph, x, y)
-        if bounds is None:
+        """
+        Additively blend `glyph` onto this bitmap at (x, y), compositing
+        the whole overlap in one pass. Same result as RGBA.blend_additive
+        per pixel.
+        """
+        regions = self._stamp_regions(glyph, x, y)
+        if regions is None:
             return
-        start_dx, end_dx, start_dy, end_dy, start_gx, start_gy = bounds
-        for dy in range(start_dy, end_dy):
-            gy = start_gy + (dy - start_dy)
-            for dx in range(start_dx, end_dx):
-                gx = start_gx + (dx - start_dx)
-                src_px = glyph.rgba[gx][gy]
-                dst_px = self.rgba[dx][dy]
-                self.rgba[dx][dy] = RGBA.blend_additive(src_px, dst_px)
+        dst, src = regions
+        dst[...] = BitmapBlend.additive(src, dst)
+
+    # --------------------------------------------------
+    # Batched stamping: many glyphs, one pass
+    # --------------------------------------------------
+    def stamp_many(
+        self,
+        glyphs: Union["Bitmap", Sequence["Bitmap"]],
+        positions: Sequence[Tuple[int, int]],
+        mode: StampMode = StampMode.REPLACE,
+    ) -> None:
+        """
+        Stamp many glyphs at once. `glyphs` is either one Bitmap used for
+        every position, or one Bitmap per position.
+
+        Every placement is clipped like stamp(); placements are then sorted
+        into row order and composited with a single gather / blend / scatter
+        over the destination.
+
+        If any placements overlap, the result depends on order, so they
+        are composited one at a time in the order given instead (same
+        result as calling stamp* in a loop).
+        """
+        if isinstance(glyphs, Bitmap):
+            glyphs = [glyphs] * len(positions)
+        if len(glyphs) != len(positions):
+            raise ValueError(
+                f"stamp_many: got {len(glyphs)} glyphs for {len(positions)} positions"
+            )
+
+        placements = []
+        for glyph, (x, y) in zip(glyphs, positions):
+            bounds = self._compute_stamp_bounds(glyph, int(x), int(y))
+            if bounds is not None:
+                placements.append((bounds, glyph))
+        if not placements:
+            return
+
+        # Row-major order => scatter walks the destination top to bottom
+        ordered = sorted(placements, key=lambda p: (p[0][2], p[0][0]))
+
+        self._prepare_write()
+        if not self.pixels.flags["C_CONTIGUOUS"]:
+            self._adopt_pixels(np.ascontiguousarray(self.pixels))
+        dw = self.width
+
+        index_chunks = []
+        source_chunks = []
+        for bounds, glyph in ordered:
+            start_dx, end_dx, start_dy, end_dy, start_gx, start_gy = bounds
+            end_gx = start_gx + (end_dx - start_dx)
+            end_gy = start_gy + (end_dy - start_dy)
+            rows = np.arange(start_dy, end_dy, dtype=np.intp)[:, None] * dw
+            cols = np.arange(start_dx, end_dx, dtype=np.intp)[None, :]
+            index_chunks.append((rows + cols).ravel())
+            source_chunks.append(glyph.pixels[start_gy:end_gy, start_gx:end_gx].reshape(-1, 4))
+
+        indices = np.concatenate(index_chunks)
+        sorted_indices = np.sort(indices)
+        if np.any(sorted_indices[1:] == sorted_indices[:-1]):
+            # Overlap: order matters, honor the caller's order
+            for bounds, glyph in placements:
+                start_dx, _end_dx, start_dy, _end_dy, start_gx, start_gy = bounds
+                x = start_dx - start_gx
+                y = start_dy - start_gy
+                if mode == StampMode.ALPHA:
+                    self.stamp_alpha(glyph, x, y)
+                elif mode == StampMode.ADDITIVE:
+                    self.stamp_additive(glyph, x, y)
+                else:
+                    self.stamp(glyph, x, y)
+            return
+
+        sources = np.concatenate(source_chunks)
+        flat = self.pixels.reshape(-1, 4)
+        if mode == StampMode.ALPHA:
+            flat[indices] = BitmapBlend.alpha(sources, flat[indices])
+        elif mode == StampMode.ADDITIVE:
+            flat[indices] = BitmapBlend.additive(sources, flat[indices])
+        else:
+            flat[indices] = sources
 
     # --------------------------------------------------
     # Crop a sub-rectangle into a new Bitmap
@@ -407,6 +777,12 @@ class Bitmap:
         y: int,
         width: int,
         height: int) -> "Bitmap":
+        """
+        Crop the rectangle (x, y, width, height), clipped to this bitmap.
+
+        The result is a copy-on-write view: no pixels are copied until
+        either bitmap is written to (or materialize() is called).
+        """
         x = int(x)
         y = int(y)
         width = int(width)
@@ -427,11 +803,173 @@ class Bitmap:
         start_gy = start_dy - y_offset
         crop_w = end_dx - start_dx
         crop_h = end_dy - start_dy
-        result = Bitmap(crop_w, crop_h)
-        for dy in range(crop_h):
-            sy = start_gy + dy
-            for dx in range(crop_w):
-                sx = start_gx + dx
-                result.rgba[dx][dy] = self.rgba[sx][sy]
+        view = self.pixels[start_gy:start_gy + crop_h, start_gx:start_gx + crop_w]
+        return self._share_pixels(view)
+
+    # --------------------------------------------------
+    # Sliding-window patches (tiled training data)
+    # --------------------------------------------------
+    def patches(
+        self,
+        patch_width: int,
+        patch_height: int,
+        stride_x: Optional[int] = None,
+        stride_y: Optional[int] = None,
+        padding: ConvolvePaddingMode = ConvolvePaddingValid(),
+        batch_size: int = 64,
+        pad_value: int = 0,
+        with_positions: bool = False,
+    ) -> Iterator[np.ndarray]:
+        """
+        Lazily yield patches as (N, patch_height, patch_width, 4) uint8
+        batches, N <= batch_size, in row-major order.
+
+        stride defaults to the patch size (no overlap). `padding` decides
+        edge handling exactly as for convolution (see
+        convolve_padding_amounts); padded pixels are filled with pad_value.
+
+        All windows are one strided view over the (padded) pixels, so only
+        the batch being yielded is ever copied.
+
+        with_positions=True yields (batch, positions) where positions is
+        (N, 2) int array of each patch's top-left (x, y) in this bitmap's
+        coordinates (negative inside left/top padding).
+        """
+        pw = int(patch_width)
+        ph = int(patch_height)
+        if pw <= 0 or ph <= 0:
+            raise ValueError(f"patch size must be > 0 (got {pw} x {ph})")
+        sx = pw if stride_x is None else int(stride_x)
+        sy = ph if stride_y is None else int(stride_y)
+        if sx <= 0 or sy <= 0:
+            raise ValueError(f"stride must be > 0 (got {sx}, {sy})")
+        batch_size = max(1, int(batch_size))
+
+        left, right = convolve_padding_amounts(padding, self.width, pw, sx, axis="x")
+        top, bottom = convolve_padding_amounts(padding, self.height, ph, sy, axis="y")
+
+        source = self.pixels
+        if left or right or top or bottom:
+            source = np.pad(
+                source,
+                ((top, bottom), (left, right), (0, 0)),
+                mode="constant",
+                constant_values=pad_value,
+            )
+
+        src_h, src_w = source.shape[0], source.shape[1]
+        count_y = (src_h - ph) // sy + 1 if src_h >= ph else 0
+        count_x = (src_w - pw) // sx + 1 if src_w >= pw else 0
+        if count_x <= 0 or count_y <= 0:
+            return
+
+        s0, s1, s2 = source.strides
+        windows = np.lib.stride_tricks.as_strided(
+            source,
+            shape=(count_y, count_x, ph, pw, source.shape[2]),
+            strides=(s0 * sy, s1 * sx, s0, s1, s2),
+            writeable=False,
+        )
+
+        total = count_x * count_y
+        for start in range(0, total, batch_size):
+            index = np.arange(start, min(start + batch_size, total))
+            iy = index // count_x
+            ix = index % count_x
+            batch = windows[iy, ix]
+            if with_positions:
+                positions = np.stack((ix * sx - left, iy * sy - top), axis=1)
+                yield (batch, positions)
+            else:
+                yield batch
+
+    # --------------------------------------------------
+    # Convolution
+    # --------------------------------------------------
+    def convolve(
+        self,
+        kernel,
+        padding: ConvolvePaddingMode = ConvolvePaddingSame(),
+        alignment: ConvolveKernelAlignment = ConvolveKernelAlignment.CENTER,
+        offset_x: int = 0,
+        offset_y: int = 0,
+        pad_value: float = 0.0,
+        method: ConvolveMethod = ConvolveMethod.AUTO,
+    ) -> "Bitmap":
+        """
+        Convolve every channel (R, G, B, A) with `kernel` and return a new
+        Bitmap, rounded and clamped to 0..255. See ConvolveEngine for the
+        exact padding / alignment / offset semantics; VALID modes return a
+        smaller bitmap.
+
+        Rank-1 kernels run as two 1-D passes and large kernels go through
+        FFT unless `method` forces a path.
+        """
+        values = ConvolveEngine.convolve(
+            self.pixels,
+            kernel,
+            padding=padding,
+            alignment=alignment,
+            offset_x=offset_x,
+            offset_y=offset_y,
+            pad_value=pad_value,
+            method=method,
+        )
+        np.rint(values, out=values)
+        np.clip(values, 0, 255, out=values)
+
+        result = Bitmap()
+        result._adopt_pixels(values.astype(np.uint8))
+        return result
+
+    # --------------------------------------------------
+    # Pooling
+    # --------------------------------------------------
+    def pool(
+        self,
+        mode: PoolingMode,
+        window_width: int,
+        window_height: int,
+        stride_x: Optional[int] = None,
+        stride_y: Optional[int] = None,
+        padding: ConvolvePaddingMode = ConvolvePaddingValid(),
+    ) -> "Bitmap":
+        """
+        Pool this bitmap into a new, smaller Bitmap. Stride defaults to
+        the window size. AVERAGE is rounded back to 0..255.
+        See PoolingEngine for padding and pixel-wise mode details.
+        """
+        values = PoolingEngine.pool(
+            self.pixels,
+            mode,
+            window_width,
+            window_height,
+            stride_x=stride_x,
+            stride_y=stride_y,
+            padding=padding,
+        )
+        return self._from_pooled(values)
+
+    def pyramid(
+        self,
+        mode: PoolingMode = PoolingMode.AVERAGE_PER_CHANNEL,
+        levels: int = 4,
+        factor: int = 2,
+    ) -> List["Bitmap"]:
+        """
+        Multi-resolution thumbnails: each level is the previous one pooled
+        by factor x factor. See PoolingEngine.pyramid.
+        """
+        return [
+            self._from_pooled(values)
+            for values in PoolingEngine.pyramid(self.pixels, mode, levels=levels, factor=factor)
+        ]
+
+    @classmethod
+    def _from_pooled(cls, values: np.ndarray) -> "Bitmap":
+        # Float pooling results are rounded back to uint8 pixels
+        if values.dtype != np.uint8:
+            values = np.clip(np.rint(values), 0, 255).astype(np.uint8)
+        result = Bitmap()
+        result._adopt_pixels(np.ascontiguousarray(values))
         return result
-    
\ No newline at end of file
@@ -0,0 +1,203 @@
+# image/bitmap_threshold.py
+
+from __future__ import annotations
+from typing import Optional, Union
+import numpy as np
+
+from image.bitmap import Bitmap
+
+class BitmapThreshold:
+    """
+    Grayscale -> threshold -> knockout stage behind the Zebra CV1 controls.
+
+    The grayscale intermediate is computed once per source (set_source)
+    and cached. Every combination of (threshold, knockout, bw) then maps a
+    gray level 0..255 to one output color, so apply() is a 256-entry
+    lookup table gathered over the cached gray image: one pass, no float
+    math per pixel. Scrubbing a slider only rebuilds the table.
+
+    Per gray level g:
+        ink        = g < threshold
+        bw off:    ink keeps g; background is pushed toward white by
+                   knockout percent: g + (255 - g) * knockout / 100
+        bw on:     ink -> 0; background -> 255, knockout has no effect
+                   on an already white background
+    Output is opaque RGBA (gray in R, G and B).
+    """
+
+    # Same weights and evaluation order as RGBA.to_gray
+    weight_r: float = 0.299
+    weight_g: float = 0.587
+    weight_b: float = 0.114
+
+    def __init__(self, source: Union[Bitmap, np.ndarray, None] = None) -> None:
+        self.gray: Optional[np.ndarray] = None
+        self._output: Optional[np.ndarray] = None
+        self._lut_key = None
+        self._lut: Optional[np.ndarray] = None
+        self._histogram: Optional[np.ndarray] = None
+        if source is not None:
+            self.set_source(source)
+
+    # ------------------------------
+    # Source
+    # ------------------------------
+    def set_source(self, source: Union[Bitmap, np.ndarray]) -> None:
+        """
+        Compute and cache the grayscale intermediate for a new image.
+        Accepts a Bitmap, an (H, W, 3|4) uint8 array or an (H, W) gray array.
+        """
+        pixels = source.pixels if isinstance(source, Bitmap) else np.asarray(source)
+        self.gray = self.grayscale(pixels)
+        self._histogram = None
+        if self._output is not None and self._output.shape[:2] != self.gray.shape:
+            self._output = None
+
+    @property
+    def width(self) -> int:
+        return 0 if self.gray is None else int(self.gray.shape[1])
+
+    @property
+    def height(self) -> int:
+        return 0 if self.gray is None else int(self.gray.shape[0])
+
+    # ------------------------------
+    # Apply
+    # ------------------------------
+    def apply(
+        self,
+        threshold: int = 128,
+        knockout: int = 0,
+        bw: bool = False,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Run threshold + knockout over the cached gray image.
+
+        Writes into `out` (a C-contiguous (H, W, 4) uint8 array) when given;
+        otherwise into an array owned by this stage and reused by the next
+        apply(), so copy it to keep a result.
+        """
+        if self.gray is None:
+            raise ValueError("BitmapThreshold.apply() called before set_source()")
+
+        if out is None:
+            if self._output is None:
+                self._output = np.empty(self.gray.shape + (4,), dtype=np.uint8)
+            out = self._output
+        elif (
+            out.shape != self.gray.shape + (4,)
+            or out.dtype != np.uint8
+            or not out.flags["C_CONTIGUOUS"]
+        ):
+            raise ValueError(
+                f"out must be a C-contiguous {self.gray.shape + (4,)} uint8 array, "
+                f"got {out.shape} {out.dtype}"
+            )
+
+        lut = self.lookup_table(threshold, knockout, bw)
+        packed = out.view(np.dtype("<u4")).reshape(self.gray.shape)
+        # Gray levels are always 0..255, so "clip" never clips; it just
+        # skips the bounds-check pass that the default mode makes.
+        np.take(lut, self.gray, out=packed, mode="clip")
+        return out
+
+    def apply_bitmap(self, threshold: int = 128, knockout: int = 0, bw: bool = False) -> Bitmap:
+        """
+        apply(), copied into a new Bitmap.
+        """
+        result = Bitmap()
+        result.import_opencv(self.apply(threshold, knockout, bw).copy(), swap_rb=False)
+        return result
+
+    # ------------------------------
+    # Calibration
+    # ------------------------------
+    def histogram(self) -> np.ndarray:
+        """
+        256-bin histogram of the cached gray image (int64), computed once
+        per source.
+        """
+        if self.gray is None:
+            raise ValueError("BitmapThreshold.histogram() called before set_source()")
+        if self._histogram is None:
+            self._histogram = np.bincount(self.gray.reshape(-1), minlength=256)
+        return self._histogram
+
+    @classmethod
+    def otsu_threshold(cls, histogram: np.ndarray, default: int = 128) -> int:
+        """
+        Otsu's method over a 256-bin histogram, as a threshold for apply()
+        (ink = g < threshold). Picks the split that maximizes the
+        between-class variance; returns `default` for a single-level image.
+        """
+        counts = np.asarray(histogram, dtype=np.float64)
+        total = counts.sum()
+        if total <= 0.0:
+            return int(default)
+
+        p = counts / total
+        levels = np.arange(counts.shape[0], dtype=np.float64)
+        omega = np.cumsum(p)
+        mu = np.cumsum(p * levels)
+        mu_total = mu[-1]
+
+        denominator = omega * (1.0 - omega)
+        valid = denominator > 1e-12
+        if not valid.any():
+            return int(default)
+        between = np.zeros_like(omega)
+        between[valid] = (mu_total * omega[valid] - mu[valid]) ** 2 / denominator[valid]
+
+        # Class 0 is g <= split, so ink (g < threshold) needs split + 1
+        split = int(np.argmax(between))
+        return max(0, min(255, split + 1))
+
+    # ------------------------------
+    # Building blocks
+    # ------------------------------
+    @classmethod
+    def grayscale(cls, pixels: np.ndarray) -> np.ndarray:
+        """
+        (H, W, 3|4) uint8 -> (H, W) uint8 gray, identical to RGBA.to_gray:
+        the same float64 sum, rounded half to even (np.rint, like round()).
+        An (H, W) array is taken as already gray.
+        """
+        pixels = np.asarray(pixels)
+        if pixels.ndim == 2:
+            return np.ascontiguousarray(pixels, dtype=np.uint8)
+        if pixels.ndim != 3 or pixels.shape[2] < 3:
+            raise ValueError(f"pixels must be (H, W), (H, W, 3) or (H, W, 4), got shape {pixels.shape}")
+
+        gray = cls.weight_r * pixels[..., 0]
+        gray += cls.weight_g * pixels[..., 1]
+        gray += cls.weight_b * pixels[..., 2]
+        np.rint(gray, out=gray)
+        return gray.astype(np.uint8)
+
+    @classmethod
+    def levels(cls, threshold: int, knockout: int, bw: bool) -> np.ndarray:
+        """
+        Output gray level for each input gray level, shape (256,) uint8.
+        """
+        threshold = max(0, min(255, int(threshold)))
+        knockout = max(0, min(100, int(knockout)))
+
+        g = np.arange(256, dtype=np.int32)
+        ink = g < threshold
+        if bw:
+            return np.where(ink, 0, 255).astype(np.uint8)
+        background = g + ((255 - g) * knockout) // 100
+        return np.where(ink, g, background).astype(np.uint8)
+
+    def lookup_table(self, threshold: int, knockout: int, bw: bool) -> np.ndarray:
+        """
+        Packed opaque RGBA per gray level, shape (256,) little-endian uint32.
+        Cached for the last (threshold, knockout, bw).
+        """
+        key = (int(threshold), int(knockout), bool(bw))
+        if key != self._lut_key:
+            level = self.levels(*key).astype(np.uint32)
+            self._lut = (level | (level << 8) | (level << 16) | np.uint32(0xFF000000)).astype("<u4")
+            self._lut_key = key
+        return self._lut
@@ -0,0 +1,232 @@
+# image/convolve_engine.py
+
+from __future__ import annotations
+from typing import Optional, Tuple
+import numpy as np
+
+from image.convolve_padding_mode import (
+    ConvolvePaddingMode,
+    ConvolvePaddingSame,
+    ConvolvePaddingValid,
+    ConvolvePaddingOffsetSame,
+    ConvolvePaddingOffsetValid,
+    convolve_padding_amounts,
+)
+from image.convolve_kernel_alignment import ConvolveKernelAlignment
+from image.convolve_method import ConvolveMethod
+
+class ConvolveEngine:
+    """
+    Vectorized 2-D convolution over (..., H, W, C) float arrays.
+
+    Convention (torch-style cross-correlation, kernel not flipped), with
+    the anchor tap (ax, ay) = ConvolveKernelAlignment.anchor(alignment, kw, kh)
+    placed on input pixel (px, py):
+        value(px, py) = sum over (ky, kx) of
+            kernel[ky, kx] * in[py + ky - ay + offset_y, px + kx - ax + offset_x]
+
+    Output:
+        SAME / OffsetSame:   H x W, out[y, x] = value(x, y)
+        VALID / OffsetValid: (H - kh + 1) x (W - kw + 1),
+                             out[y, x] = value(x + ax, y + ay)
+                             (only positions where the kernel fully fits)
+    Offsets are only allowed with the Offset* modes and must stay within
+    max_offset_x / max_offset_y. Padded pixels read as pad_value.
+
+    All channels (and any leading batch axes) are processed at once.
+    """
+
+    # Above this many taps (non-separable), AUTO switches to FFT.
+    fft_tap_threshold: int = 64
+
+    # Relative size of the 2nd singular value below which a kernel
+    # counts as separable.
+    separable_tolerance: float = 1e-6
+
+    @classmethod
+    def convolve(
+        cls,
+        array: np.ndarray,
+        kernel,
+        padding: ConvolvePaddingMode = ConvolvePaddingSame(),
+        alignment: ConvolveKernelAlignment = ConvolveKernelAlignment.CENTER,
+        offset_x: int = 0,
+        offset_y: int = 0,
+        pad_value: float = 0.0,
+        method: ConvolveMethod = ConvolveMethod.AUTO,
+    ) -> np.ndarray:
+        """
+        Convolve `array` (..., H, W, C) with a 2-D `kernel` (kh, kw).
+        Returns float32 (..., H_out, W_out, C).
+        """
+        array = np.asarray(array, dtype=np.float32)
+        if array.ndim < 3:
+            raise ValueError(f"array must be (..., H, W, C), got shape {array.shape}")
+        kernel = np.asarray(kernel, dtype=np.float64)
+        if kernel.ndim != 2 or kernel.size == 0:
+            raise ValueError(f"kernel must be a non-empty 2-D array, got shape {kernel.shape}")
+
+        kh, kw = kernel.shape
+        height, width = array.shape[-3], array.shape[-2]
+        ax, ay = ConvolveKernelAlignment.anchor(alignment, kw, kh)
+        cls._validate_offsets(padding, offset_x, offset_y)
+
+        left, right = convolve_padding_amounts(padding, width, kw, 1, axis="x", anchor=ax)
+        top, bottom = convolve_padding_amounts(padding, height, kh, 1, axis="y", anchor=ay)
+
+        # Output window inside the full "valid" correlation of the padded input
+        if isinstance(padding, (ConvolvePaddingSame, ConvolvePaddingOffsetSame)):
+            out_h, out_w = height, width
+            margin_x = left - ax
+            margin_y = top - ay
+        else:
+            out_h, out_w = height - kh + 1, width - kw + 1
+            margin_x = left
+            margin_y = top
+        if out_h <= 0 or out_w <= 0:
+            shape = array.shape[:-3] + (max(0, out_h), max(0, out_w), array.shape[-1])
+            return np.zeros(shape, dtype=np.float32)
+
+        padded = cls._pad(array, top, bottom, left, right, pad_value)
+
+        separable = None
+        if method in (ConvolveMethod.AUTO, ConvolveMethod.SEPARABLE):
+            separable = cls.separate(kernel)
+            if method == ConvolveMethod.SEPARABLE and separable is None:
+                raise ValueError("ConvolveMethod.SEPARABLE requires a rank-1 kernel")
+        if method == ConvolveMethod.AUTO:
+            if separable is not None:
+                method = ConvolveMethod.SEPARABLE
+            elif kh * kw > cls.fft_tap_threshold:
+                method = ConvolveMethod.FFT
+            else:
+                method = ConvolveMethod.DIRECT
+
+        if method == ConvolveMethod.SEPARABLE:
+            column, row = separable
+            full = cls._correlate_separable(padded, column, row)
+        elif method == ConvolveMethod.FFT:
+            full = cls._correlate_fft(padded, kernel)
+        else:
+            full = cls._correlate_direct(padded, kernel)
+
+        y0 = margin_y + int(offset_y)
+        x0 = margin_x + int(offset_x)
+        result = full[..., y0:y0 + out_h, x0:x0 + out_w, :]
+        return np.ascontiguousarray(result, dtype=np.float32)
+
+    # ------------------------------
+    # Kernel analysis
+    # ------------------------------
+    @classmethod
+    def separate(cls, kernel) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        If `kernel` is rank-1 (kernel == outer(column, row)), return
+        (column, row); otherwise None.
+        """
+        kernel = np.asarray(kernel, dtype=np.float64)
+        if kernel.ndim != 2 or kernel.size == 0:
+            return None
+        if kernel.shape[0] == 1:
+            return (np.ones(1), kernel[0].copy())
+        if kernel.shape[1] == 1:
+            return (kernel[:, 0].copy(), np.ones(1))
+        u, s, vt = np.linalg.svd(kernel)
+        if s[0] == 0.0:
+            return (np.zeros(kernel.shape[0]), np.zeros(kernel.shape[1]))
+        if s[1] > cls.separable_tolerance * s[0]:
+            return None
+        scale = np.sqrt(s[0])
+        return (u[:, 0] * scale, vt[0, :] * scale)
+
+    # ------------------------------
+    # Internals
+    # ------------------------------
+    @classmethod
+    def _validate_offsets(cls, padding: ConvolvePaddingMode, offset_x: int, offset_y: int) -> None:
+        offset_x = int(offset_x)
+        offset_y = int(offset_y)
+        if isinstance(padding, (ConvolvePaddingOffsetSame, ConvolvePaddingOffsetValid)):
+            if abs(offset_x) > padding.max_offset_x or abs(offset_y) > padding.max_offset_y:
+                raise ValueError(
+                    f"offset ({offset_x}, {offset_y}) exceeds max offset "
+                    f"({padding.max_offset_x}, {padding.max_offset_y})"
+                )
+        elif isinstance(padding, (ConvolvePaddingSame, ConvolvePaddingValid)):
+            if offset_x != 0 or offset_y != 0:
+                raise ValueError(
+                    f"offsets require ConvolvePaddingOffsetSame / OffsetValid, got {padding!r}"
+                )
+        else:
+            raise TypeError(f"Unsupported padding mode: {padding!r}")
+
+    @classmethod
+    def _pad(
+        cls,
+        array: np.ndarray,
+        top: int,
+        bottom: int,
+        left: int,
+        right: int,
+        pad_value: float,
+    ) -> np.ndarray:
+        if not (top or bottom or left or right):
+            return array
+        pad_width = [(0, 0)] * (array.ndim - 3) + [(top, bottom), (left, right), (0, 0)]
+        return np.pad(array, pad_width, mode="constant", constant_values=pad_value)
+
+    @classmethod
+    def _correlate_direct(cls, padded: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+        """
+        Full "valid" correlation, one multiply-add per tap over the whole array.
+        """
+        kh, kw = kernel.shape
+        out_h = padded.shape[-3] - kh + 1
+        out_w = padded.shape[-2] - kw + 1
+        out = np.zeros(padded.shape[:-3] + (out_h, out_w, padded.shape[-1]), dtype=np.float32)
+        for ky in range(kh):
+            for kx in range(kw):
+                weight = np.float32(kernel[ky, kx])
+                if weight != 0.0:
+                    out += weight * padded[..., ky:ky + out_h, kx:kx + out_w, :]
+        return out
+
+    @classmethod
+    def _correlate_separable(cls, padded: np.ndarray, column: np.ndarray, row: np.ndarray) -> np.ndarray:
+        """
+        Rank-1 kernel: horizontal pass with `row`, then vertical with `column`.
+        """
+        kw = row.shape[0]
+        kh = column.shape[0]
+        out_w = padded.shape[-2] - kw + 1
+        out_h = padded.shape[-3] - kh + 1
+
+        horizontal = np.zeros(padded.shape[:-2] + (out_w, padded.shape[-1]), dtype=np.float32)
+        for kx in range(kw):
+            weight = np.float32(row[kx])
+            if weight != 0.0:
+                horizontal += weight * padded[..., kx:kx + out_w, :]
+
+        out = np.zeros(padded.shape[:-3] + (out_h, out_w, padded.shape[-1]), dtype=np.float32)
+        for ky in range(kh):
+            weight = np.float32(column[ky])
+            if weight != 0.0:
+                out += weight * horizontal[..., ky:ky + out_h, :, :]
+        return out
+
+    @classmethod
+    def _correlate_fft(cls, padded: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+        """
+        Full "valid" correlation via real FFTs over the (H, W) axes.
+        """
+        kh, kw = kernel.shape
+        ph, pw = padded.shape[-3], padded.shape[-2]
+        fft_h = ph + kh - 1
+        fft_w = pw + kw - 1
+
+        # Correlation == convolution with the flipped kernel
+        flipped = kernel[::-1, ::-1][:, :, None]
+        spectrum = np.fft.rfft2(padded, s=(fft_h, fft_w), axes=(-3, -2))
+        spectrum *= np.fft.rfft2(flipped, s=(fft_h, fft_w), axes=(0, 1))
+        full = np.fft.irfft2(spectrum, s=(fft_h, fft_w), axes=(-3, -2))
+        return full[..., kh - 1:ph, kw - 1:pw, :].astype(np.float32)
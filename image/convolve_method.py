@@ -0,0 +1,10 @@
+# image/convolve_method.py
+from __future__ import annotations
+from enum import Enum, auto
+
+class ConvolveMethod(Enum):
+
+    AUTO = auto()        # separable if rank-1, FFT if large, else direct
+    DIRECT = auto()      # one vectorized multiply-add per kernel tap
+    SEPARABLE = auto()   # two 1-D passes (kernel must be rank-1)
+    FFT = auto()         # frequency domain, cost independent of kernel size
@@ -53,3 +53,52 @@ ConvolvePaddingMode = Union[
     ConvolvePaddingOffsetSame,
     ConvolvePaddingOffsetValid,
 ]
+
+
+# --------------------------------------------------
+# Resolving a mode into concrete padding amounts
+# --------------------------------------------------
+
+def convolve_padding_amounts(
+    padding: ConvolvePaddingMode,
+    length: int,
+    kernel: int,
+    stride: int = 1,
+    axis: str = "x",
+    anchor: int | None = None,
+) -> tuple[int, int]:
+    """
+    Return (pad_before, pad_after) along one axis.
+
+    SAME pads so a window lands on every stride step
+    (output count = ceil(length / stride)), split torch-style with the
+    extra pixel after, or, when `anchor` (the kernel tap index from
+    ConvolveKernelAlignment.anchor) is given, with `anchor` pixels before.
+    VALID pads nothing. The Offset* variants add max_offset_x /
+    max_offset_y on both sides on top of SAME / VALID.
+    """
+    length = int(length)
+    kernel = int(kernel)
+    stride = max(1, int(stride))
+
+    if isinstance(padding, (ConvolvePaddingSame, ConvolvePaddingOffsetSame)):
+        out_count = -(-length // stride)
+        total = max(0, (out_count - 1) * stride + kernel - length)
+        if anchor is None:
+            before = total // 2
+        else:
+            before = min(max(0, int(anchor)), total)
+        after = total - before
+    elif isinstance(padding, (ConvolvePaddingValid, ConvolvePaddingOffsetValid)):
+        before = 0
+        after = 0
+    else:
+        raise TypeError(f"Unsupported padding mode: {padding!r}")
+
+    if isinstance(padding, (ConvolvePaddingOffsetSame, ConvolvePaddingOffsetValid)):
+        margin = padding.max_offset_x if axis == "x" else padding.max_offset_y
+        margin = max(0, int(margin))
+        before += margin
+        after += margin
+
+    return (before, after)
@@ -0,0 +1,212 @@
+# image/image_carousel.py
+
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence, Set, Union
+
+import numpy as np
+
+from filesystem.file_io import FileIO
+from filesystem.file_utils import FileUtils
+
+PathLike = Union[str, Path]
+
+
+@dataclass(frozen=True)
+class ImageCarouselFrame:
+    """
+    One decoded image: read-only, C-contiguous (H, W, 4) uint8 RGBA,
+    ready for GraphicsTexture.write_numpy / load_numpy.
+    """
+    index: int
+    path: Path
+    pixels: np.ndarray
+
+    @property
+    def width(self) -> int:
+        return int(self.pixels.shape[1])
+
+    @property
+    def height(self) -> int:
+        return int(self.pixels.shape[0])
+
+
+class ImageCarousel:
+    """
+    Indexed previous/next navigation over a list of image files.
+
+    A background thread decodes the current image first, then its
+    neighbours out to prefetch_radius (nearest first), into a bounded LRU
+    of ImageCarouselFrames. next() / previous() / go_to() only move the
+    index and wake the thread; current() returns the decoded frame or
+    None while it is still loading, so callers never wait on decode.
+    Navigation wraps around at both ends.
+    """
+
+    extensions = (".png", ".jpg", ".jpeg", ".tif", ".tiff")
+
+    def __init__(
+        self,
+        paths: Sequence[PathLike],
+        cache_size: int = 8,
+        prefetch_radius: int = 2,
+    ) -> None:
+        self.paths: List[Path] = [Path(p) for p in paths]
+        self.prefetch_radius = max(0, int(prefetch_radius))
+        # The whole prefetch window must fit, or it would evict itself
+        self.cache_size = max(int(cache_size), 2 * self.prefetch_radius + 1)
+
+        self._index = 0
+        self._frames: "OrderedDict[int, ImageCarouselFrame]" = OrderedDict()
+        self._failed: Set[int] = set()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    @classmethod
+    def from_directory(cls, directory: PathLike, **kwargs) -> "ImageCarousel":
+        files = [p for p in FileIO.get_all_files(directory) if p.suffix.lower() in cls.extensions]
+        return cls(sorted(files), **kwargs)
+
+    @classmethod
+    def from_local_directory(cls, subdirectory: PathLike, **kwargs) -> "ImageCarousel":
+        return cls.from_directory(FileIO.local_directory(subdirectory), **kwargs)
+
+    # ------------------------------
+    # Lifecycle
+    # ------------------------------
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="ImageCarousel", daemon=True)
+        self._thread.start()
+
+    def dispose(self) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        thread.join(timeout=1.0)
+        self._thread = None
+
+    # ------------------------------
+    # Navigation (never blocks on decode)
+    # ------------------------------
+    @property
+    def count(self) -> int:
+        return len(self.paths)
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    def go_to(self, index: int) -> None:
+        if not self.paths:
+            return
+        with self._condition:
+            self._index = int(index) % len(self.paths)
+            self._touch_window()
+            self._condition.notify()
+
+    def next(self) -> None:
+        self.go_to(self._index + 1)
+
+    def previous(self) -> None:
+        self.go_to(self._index - 1)
+
+    def current(self) -> Optional[ImageCarouselFrame]:
+        return self.get(self._index)
+
+    def get(self, index: int, wait: bool = False) -> Optional[ImageCarouselFrame]:
+        """
+        Decoded frame for `index`, or None if it isn't ready (or failed).
+        wait=True decodes on the calling thread if needed; meant for
+        startup and tools, not the render loop.
+        """
+        if not self.paths:
+            return None
+        index = int(index) % len(self.paths)
+        with self._condition:
+            frame = self._frames.get(index)
+            if frame is not None:
+                self._frames.move_to_end(index)
+                return frame
+            if not wait or index in self._failed:
+                return None
+        frame = self._decode(index)
+        if frame is not None:
+            with self._condition:
+                self._store(frame)
+        return frame
+
+    # ------------------------------
+    # Worker
+    # ------------------------------
+    def _wanted(self) -> List[int]:
+        """
+        Current index, then neighbours by distance (next before previous).
+        """
+        count = len(self.paths)
+        result = [self._index]
+        for distance in range(1, self.prefetch_radius + 1):
+            for index in ((self._index + distance) % count, (self._index - distance) % count):
+                if index not in result:
+                    result.append(index)
+        return result
+
+    def _touch_window(self) -> None:
+        # Keep the prefetch window most-recently-used, current index last
+        for index in reversed(self._wanted()):
+            if index in self._frames:
+                self._frames.move_to_end(index)
+
+    def _next_missing(self) -> Optional[int]:
+        if not self.paths:
+            return None
+        for index in self._wanted():
+            if index not in self._frames and index not in self._failed:
+                return index
+        return None
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                index = self._next_missing()
+                while self._running and index is None:
+                    self._condition.wait()
+                    index = self._next_missing()
+                if not self._running:
+                    return
+
+            frame = self._decode(index)
+
+            with self._condition:
+                if frame is None:
+                    self._failed.add(index)
+                else:
+                    self._store(frame)
+
+    def _store(self, frame: ImageCarouselFrame) -> None:
+        self._frames[frame.index] = frame
+        self._frames.move_to_end(frame.index)
+        while len(self._frames) > self.cache_size:
+            self._frames.popitem(last=False)
+
+    def _decode(self, index: int) -> Optional[ImageCarouselFrame]:
+        path = self.paths[index]
+        try:
+            image = FileUtils.load_pillow_image(path)
+            if image.mode != "RGBA":
+                image = image.convert("RGBA")
+            pixels = np.array(image, dtype=np.uint8)
+        except Exception as e:
+            print(f"⚠️ ImageCarousel: failed to decode {path} | {e}")
+            return None
+        pixels.flags.writeable = False
+        return ImageCarouselFrame(index=index, path=path, pixels=pixels)
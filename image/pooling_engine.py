@@ -0,0 +1,185 @@
+# image/pooling_engine.py
+
+from __future__ import annotations
+from typing import List, Optional
+import numpy as np
+
+from image.pooling_mode import PoolingMode
+from image.convolve_padding_mode import (
+    ConvolvePaddingMode,
+    ConvolvePaddingValid,
+    convolve_padding_amounts,
+)
+
+class PoolingEngine:
+    """
+    Vectorized pooling over (H, W, C) images or (N, H, W, C) stacks.
+
+    Every window is one as_strided view of the padded input, so the
+    per-channel modes are plain reductions over the window axes and the
+    pixel-wise modes are one argmax/argmin plus one gather.
+
+    Padding follows ConvolvePaddingMode (see convolve_padding_amounts).
+    Padded pixels never win a MAX/MIN and are not counted by AVERAGE;
+    a window made only of padding produces 0.
+
+    MAX/MIN keep the input dtype; AVERAGE returns float32.
+    """
+
+    @classmethod
+    def pool(
+        cls,
+        array: np.ndarray,
+        mode: PoolingMode,
+        window_width: int,
+        window_height: int,
+        stride_x: Optional[int] = None,
+        stride_y: Optional[int] = None,
+        padding: ConvolvePaddingMode = ConvolvePaddingValid(),
+    ) -> np.ndarray:
+        array = np.asarray(array)
+        if array.ndim == 3:
+            return cls.pool(
+                array[None], mode, window_width, window_height,
+                stride_x, stride_y, padding,
+            )[0]
+        if array.ndim != 4:
+            raise ValueError(f"array must be (H, W, C) or (N, H, W, C), got shape {array.shape}")
+
+        ww = int(window_width)
+        wh = int(window_height)
+        if ww <= 0 or wh <= 0:
+            raise ValueError(f"window must be > 0 (got {ww} x {wh})")
+        sx = ww if stride_x is None else int(stride_x)
+        sy = wh if stride_y is None else int(stride_y)
+        if sx <= 0 or sy <= 0:
+            raise ValueError(f"stride must be > 0 (got {sx}, {sy})")
+
+        count, height, width, channels = array.shape
+        left, right = convolve_padding_amounts(padding, width, ww, sx, axis="x")
+        top, bottom = convolve_padding_amounts(padding, height, wh, sy, axis="y")
+        padded_h = height + top + bottom
+        padded_w = width + left + right
+        out_h = (padded_h - wh) // sy + 1 if padded_h >= wh else 0
+        out_w = (padded_w - ww) // sx + 1 if padded_w >= ww else 0
+        if out_h <= 0 or out_w <= 0:
+            dtype = np.float32 if mode == PoolingMode.AVERAGE_PER_CHANNEL else array.dtype
+            return np.zeros((count, max(0, out_h), max(0, out_w), channels), dtype=dtype)
+
+        is_padded = bool(top or bottom or left or right)
+        pad_width = ((0, 0), (top, bottom), (left, right), (0, 0))
+
+        # Valid-pixel mask, pooled the same way, tells us which windows
+        # contain real pixels and how many.
+        valid_count = None
+        if is_padded:
+            mask = np.zeros((1, padded_h, padded_w, 1), dtype=np.float32)
+            mask[:, top:top + height, left:left + width, :] = 1.0
+            valid_count = cls._windows(mask, wh, ww, sy, sx, out_h, out_w).sum(axis=(3, 4))
+
+        if mode in (PoolingMode.MAX_PER_CHANNEL, PoolingMode.MIN_PER_CHANNEL):
+            is_max = mode == PoolingMode.MAX_PER_CHANNEL
+            source = array
+            if is_padded:
+                fill = cls._extreme(array.dtype, lowest=is_max)
+                source = np.pad(array, pad_width, mode="constant", constant_values=fill)
+            windows = cls._windows(source, wh, ww, sy, sx, out_h, out_w)
+            result = windows.max(axis=(3, 4)) if is_max else windows.min(axis=(3, 4))
+            if valid_count is not None:
+                result[np.broadcast_to(valid_count == 0, result.shape)] = 0
+            return result
+
+        if mode == PoolingMode.AVERAGE_PER_CHANNEL:
+            source = array.astype(np.float32)
+            if is_padded:
+                source = np.pad(source, pad_width, mode="constant", constant_values=0.0)
+            windows = cls._windows(source, wh, ww, sy, sx, out_h, out_w)
+            total = windows.sum(axis=(3, 4))
+            if valid_count is None:
+                return total / np.float32(ww * wh)
+            return np.divide(total, valid_count, out=np.zeros_like(total), where=valid_count > 0)
+
+        if mode in (PoolingMode.MAX_PIXEL_BY_RGB_SUM, PoolingMode.MIN_PIXEL_BY_RGB_SUM):
+            is_max = mode == PoolingMode.MAX_PIXEL_BY_RGB_SUM
+            source = array
+            if is_padded:
+                source = np.pad(array, pad_width, mode="constant", constant_values=0)
+
+            # Score = r + g + b (alpha ignored); padding can never win
+            score = source[..., :3].astype(np.float64).sum(axis=-1, keepdims=True)
+            if is_padded:
+                mask = np.zeros(score.shape, dtype=bool)
+                mask[:, top:top + height, left:left + width, :] = True
+                score[~mask] = -np.inf if is_max else np.inf
+
+            score_windows = cls._windows(score, wh, ww, sy, sx, out_h, out_w)
+            score_windows = score_windows.reshape(count, out_h, out_w, wh * ww)
+            if is_max:
+                winner = score_windows.argmax(axis=-1)
+            else:
+                winner = score_windows.argmin(axis=-1)
+
+            rows = np.arange(out_h)[None, :, None] * sy + winner // ww
+            cols = np.arange(out_w)[None, None, :] * sx + winner % ww
+            batch = np.arange(count)[:, None, None]
+            result = source[batch, rows, cols]
+            if valid_count is not None:
+                result[np.broadcast_to(valid_count == 0, result.shape)] = 0
+            return result
+
+        raise ValueError(f"Unsupported pooling mode: {mode!r}")
+
+    @classmethod
+    def pyramid(
+        cls,
+        array: np.ndarray,
+        mode: PoolingMode = PoolingMode.AVERAGE_PER_CHANNEL,
+        levels: int = 4,
+        factor: int = 2,
+    ) -> List[np.ndarray]:
+        """
+        Successive factor x factor pools (multi-resolution thumbnails).
+        Level 0 is the first pooled level, not the input. Stops early
+        once an image would shrink below one pixel.
+        """
+        factor = max(2, int(factor))
+        result: List[np.ndarray] = []
+        current = np.asarray(array)
+        for _ in range(int(levels)):
+            if current.shape[-3] < factor or current.shape[-2] < factor:
+                break
+            current = cls.pool(current, mode, factor, factor)
+            result.append(current)
+        return result
+
+    # ------------------------------
+    # Internals
+    # ------------------------------
+    @classmethod
+    def _windows(
+        cls,
+        source: np.ndarray,
+        wh: int,
+        ww: int,
+        sy: int,
+        sx: int,
+        out_h: int,
+        out_w: int,
+    ) -> np.ndarray:
+        """
+        (N, H, W, C) -> read-only (N, out_h, out_w, wh, ww, C) window view.
+        """
+        s0, s1, s2, s3 = source.strides
+        return np.lib.stride_tricks.as_strided(
+            source,
+            shape=(source.shape[0], out_h, out_w, wh, ww, source.shape[3]),
+            strides=(s0, s1 * sy, s2 * sx, s1, s2, s3),
+            writeable=False,
+        )
+
+    @classmethod
+    def _extreme(cls, dtype: np.dtype, lowest: bool):
+        if np.issubdtype(dtype, np.integer):
+            info = np.iinfo(dtype)
+            return info.min if lowest else info.max
+        return -np.inf if lowest else np.inf
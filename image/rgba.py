@@ -103,7 +103,7 @@ class RGBA:
         )
     
     def to_gray(self) -> int:
-        gray = 0.299 * self._r + 0.587 * self._g + 0.114 * self._g
+        gray = 0.299 * self._r + 0.587 * self._g + 0.114 * self._b
         return self._clamp_int(round(gray))
     
     def tuple(self):
@@ -0,0 +1,173 @@
+# image/rgba_packed.py
+
+from __future__ import annotations
+
+class RGBAPacked:
+    """
+    RGBA color packed into one 32-bit int:
+        value = r | (g << 8) | (b << 16) | (a << 24)
+    Same bytes, in the same order, as one pixel of Bitmap.pixels viewed
+    as a little-endian uint32.
+
+    Drop-in for RGBA (ri/gi/bi/ai, rf/gf/bf/af, tuple, to_gray), but
+    reads are a shift and a mask, and constructing from ints that are
+    already 0..255 skips clamping entirely (see from_value / from_tuple).
+    BitmapPixel.to_packed() / to_gray() read pixels through it, and
+    rgba[x][y] = ... and Bitmap.flood() take it without per-channel reads.
+    """
+
+    __slots__ = ("_value",)
+
+    def __init__(self, r: int, g: int, b: int, a: int = 255):
+        self._value = (
+            self._clamp_int(r)
+            | (self._clamp_int(g) << 8)
+            | (self._clamp_int(b) << 16)
+            | (self._clamp_int(a) << 24)
+        )
+
+    # ------------------------------
+    # Construction
+    # ------------------------------
+    @classmethod
+    def from_value(cls, value: int) -> "RGBAPacked":
+        """
+        Wrap an already packed 32-bit value (no clamping).
+        """
+        color = cls.__new__(cls)
+        color._value = int(value) & 0xFFFFFFFF
+        return color
+
+    @classmethod
+    def from_tuple(cls, rgba) -> "RGBAPacked":
+        """
+        Pack (r, g, b, a) ints that are already 0..255 (no clamping).
+        """
+        r, g, b, a = rgba
+        return cls.from_value(int(r) | (int(g) << 8) | (int(b) << 16) | (int(a) << 24))
+
+    @classmethod
+    def from_rgba(cls, color) -> "RGBAPacked":
+        """
+        Pack any RGBA-like object (RGBA, BitmapPixel, RGBAPacked).
+        """
+        if isinstance(color, RGBAPacked):
+            return cls.from_value(color._value)
+        return cls.from_tuple(color.tuple())
+
+    # ------------------------------
+    # Helpers
+    # ------------------------------
+    @staticmethod
+    def _clamp_int(v):
+        return max(0, min(255, int(v)))
+
+    @staticmethod
+    def _clamp_float(v):
+        return max(0.0, min(1.0, float(v)))
+
+    def _set(self, shift: int, v: int) -> None:
+        self._value = (self._value & ~(0xFF << shift) & 0xFFFFFFFF) | (v << shift)
+
+    # ------------------------------
+    # Packed accessor
+    # ------------------------------
+    @property
+    def value(self) -> int:
+        return self._value
+
+    # ------------------------------
+    # Integer accessors (0–255)
+    # ------------------------------
+    @property
+    def ri(self):
+        return self._value & 0xFF
+
+    @ri.setter
+    def ri(self, v):
+        self._set(0, self._clamp_int(v))
+
+    @property
+    def gi(self):
+        return (self._value >> 8) & 0xFF
+
+    @gi.setter
+    def gi(self, v):
+        self._set(8, self._clamp_int(v))
+
+    @property
+    def bi(self):
+        return (self._value >> 16) & 0xFF
+
+    @bi.setter
+    def bi(self, v):
+        self._set(16, self._clamp_int(v))
+
+    @property
+    def ai(self):
+        return (self._value >> 24) & 0xFF
+
+    @ai.setter
+    def ai(self, v):
+        self._set(24, self._clamp_int(v))
+
+    # ------------------------------
+    # Float accessors (0.0–1.0)
+    # ------------------------------
+    @property
+    def rf(self):
+        return (self._value & 0xFF) / 255.0
+
+    @rf.setter
+    def rf(self, v):
+        self._set(0, int(self._clamp_float(v) * 255))
+
+    @property
+    def gf(self):
+        return ((self._value >> 8) & 0xFF) / 255.0
+
+    @gf.setter
+    def gf(self, v):
+        self._set(8, int(self._clamp_float(v) * 255))
+
+    @property
+    def bf(self):
+        return ((self._value >> 16) & 0xFF) / 255.0
+
+    @bf.setter
+    def bf(self, v):
+        self._set(16, int(self._clamp_float(v) * 255))
+
+    @property
+    def af(self):
+        return ((self._value >> 24) & 0xFF) / 255.0
+
+    @af.setter
+    def af(self, v):
+        self._set(24, int(self._clamp_float(v) * 255))
+
+    # ------------------------------
+    # Utility
+    # ------------------------------
+    def to_gray(self) -> int:
+        value = self._value
+        gray = 0.299 * (value & 0xFF) + 0.587 * ((value >> 8) & 0xFF) + 0.114 * ((value >> 16) & 0xFF)
+        return self._clamp_int(round(gray))
+
+    def tuple(self):
+        value = self._value
+        return (value & 0xFF, (value >> 8) & 0xFF, (value >> 16) & 0xFF, (value >> 24) & 0xFF)
+
+    def __eq__(self, other):
+        if isinstance(other, RGBAPacked):
+            return self._value == other._value
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._value)
+
+    def __str__(self):
+        return f"({self.rf:0.2f}, {self.gf:0.2f}, {self.bf:0.2f}, {self.af:0.2f})"
+
+    def __repr__(self):
+        return self.__str__()
@@ -0,0 +1,9 @@
+# image/stamp_mode.py
+from __future__ import annotations
+from enum import Enum, auto
+
+class StampMode(Enum):
+
+    REPLACE = auto()    # overwrite destination pixels (Bitmap.stamp)
+    ALPHA = auto()      # classic alpha blend (Bitmap.stamp_alpha)
+    ADDITIVE = auto()   # additive blend (Bitmap.stamp_additive)
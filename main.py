@@ -114,6 +114,9 @@ def scroll_callback(window, xoffset, yoffset):
     
 def main():
 
+    # Register assets only; nothing is decoded until it is first used
+    assets = HeartAssetBundle()
+
     if not glfw.init():
         print("Failed to initialize GLFW")
         sys.exit(1)
@@ -148,7 +151,6 @@ def main():
     # pong_scene = PongScene(graphics=graphics, pipeline=pipeline, assets=assets)
     # app_shell = GraphicsAppShell(scene=pong_scene)
 
-    assets = HeartAssetBundle()
     heart_scene = HeartScene(graphics, pipeline, assets)
     app_shell = GraphicsAppShell(heart_scene)
 
@@ -186,13 +188,16 @@ def main():
     zebra_menu.move(int(x), int(y))
 
     # optional: hook signals
-    zebra_menu.zebra.threshold_changed.connect(lambda v: print("threshold", v))
-    zebra_menu.zebra.knockout_changed.connect(lambda v: print("knockout", v))
-    zebra_menu.zebra.bw_changed.connect(lambda b: print("bw", b))
-    zebra_menu.zebra.next_image_clicked.connect(lambda: print("next image"))
-    zebra_menu.zebra.previous_image_clicked.connect(lambda: print("previous image"))
-    zebra_menu.zebra.calibrate_clicked.connect(lambda: print("calibrate"))
-    zebra_menu.zebra.reset_clicked.connect(lambda: print("reset"))
+    # Zebra controls only record values; HeartScene.update() hands the
+    # latest to the worker once per frame, so the loop below never blocks.
+    zebra_menu.zebra.threshold_changed.connect(heart_scene.zebra.set_threshold)
+    zebra_menu.zebra.knockout_changed.connect(heart_scene.zebra.set_knockout)
+    zebra_menu.zebra.bw_changed.connect(heart_scene.zebra.set_bw)
+    zebra_menu.zebra.next_image_clicked.connect(heart_scene.next_image)
+    zebra_menu.zebra.previous_image_clicked.connect(heart_scene.previous_image)
+    zebra_menu.zebra.calibrate_clicked.connect(heart_scene.zebra.calibrate)
+    heart_scene.zebra.on_calibrated = zebra_menu.zebra.threshold_slider.setValue
+    zebra_menu.zebra.reset_clicked.connect(heart_scene.zebra.reset)
 
 
 
@@ -4,9 +4,7 @@ from typing import Optional
 from pong.pong_asset_bundle import PongAssetBundle
 from graphics.graphics_library import GraphicsLibrary
 from graphics.graphics_sprite import GraphicsSprite
-from graphics.graphics_pipeline import GraphicsPipeline
-from graphics.graphics_matrix import GraphicsMatrix
-from graphics.graphics_sprite_2d_instance import GraphicsSprite2DInstance
+from graphics.graphics_sprite_batch import GraphicsSpriteBatch
 from graphics.graphics_color import GraphicsColor
 
 class PongBall:
@@ -20,7 +18,7 @@ class PongBall:
         self.y = y
         self.x_speed = 0
         self.y_speed = 0
-        self.instance = GraphicsSprite2DInstance()
+        self.sprite: Optional[GraphicsSprite] = None
         self.width = float(PongAssetBundle.ball_width)
         self.height = float(PongAssetBundle.ball_height)
         self.is_red = False
@@ -29,7 +27,7 @@ class PongBall:
     # Lifecycle: load
     # ------------------------------------------------------------------
     def load(self, assets: Optional[PongAssetBundle], graphics: Optional[GraphicsLibrary]) -> None:
-        self.instance.load(graphics=graphics, sprite=assets.ball_sprite)
+        self.sprite = assets.ball_sprite
 
     # ------------------------------------------------------------------
     # Update
@@ -40,32 +38,20 @@ class PongBall:
     # ------------------------------------------------------------------
     # Draw
     # ------------------------------------------------------------------
-    def draw(self,
-             graphics: Optional[GraphicsLibrary],
-             pipeline: Optional[GraphicsPipeline],
-             projection_matrix: Optional[GraphicsMatrix]) -> None:
-        
-        if graphics is None:
+    def draw(self, batch: Optional[GraphicsSpriteBatch]) -> None:
+        if batch is None:
             return
-        if pipeline is None:
-            return
-        if projection_matrix is None:
-            return
-
-        model_view_matrix = GraphicsMatrix()
-        model_view_matrix.translation(x=self.x, y=self.y, z=0.0)
-        self.instance.projection_matrix = projection_matrix
-        self.instance.model_view_matrix = model_view_matrix
 
         if self.is_red:
-            self.instance.color = GraphicsColor(1.0, 0.25, 0.25, 1.0)
+            color = GraphicsColor(1.0, 0.25, 0.25, 1.0)
         else:
-            self.instance.color = GraphicsColor(1.0, 1.0, 1.0, 1.0)
+            color = GraphicsColor(1.0, 1.0, 1.0, 1.0)
 
-        self.instance.render(shader_program=pipeline.program_sprite_2d)
+        batch.draw(self.sprite, self.x, self.y, color=color)
 
     # ------------------------------------------------------------------
     # Dispose
     # ------------------------------------------------------------------
     def dispose(self) -> None:
-        self.instance.dispose()
\ No newline at end of file
+        # The sprite belongs to the asset bundle
+        self.sprite = None
\ No newline at end of file
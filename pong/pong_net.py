@@ -1,19 +1,19 @@
 # pong_net.py
 
 from __future__ import annotations
-from typing import List
+import numpy as np
 
 from graphics.graphics_library import GraphicsLibrary
 from graphics.graphics_pipeline import GraphicsPipeline
 from graphics.graphics_matrix import GraphicsMatrix
 from graphics.graphics_color import GraphicsColor
-from graphics.graphics_shape_2d_instance import GraphicsShape2DInstance
-from graphics.shader_program import ShaderProgram
+from graphics.graphics_shape_2d_instanced import GraphicsShape2DInstanced
 
 class PongNet:
     def __init__(self) -> None:
-        # All active net segments (vertical rectangles)
-        self.net_instances: List[GraphicsShape2DInstance] = []
+        # All net segments (vertical rectangles), one instanced draw
+        self.segments = GraphicsShape2DInstanced()
+        self.color = GraphicsColor(0.34, 0.34, 0.36, 1.0)
 
         # Net layout constants
         self.chunk_width: float = 18.0
@@ -24,7 +24,9 @@ class PongNet:
     # Rebuild
     # ------------------------------------------------------------------
     def rebuild(self, graphics: GraphicsLibrary) -> None:
-        self.dispose()
+        if self.segments.graphics is not graphics:
+            self.segments.dispose()
+            self.segments.load(graphics)
 
         width = float(graphics.frame_buffer_width)
         height = float(graphics.frame_buffer_height)
@@ -50,19 +52,13 @@ class PongNet:
         left = (width / 2.0) - (self.chunk_width / 2.0)
         top = (height / 2.0) - (total_height / 2.0)
         
-        y = top
-        for _ in range(segment_count):
-            instance = GraphicsShape2DInstance()
-            instance.load(graphics)
-            instance.color = GraphicsColor(0.34, 0.34, 0.36, 1.0)
-            instance.set_position_frame(
-                x=left,
-                y=y,
-                width=self.chunk_width,
-                height=self.chunk_height,
-            )
-            self.net_instances.append(instance)
-            y += self.chunk_height + self.chunk_spacing
+        # Only the instance array is rewritten on resize
+        rects = np.empty((segment_count, 4), dtype=np.float32)
+        rects[:, 0] = left
+        rects[:, 1] = top + np.arange(segment_count) * (self.chunk_height + self.chunk_spacing)
+        rects[:, 2] = self.chunk_width
+        rects[:, 3] = self.chunk_height
+        self.segments.set_rects(rects, self.color)
 
     # ------------------------------------------------------------------
     # Draw
@@ -73,20 +69,14 @@ class PongNet:
         pipeline: GraphicsPipeline,
         projection_matrix: GraphicsMatrix,
     ) -> None:
-        for instance in self.net_instances:
-            instance.projection_matrix = projection_matrix.copy()
-            instance.render(pipeline.program_shape_2d)
+        self.segments.render(pipeline.program_shape_2d_instanced, projection_matrix)
 
     # ------------------------------------------------------------------
     # Dispose
     # ------------------------------------------------------------------
     def dispose(self) -> None:
         """
-        Dispose all GPU buffers for net segments
-        and clear the segment list.
+        Dispose the GPU buffers for the net segments.
         Safe to call multiple times.
         """
-        for seg in self.net_instances:
-            seg.dispose()
-
-        self.net_instances.clear()
\ No newline at end of file
+        self.segments.dispose()
\ No newline at end of file
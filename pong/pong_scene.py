@@ -10,6 +10,7 @@ from graphics.graphics_pipeline import GraphicsPipeline
 from graphics.graphics_matrix import GraphicsMatrix
 from graphics.graphics_color import GraphicsColor
 from graphics.graphics_shape_2d_instance import GraphicsShape2DInstance
+from graphics.graphics_sprite_batch import GraphicsSpriteBatch
 from pong.pong_paddle import PongPaddle
 from pong.pong_ball import PongBall
 from pong.pong_state import PongState
@@ -53,6 +54,9 @@ class PongScene(GraphicsScene):
         self.net = PongNet()
         self.number_left = PongNumber()
         self.number_right = PongNumber()
+
+        # Digits, paddles and ball share one batch: a draw per texture/color run
+        self.sprite_batch = GraphicsSpriteBatch(capacity=64)
         
         self.reset_numbers()
     
@@ -66,6 +70,7 @@ class PongScene(GraphicsScene):
         self.left_paddle.load(self.assets, self.graphics)
         self.right_paddle.load(self.assets, self.graphics)
         self.ball.load(self.assets, self.graphics)
+        self.sprite_batch.load(self.graphics)
 
     def load_complete(self) -> None:
         self.resize()
@@ -103,11 +108,14 @@ class PongScene(GraphicsScene):
         self.graphics.blend_set_disabled()
         self.net.draw(graphics=self.graphics, pipeline=self.pipeline, projection_matrix=projection_matrix)
         self.graphics.blend_set_alpha()
-        self.number_left.draw(graphics=self.graphics, pipeline=self.pipeline, projection_matrix=projection_matrix)
-        self.number_right.draw(graphics=self.graphics, pipeline=self.pipeline, projection_matrix=projection_matrix)
-        self.left_paddle.draw(graphics=self.graphics, pipeline=self.pipeline, projection_matrix=projection_matrix)
-        self.right_paddle.draw(graphics=self.graphics, pipeline=self.pipeline, projection_matrix=projection_matrix)
-        self.ball.draw(graphics=self.graphics, pipeline=self.pipeline, projection_matrix=projection_matrix)
+        batch = self.sprite_batch
+        batch.begin(sprite_program, projection_matrix)
+        self.number_left.draw(batch)
+        self.number_right.draw(batch)
+        self.left_paddle.draw(batch)
+        self.right_paddle.draw(batch)
+        self.ball.draw(batch)
+        batch.end()
 
     # --------------------------------------------------------------
     # Input
@@ -171,6 +179,7 @@ class PongScene(GraphicsScene):
         self.left_paddle.dispose()
         self.right_paddle.dispose()
         self.ball.dispose()
+        self.sprite_batch.dispose()
 
     def select_speed(self) -> float:
         width = float(self.graphics.frame_buffer_width)